@@ -7,6 +7,8 @@ import os
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from control.init_database import init_database
+from control.utils.encrypt_password import load_hasher_settings
+from control.utils.local_storage import LocalStorage
 from view.pages.login_page import LoginPage
 
 class BibleAcademyApp:
@@ -14,6 +16,8 @@ class BibleAcademyApp:
     def __init__(self):
         # Inicializar la base de datos primero
         init_database()
+        # Costo de Argon2 calibrado para este equipo (se mide solo la primera vez)
+        load_hasher_settings(LocalStorage())
         
         self.root = ctk.CTk()
         self.root.title("Academia Bíblica")
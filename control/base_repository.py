@@ -1,5 +1,22 @@
+import re
+import sqlite3
+from contextlib import contextmanager
 from .bd.db_connection import Connection
+from .query_filter import compile_select
+from .change_events import change_bus
 class BaseRepository:
+    # Secondary indexes declared by each repository, as tuples of column names.
+    INDEXES = []
+    # Bound parameters per IN (...) query; below SQLite's historical 999 limit.
+    MAX_IN_PARAMS = 900
+    # Text columns indexed for full-text search (FTS5), empty for no index.
+    SEARCH_COLUMNS = ()
+    # Set by declared_columns() to capture the schema instead of creating it.
+    _capture = None
+    # Foreign key graphs by database file, as (schema_version, {parent: [(child, on_delete)]}).
+    # A graph is rebuilt as soon as the file's schema_version moves on.
+    _reference_graphs = {}
+
     def __init__(self, table: str, conn=None):
         self.conn = conn
         self.cursor = conn.cursor() if conn else None
@@ -14,12 +31,15 @@ class BaseRepository:
             Returns:
                 None
         """
+        if self._capture is not None:
+            self._capture.append(columns)
+            return
         try:
             if self.conn:
                 self.cursor.execute(f"CREATE TABLE IF NOT EXISTS {self.table} ({columns})")
                 self.conn.commit()
             else:
-                with Connection.connect() as conn:
+                with Connection.acquire() as conn:
                     cursor = conn.cursor()
                     cursor.execute(f"CREATE TABLE IF NOT EXISTS {self.table} ({columns})")
                     conn.commit()
@@ -27,6 +47,359 @@ class BaseRepository:
         except Exception as e:
             print(f"Error to create table {self.table}: {e}")
 
+    @contextmanager
+    def transaction(self, immediate: bool = False):
+        """
+            Run several statements as one unit of work.
+
+            Yields a cursor; commits once when the block ends and rolls back
+            everything if it raises. Change events are delivered after the commit.
+
+            Args:
+                immediate (bool): Take the write lock up front (BEGIN IMMEDIATE).
+            Usage:
+                with repo.transaction() as cursor:
+                    cursor.execute(...)
+        """
+        with change_bus.deferred():
+            if self.conn:
+                cursor = self.conn.cursor()
+                try:
+                    if immediate and not self.conn.in_transaction:
+                        cursor.execute("BEGIN IMMEDIATE")
+                    yield cursor
+                    self.conn.commit()
+                except Exception:
+                    self.conn.rollback()
+                    raise
+            else:
+                with Connection.acquire() as conn:
+                    cursor = conn.cursor()
+                    try:
+                        if immediate and not conn.in_transaction:
+                            cursor.execute("BEGIN IMMEDIATE")
+                        yield cursor
+                        conn.commit()
+                    except Exception:
+                        conn.rollback()
+                        raise
+
+    def index_name(self, columns: tuple) -> str:
+        """
+            Name of the index managed for the given columns.
+        """
+        return f"idx_{self.table}_{'_'.join(columns)}"
+
+    def create_indexes(self):
+        """
+            Create the declared indexes and drop managed ones no longer declared.
+
+            Idempotent: safe to run on every start against an existing database.
+
+            Returns:
+                None
+        """
+        try:
+            declared = {self.index_name(cols): cols for cols in self.INDEXES}
+            statements = [
+                f"CREATE INDEX IF NOT EXISTS {name} ON {self.table} ({', '.join(cols)})"
+                for name, cols in declared.items()
+            ]
+            if self.conn:
+                self._sync_indexes(self.cursor, declared, statements)
+                self.conn.commit()
+            else:
+                with Connection.acquire() as conn:
+                    self._sync_indexes(conn.cursor(), declared, statements)
+                    conn.commit()
+            print(f"Indexes for {self.table} ready")
+        except Exception as e:
+            print(f"Error to create indexes {self.table}: {e}")
+
+    def _sync_indexes(self, cursor, declared: dict, statements: list):
+        cursor.execute(
+            # GLOB: "_" is literal, unlike in LIKE, so other indexes are never matched
+            "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = ? AND name GLOB ?",
+            (self.table, f"idx_{self.table}_*")
+        )
+        for (name,) in cursor.fetchall():
+            if name not in declared:
+                cursor.execute(f"DROP INDEX IF EXISTS {name}")
+        for statement in statements:
+            cursor.execute(statement)
+
+    @property
+    def search_table(self) -> str:
+        """
+            Name of the FTS5 table that indexes SEARCH_COLUMNS.
+        """
+        return f"{self.table}_fts"
+
+    def create_search_index(self):
+        """
+            Create the FTS5 index over SEARCH_COLUMNS and the triggers that keep
+            it in sync with the table. Matching ignores case and accents.
+
+            Idempotent: the index is rebuilt only when it is new or its
+            columns changed. Run after migrate_foreign_keys(), which drops the
+            triggers together with the old table.
+
+            Returns:
+                None
+        """
+        if not self.SEARCH_COLUMNS:
+            return
+        try:
+            if self.conn:
+                self._sync_search_index(self.cursor)
+                self.conn.commit()
+            else:
+                with Connection.acquire() as conn:
+                    self._sync_search_index(conn.cursor())
+                    conn.commit()
+            print(f"Search index for {self.table} ready")
+        except Exception as e:
+            print(f"Error to create search index {self.table}: {e}")
+
+    def _sync_search_index(self, cursor):
+        fts = self.search_table
+        columns = ", ".join(self.SEARCH_COLUMNS)
+        new_values = ", ".join(f"new.{column}" for column in self.SEARCH_COLUMNS)
+        old_values = ", ".join(f"old.{column}" for column in self.SEARCH_COLUMNS)
+        create_sql = (
+            f"CREATE VIRTUAL TABLE {fts} USING fts5({columns}, content='{self.table}', "
+            f"content_rowid='id', tokenize='unicode61 remove_diacritics 2')"
+        )
+        cursor.execute("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = ?", (fts,))
+        existing = cursor.fetchone()
+        rebuild = existing is None or existing[0] != create_sql
+        if rebuild:
+            cursor.execute(f"DROP TABLE IF EXISTS {fts}")
+            cursor.execute(create_sql)
+
+        # External content: the index stores no copy of the text, so deletes
+        # must pass the old values for FTS5 to remove their tokens.
+        triggers = {
+            f"{fts}_ai": f"AFTER INSERT ON {self.table} BEGIN "
+                         f"INSERT INTO {fts}(rowid, {columns}) VALUES (new.id, {new_values}); END",
+            f"{fts}_ad": f"AFTER DELETE ON {self.table} BEGIN "
+                         f"INSERT INTO {fts}({fts}, rowid, {columns}) VALUES ('delete', old.id, {old_values}); END",
+            f"{fts}_au": f"AFTER UPDATE ON {self.table} BEGIN "
+                         f"INSERT INTO {fts}({fts}, rowid, {columns}) VALUES ('delete', old.id, {old_values}); "
+                         f"INSERT INTO {fts}(rowid, {columns}) VALUES (new.id, {new_values}); END",
+        }
+        for name, body in triggers.items():
+            cursor.execute(f"DROP TRIGGER IF EXISTS {name}")
+            cursor.execute(f"CREATE TRIGGER {name} {body}")
+        if rebuild:
+            cursor.execute(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')")
+
+    def match_query(self, text: str) -> str:
+        """
+            FTS5 MATCH expression for the words of a text.
+
+            Returns:
+                str: Quoted prefix terms, or None without SEARCH_COLUMNS or words.
+        """
+        words = re.findall(r"\w+", text or "")
+        if not self.SEARCH_COLUMNS or not words:
+            return None
+        # Quoted prefix terms: user input never reaches the FTS5 query syntax
+        return " ".join(f'"{word}"*' for word in words)
+
+    def search(self, text: str, limit: int = 50) -> list[int]:
+        """
+            Full-text search over SEARCH_COLUMNS, best matches first.
+
+            Every word of the text must match the start of a word in any
+            indexed column, ignoring case and accents ("jose ram" finds
+            "José Ramírez").
+
+            Args:
+                text (str): Words typed by the user.
+                limit (int): Maximum number of ids returned, None for all.
+            Returns:
+                list[int]: Matching ids ranked by BM25, empty list on error.
+        """
+        query = self.match_query(text)
+        if not query:
+            return []
+        rows = self.query_rows(
+            f"SELECT rowid AS id FROM {self.search_table} WHERE {self.search_table} MATCH ? ORDER BY rank LIMIT ?",
+            (query, -1 if limit is None else limit)
+        )
+        return [row["id"] for row in rows]
+
+    def migrate_foreign_keys(self) -> bool:
+        """
+            Rebuild the table when the foreign keys declared in create_table
+            (e.g. ON DELETE CASCADE) differ from the ones stored in the database.
+
+            Rows are copied by column name into a freshly created table, which
+            then replaces the old one in a single transaction. Indexes must be
+            recreated afterwards with create_indexes().
+
+            Returns:
+                bool: True if the table was rebuilt, False otherwise.
+        """
+        try:
+            if self.conn:
+                return self._rebuild_foreign_keys(self.conn)
+            with Connection.acquire() as conn:
+                return self._rebuild_foreign_keys(conn)
+        except Exception as e:
+            print(f"Error to migrate foreign keys {self.table}: {e}")
+            return False
+
+    @staticmethod
+    def _foreign_keys(conn, table: str) -> list:
+        rows = conn.execute(f"PRAGMA foreign_key_list('{table}')").fetchall()
+        return sorted((row[2], row[3], row[4], row[5], row[6]) for row in rows)
+
+    def declared_columns(self) -> str:
+        """
+            Column definitions passed by create_table(), without running it.
+
+            Returns:
+                str: The columns SQL, or None if create_table() declares none.
+        """
+        self._capture = []
+        try:
+            self.create_table()
+            captured = self._capture
+        finally:
+            self._capture = None
+        return captured[0] if captured else None
+
+    def _rebuild_foreign_keys(self, conn) -> bool:
+        table = self.table
+        staging = f"{table}_migration"
+        columns_sql = self.declared_columns()
+        if not columns_sql:
+            return False
+
+        # Compare against the declared schema in a scratch database
+        scratch = sqlite3.connect(":memory:")
+        try:
+            scratch.execute(f"CREATE TABLE {table} ({columns_sql})")
+            declared = self._foreign_keys(scratch, table)
+        finally:
+            scratch.close()
+        if declared == self._foreign_keys(conn, table):
+            return False
+
+        conn.commit()
+        conn.execute(f"DROP TABLE IF EXISTS {staging}")
+        conn.execute(f"CREATE TABLE {staging} ({columns_sql})")
+        conn.commit()
+
+        enforced = conn.execute("PRAGMA foreign_keys").fetchone()[0]
+        conn.execute("PRAGMA foreign_keys = OFF")
+        try:
+            old_columns = {row[1] for row in conn.execute(f"PRAGMA table_info('{table}')")}
+            columns = ", ".join(
+                row[1] for row in conn.execute(f"PRAGMA table_info('{staging}')") if row[1] in old_columns
+            )
+            sequence = conn.execute("SELECT seq FROM sqlite_sequence WHERE name = ?", (table,)).fetchone()
+
+            conn.execute("BEGIN")
+            conn.execute(f"INSERT INTO {staging} ({columns}) SELECT {columns} FROM {table}")
+            conn.execute(f"DROP TABLE {table}")
+            conn.execute(f"ALTER TABLE {staging} RENAME TO {table}")
+            if sequence:
+                # Keep AUTOINCREMENT from reusing ids of rows deleted before the migration
+                conn.execute("UPDATE sqlite_sequence SET seq = MAX(seq, ?) WHERE name = ?", (sequence[0], table))
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            conn.execute(f"DROP TABLE IF EXISTS {staging}")
+            raise
+        finally:
+            conn.execute(f"PRAGMA foreign_keys = {'ON' if enforced else 'OFF'}")
+
+        orphans = conn.execute(f"PRAGMA foreign_key_check('{table}')").fetchall()
+        if orphans:
+            print(f"Warning: {len(orphans)} rows in {table} reference missing parents")
+        print(f"Table {table} migrated to declared foreign keys")
+        return True
+
+    def cascades_natively(self, cursor) -> bool:
+        """
+            Whether SQLite itself cascades a DELETE on this table: foreign key
+            enforcement is on and every table depending on it, directly or
+            transitively, declares ON DELETE CASCADE or SET NULL.
+
+            Args:
+                cursor: Cursor of the connection that will run the DELETE.
+            Returns:
+                bool: True if a single DELETE removes all dependent rows.
+        """
+        cursor.execute("PRAGMA foreign_keys")
+        if not cursor.fetchone()[0]:
+            return False
+        return all(on_delete in ("CASCADE", "SET NULL") for _, on_delete in self._dependents(cursor))
+
+    def _dependents(self, cursor) -> list:
+        """
+            Tables referencing this one, directly or transitively, as
+            (table, on_delete) pairs. Only CASCADE edges are followed further:
+            rows kept by any other action leave their own dependents alone.
+        """
+        references = self._reference_graph(cursor)
+        dependents, pending, seen = [], [self.table], set()
+        while pending:
+            parent = pending.pop()
+            if parent in seen:
+                continue
+            seen.add(parent)
+            for child, on_delete in references.get(parent, []):
+                dependents.append((child, on_delete))
+                if on_delete == "CASCADE":
+                    pending.append(child)
+        return dependents
+
+    @staticmethod
+    def _reference_graph(cursor) -> dict:
+        """
+            Foreign keys of every table as {parent: [(child, on_delete)]}.
+
+            Cached per database file and validated with PRAGMA schema_version,
+            which SQLite bumps on every schema change. In-memory databases have
+            no file to key on and are read every time.
+        """
+        cursor.execute("PRAGMA schema_version")
+        version = cursor.fetchone()[0]
+        cursor.execute("PRAGMA database_list")
+        path = next((row[2] for row in cursor.fetchall() if row[1] == "main"), "")
+        cached = BaseRepository._reference_graphs.get(path) if path else None
+        if cached and cached[0] == version:
+            return cached[1]
+
+        references = {}
+        cursor.execute("SELECT name FROM sqlite_master WHERE type = 'table'")
+        for (child,) in cursor.fetchall():
+            cursor.execute(f"PRAGMA foreign_key_list('{child}')")
+            for row in cursor.fetchall():
+                references.setdefault(row[2], []).append((child, row[6]))
+        if path:
+            BaseRepository._reference_graphs[path] = (version, references)
+        return references
+
+    def notify_cascade_delete(self, cursor, ids):
+        """
+            Publish the change events of a cascading delete: the given ids of
+            this table and an unknown set of rows in every dependent table,
+            deleted by CASCADE or updated by SET NULL. Call inside the
+            transaction that ran the delete.
+        """
+        change_bus.publish(self.table, "delete", ids)
+        actions = {}
+        for child, on_delete in self._dependents(cursor):
+            if on_delete == "CASCADE" or child not in actions:
+                actions[child] = "delete" if on_delete == "CASCADE" else "update"
+        for child, action in actions.items():
+            change_bus.publish(child, action)
+
     def insert_rows(self, data: list[dict]):
         """
             Insert multiple rows into the table.
@@ -44,10 +417,11 @@ class BaseRepository:
                 self.cursor.executemany(f"INSERT INTO {self.table} ({columns}) VALUES ({placeholders})", values_data)
                 self.conn.commit()
             else:
-                with Connection.connect() as conn:
+                with Connection.acquire() as conn:
                     cursor = conn.cursor()
                     cursor.executemany(f"INSERT INTO {self.table} ({columns}) VALUES ({placeholders})", values_data)
                     conn.commit()
+            change_bus.publish(self.table, "insert")
             print(f"Insert values into {self.table} success")
         except Exception as e:
             print(f"Error insert values {self.table}: {e}")
@@ -59,23 +433,138 @@ class BaseRepository:
             Args:
                 data (dict): Dictionary with column-value pairs.
             Returns:
-                None
+                int or None: Id of the new row, None on error.
         """
         try:
-            columns = ", ".join(data.keys())
-            placeholders = ", ".join(["?" for _ in data.keys()])
-            values = tuple(data.values())
-            if self.conn:
-                self.cursor.execute(f"INSERT INTO {self.table} ({columns}) VALUES ({placeholders})", values)
-                self.conn.commit()
-            else:
-                with Connection.connect() as conn:
-                    cursor = conn.cursor()
-                    cursor.execute(f"INSERT INTO {self.table} ({columns}) VALUES ({placeholders})", values)
-                    conn.commit()
+            with change_bus.deferred():
+                if self.conn:
+                    row_id = self.insert_into(self.cursor, data)
+                    self.conn.commit()
+                else:
+                    with Connection.acquire() as conn:
+                        row_id = self.insert_into(conn.cursor(), data)
+                        conn.commit()
             print(f"Insert row into {self.table} success")
+            return row_id
         except Exception as e:
             print(f"Error to insert into table {self.table}: {e}")
+            return None
+
+    def insert_into(self, cursor, data: dict) -> int:
+        """
+            Insert a single row using the given cursor, without committing.
+
+            Meant for use inside transaction() so several inserts share one commit.
+
+            Args:
+                cursor: Cursor of the open transaction.
+                data (dict): Dictionary with column-value pairs.
+            Returns:
+                int: Id of the new row (cursor.lastrowid).
+        """
+        columns = ", ".join(data.keys())
+        placeholders = ", ".join(["?" for _ in data.keys()])
+        cursor.execute(f"INSERT INTO {self.table} ({columns}) VALUES ({placeholders})", tuple(data.values()))
+        change_bus.publish(self.table, "insert", [cursor.lastrowid])
+        return cursor.lastrowid
+
+    def insert_many_into(self, cursor, data: list[dict]) -> list[int]:
+        """
+            Insert several rows with one executemany, without committing.
+
+            The transaction must hold the write lock (transaction(immediate=True)):
+            nothing else can insert in between, so the rows get consecutive ids
+            ending at last_insert_rowid(), whatever the AUTOINCREMENT sequence.
+            Rows that carry their own id are inserted one by one instead.
+
+            Args:
+                cursor: Cursor of the open transaction.
+                data (list[dict]): Rows with the same column-value keys.
+            Returns:
+                list[int]: Ids of the new rows, in input order.
+        """
+        if not data:
+            return []
+        columns = list(data[0].keys())
+        placeholders = ", ".join(["?" for _ in columns])
+        sql = f"INSERT INTO {self.table} ({', '.join(columns)}) VALUES ({placeholders})"
+        values = [tuple(row[col] for col in columns) for row in data]
+        if "id" in columns:
+            ids = []
+            for row in values:
+                cursor.execute(sql, row)
+                ids.append(cursor.lastrowid)
+        else:
+            cursor.executemany(sql, values)
+            cursor.execute("SELECT last_insert_rowid()")
+            last_id = cursor.fetchone()[0]
+            ids = list(range(last_id - len(data) + 1, last_id + 1))
+            cursor.execute(f"SELECT COUNT(*) FROM {self.table} WHERE id BETWEEN ? AND ?", (ids[0], last_id))
+            found = cursor.fetchone()[0]
+            if found != len(data):
+                raise RuntimeError(f"Expected {len(data)} new rows in {self.table}, found {found}")
+        change_bus.publish(self.table, "insert", ids)
+        return ids
+
+    def query_rows(self, sql: str, params=()) -> list[dict]:
+        """
+            Run a read-only query and return its rows as dictionaries.
+
+            Args:
+                sql (str): SELECT statement with ? placeholders.
+                params (tuple | list, optional): Bound parameters.
+            Returns:
+                list[dict]: Matching rows, empty list on error.
+        """
+        try:
+            if self.conn and self.cursor:
+                self.cursor.execute(sql, params)
+                rows = self.cursor.fetchall()
+                columns = [description[0] for description in self.cursor.description]
+            else:
+                with Connection.acquire() as conn:
+                    cursor = conn.cursor()
+                    cursor.execute(sql, params)
+                    rows = cursor.fetchall()
+                    columns = [description[0] for description in cursor.description]
+            return [dict(zip(columns, row)) for row in rows]
+        except Exception as e:
+            print(f"Error to query {self.table}: {e}")
+            return []
+
+    def get_rows_by_ids(self, ids, columns: str = "*") -> dict:
+        """
+            Get several rows by primary key with one IN query per chunk of ids.
+
+            Args:
+                ids (iterable): Row identifiers.
+                columns (str, optional): Columns to select; must include id.
+            Returns:
+                dict: Rows as dictionaries keyed by id; missing ids are absent.
+        """
+        try:
+            ids = list(dict.fromkeys(ids))
+            rows = {}
+            for start in range(0, len(ids), self.MAX_IN_PARAMS):
+                chunk = ids[start:start + self.MAX_IN_PARAMS]
+                sql = f"SELECT {columns} FROM {self.table} WHERE id IN ({', '.join(['?' for _ in chunk])})"
+                if self.conn and self.cursor:
+                    self.cursor.execute(sql, chunk)
+                    result = self.cursor.fetchall()
+                    names = [description[0] for description in self.cursor.description]
+                else:
+                    with Connection.acquire() as conn:
+                        cursor = conn.cursor()
+                        cursor.execute(sql, chunk)
+                        result = cursor.fetchall()
+                        names = [description[0] for description in cursor.description]
+                for row in result:
+                    row = dict(zip(names, row))
+                    rows[row["id"]] = row
+            return rows
+        except Exception as e:
+            print(f"Error to get rows by ids {self.table}: {e}")
+            return {}
 
     def update_row(self, new_data: dict, conditions: dict):
         """
@@ -95,13 +584,16 @@ class BaseRepository:
             if self.conn:
                 self.cursor.execute(f"UPDATE {self.table} SET {set_clause} WHERE {where_clause}", values)
                 self.conn.commit()
-                return self.cursor.rowcount
+                rowcount = self.cursor.rowcount
             else:
-                with Connection.connect() as conn:
+                with Connection.acquire() as conn:
                     cursor = conn.cursor()
                     cursor.execute(f"UPDATE {self.table} SET {set_clause} WHERE {where_clause}", values)
                     conn.commit()
-                    return cursor.rowcount
+                    rowcount = cursor.rowcount
+            if rowcount > 0:
+                change_bus.publish(self.table, "update", self._changed_ids(conditions))
+            return rowcount
         except Exception as e:
             print(f"Error to update {self.table}: {e}")
             return 0
@@ -119,20 +611,34 @@ class BaseRepository:
             where_clause = " AND ".join([f"{col} = ?" for col in conditions.keys()])
             values = tuple(conditions.values())
             
-            if self.conn:
-                self.cursor.execute(f"DELETE FROM {self.table} WHERE {where_clause}", values)
-                self.conn.commit()
-                return self.cursor.rowcount
-            else:
-                with Connection.connect() as conn:
-                    cursor = conn.cursor()
-                    cursor.execute(f"DELETE FROM {self.table} WHERE {where_clause}", values)
-                    conn.commit()
-                    return cursor.rowcount
+            with change_bus.deferred():
+                if self.conn:
+                    rowcount = self._delete_where(self.cursor, where_clause, values, conditions)
+                    self.conn.commit()
+                else:
+                    with Connection.acquire() as conn:
+                        rowcount = self._delete_where(conn.cursor(), where_clause, values, conditions)
+                        conn.commit()
+            return rowcount
         except Exception as e:
             print(f"Error to delete row {self.table}: {e}")
             return 0
 
+    def _delete_where(self, cursor, where_clause: str, values: tuple, conditions: dict) -> int:
+        cursor.execute(f"DELETE FROM {self.table} WHERE {where_clause}", values)
+        rowcount = cursor.rowcount
+        if rowcount > 0:
+            # Dependent rows may have gone with it through ON DELETE CASCADE
+            self.notify_cascade_delete(cursor, self._changed_ids(conditions))
+        return rowcount
+
+    @staticmethod
+    def _changed_ids(conditions: dict):
+        """
+            Ids touched by a write filtered by conditions; None unless it filters by id.
+        """
+        return [conditions["id"]] if "id" in conditions else None
+
     def get_row_value(self, values):
         """
             Get a row by id or other criteria.
@@ -154,7 +660,7 @@ class BaseRepository:
                 row = self.cursor.fetchone()
                 columns = [description[0] for description in self.cursor.description]
             else:
-                with Connection.connect() as conn:
+                with Connection.acquire() as conn:
                     cursor = conn.cursor()
                     cursor.execute(f"SELECT * FROM {self.table} WHERE {where_clause}", params)
                     row = cursor.fetchone()
@@ -182,10 +688,11 @@ class BaseRepository:
                 self.cursor.execute(f"DELETE FROM {self.table}")
                 self.conn.commit()
             else:
-                with Connection.connect() as conn:
+                with Connection.acquire() as conn:
                     cursor = conn.cursor()
                     cursor.execute(f"DELETE FROM {self.table}")
                     conn.commit()
+            change_bus.publish(self.table, "delete")
             print(f"All rows deleted from {self.table}")
         except Exception as e:
             print(f"Error to delete all rows {self.table}: {e}")
@@ -204,7 +711,7 @@ class BaseRepository:
                 self.cursor.execute(f"SELECT * FROM {self.table} WHERE id = ?", (id,))
                 return self.cursor.fetchone()
             else:
-                with Connection.connect() as conn:
+                with Connection.acquire() as conn:
                     cursor = conn.cursor()
                     cursor.execute(f"SELECT * FROM {self.table} WHERE id = ?", (id,))
                     return cursor.fetchone()
@@ -212,30 +719,42 @@ class BaseRepository:
             print(f"Error to get row {self.table}: {e}")
             return None
 
-    def get_all_rows(self, searchs: dict = None):
+    def get_row_by_id(self, id: int):
+        """
+            Get a row by primary key as a dictionary.
+
+            Args:
+                id (int): Row identifier, e.g. the iid of a Treeview row.
+            Returns:
+                dict or None: Row data if found, else None.
+        """
+        return self.get_rows_by_ids([id]).get(id)
+
+    def get_all_rows(self, searchs: dict = None, where: dict = None, order_by=None,
+                     limit: int = None, offset: int = None):
         """
-            Get all rows with optional search filters (case-insensitive LIKE).
+            Get all rows with optional filters, ordering and paging.
 
             Args:
-                searchs (dict, optional): Dictionary with column-value filters.
+                searchs (dict, optional): Substring search; matches rows where any
+                    column contains its value (case-insensitive LIKE, OR-ed).
+                where (dict, optional): Structured filter (equality, IN, ranges,
+                    prefix, $or/$and groups); see control/query_filter.py.
+                order_by (str | list[str], optional): Columns, "-col" for descending.
+                limit (int, optional): Maximum number of rows.
+                offset (int, optional): Rows to skip.
             Returns:
-                list[dict] or None: Matching rows as dictionaries, else None.
+                list[dict]: Matching rows as dictionaries, empty list on error.
         """
         try:
-            if searchs:
-                where = " OR ".join([f"{col} LIKE ? COLLATE NOCASE" for col in searchs.keys()])
-                values = [f"%{val}%" for val in searchs.values()]
-                sql = f"SELECT * FROM {self.table} WHERE {where}"
-            else:
-                sql = f"SELECT * FROM {self.table}"
-                values = []
+            sql, values = compile_select(self.table, self._filters(searchs, where), order_by, limit, offset)
 
             if self.conn and self.cursor:
                 self.cursor.execute(sql, values)
                 rows = self.cursor.fetchall()
                 columns = [description[0] for description in self.cursor.description]
             else:
-                with Connection.connect() as conn:
+                with Connection.acquire() as conn:
                     cursor = conn.cursor()
                     cursor.execute(sql, values)
                     rows = cursor.fetchall()
@@ -251,3 +770,70 @@ class BaseRepository:
         except Exception as e:
             print(f"Error to get all {self.table}: {e}")
             return []
+
+    @staticmethod
+    def _filters(searchs: dict = None, where: dict = None) -> dict:
+        filters = dict(where or {})
+        if searchs:
+            filters["$or"] = [{col: {"contains": val}} for col, val in searchs.items()]
+        return filters
+
+    def count(self, where: dict = None, searchs: dict = None) -> int:
+        """
+            Count rows with SELECT COUNT(*), using the same filters as get_all_rows.
+
+            Args:
+                where (dict, optional): Structured filter.
+                searchs (dict, optional): Substring search (OR-ed LIKE).
+            Returns:
+                int: Number of matching rows, 0 on error.
+        """
+        try:
+            sql, values = compile_select(self.table, self._filters(searchs, where), columns="COUNT(*)")
+            if self.conn and self.cursor:
+                self.cursor.execute(sql, values)
+                return self.cursor.fetchone()[0]
+            with Connection.acquire() as conn:
+                return conn.execute(sql, values).fetchone()[0]
+        except Exception as e:
+            print(f"Error to count {self.table}: {e}")
+            return 0
+
+    def get_page(self, page: int = 1, per_page: int = 10, where: dict = None, searchs: dict = None,
+                 order_by="id") -> dict:
+        """
+            Get one page of rows plus the total count, without loading the rest.
+
+            Args:
+                page (int): 1-based page number; clamped to the valid range.
+                per_page (int): Rows per page.
+                where (dict, optional): Structured filter.
+                searchs (dict, optional): Substring search (OR-ed LIKE).
+                order_by (str | list[str], optional): Ordering, "id" by default.
+            Returns:
+                dict: rows, total, page, pages and per_page.
+        """
+        total = self.count(where, searchs)
+        pages = max(1, (total + per_page - 1) // per_page)
+        page = min(max(1, page), pages)
+        rows = self.get_all_rows(searchs, where, order_by, limit=per_page, offset=(page - 1) * per_page)
+        return {"rows": rows, "total": total, "page": page, "pages": pages, "per_page": per_page}
+
+    def get_page_by_ids(self, ids: list, page: int = 1, per_page: int = 10) -> dict:
+        """
+            Get one page of an already filtered id list, keeping its order.
+
+            Args:
+                ids (list[int]): Matching ids, e.g. from an in-memory filter.
+                page (int): 1-based page number; clamped to the valid range.
+                per_page (int): Rows per page.
+            Returns:
+                dict: rows, total, page, pages and per_page, like get_page.
+        """
+        total = len(ids)
+        pages = max(1, (total + per_page - 1) // per_page)
+        page = min(max(1, page), pages)
+        page_ids = ids[(page - 1) * per_page:page * per_page]
+        found = self.get_rows_by_ids(page_ids)
+        rows = [found[row_id] for row_id in page_ids if row_id in found]
+        return {"rows": rows, "total": total, "page": page, "pages": pages, "per_page": per_page}
@@ -1,9 +1,181 @@
 import sqlite3
 import os
+import threading
+from contextlib import contextmanager
+from queue import Queue, Empty
+
+
+# PRAGMA presets applied to every new connection. "durable" keeps full fsync on
+# each commit; "fast" relaxes it to WAL checkpoints and gives SQLite more memory.
+PRAGMA_PROFILES = {
+    "durable": {
+        "journal_mode": "WAL",
+        "synchronous": "FULL",
+        "cache_size": -8000,
+        "temp_store": "MEMORY",
+        "foreign_keys": "ON",
+    },
+    "fast": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "cache_size": -32000,
+        "mmap_size": 134217728,
+        "temp_store": "MEMORY",
+        "foreign_keys": "ON",
+    },
+}
+
+
+def apply_pragmas(conn, pragmas: dict):
+    """
+        Apply a PRAGMA profile to an open connection.
+
+        Args:
+            conn (sqlite3.Connection): Connection to configure.
+            pragmas (dict): PRAGMA name-value pairs, applied in order.
+        Returns:
+            sqlite3.Connection: The same connection.
+    """
+    for name, value in (pragmas or {}).items():
+        conn.execute(f"PRAGMA {name} = {value}")
+    return conn
+
+
+class ConnectionPool:
+    """
+        Pool of long-lived sqlite3 connections to one database file.
+
+        Each thread checks out its own handle; nested checkouts inside the same
+        thread reuse it, and the handle goes back to the idle queue when the
+        outermost checkout ends. At most `size` handles are open at once.
+    """
+
+    def __init__(self, database: str, size: int = 5, cached_statements: int = 128, timeout: float = 5.0,
+                 pragmas: dict = None):
+        self.database = database
+        self.size = size
+        self.cached_statements = cached_statements
+        self.timeout = timeout
+        self.pragmas = pragmas or {}
+        self._idle = Queue()
+        self._lock = threading.Lock()
+        self._opened = 0
+        self._closed = False
+        self._local = threading.local()
+
+    def _open(self):
+        """
+            Open a new handle. Handles may move between threads across
+            checkouts, never while checked out, so the same-thread check is off.
+        """
+        conn = sqlite3.connect(
+            self.database,
+            timeout=self.timeout,
+            cached_statements=self.cached_statements,
+            check_same_thread=False
+        )
+        return apply_pragmas(conn, self.pragmas)
+
+    @staticmethod
+    def _is_healthy(conn) -> bool:
+        """
+            Health check run on every checkout of an idle handle.
+        """
+        try:
+            conn.execute("SELECT 1").fetchone()
+            return True
+        except sqlite3.Error:
+            return False
+
+    def _discard(self, conn):
+        try:
+            conn.close()
+        except sqlite3.Error:
+            pass
+        with self._lock:
+            self._opened -= 1
+
+    def _checkout(self):
+        while True:
+            try:
+                conn = self._idle.get_nowait()
+            except Empty:
+                with self._lock:
+                    can_open = self._opened < self.size
+                    if can_open:
+                        self._opened += 1
+                if can_open:
+                    try:
+                        return self._open()
+                    except Exception:
+                        with self._lock:
+                            self._opened -= 1
+                        raise
+                conn = self._idle.get(timeout=self.timeout)
+            if self._is_healthy(conn):
+                return conn
+            self._discard(conn)
+
+    def _checkin(self, conn):
+        if self._closed:
+            self._discard(conn)
+            return
+        try:
+            if conn.in_transaction:
+                conn.rollback()
+            self._idle.put(conn)
+        except sqlite3.Error:
+            self._discard(conn)
+
+    @contextmanager
+    def connection(self):
+        """
+            Check out the calling thread's handle.
+
+            Commits on normal exit and rolls back on error, like `with sqlite3.connect()`.
+        """
+        depth = getattr(self._local, "depth", 0)
+        if depth == 0:
+            self._local.conn = self._checkout()
+        conn = self._local.conn
+        self._local.depth = depth + 1
+        try:
+            yield conn
+            if depth == 0 and conn.in_transaction:
+                conn.commit()
+        except Exception:
+            if depth == 0 and conn.in_transaction:
+                conn.rollback()
+            raise
+        finally:
+            self._local.depth = depth
+            if depth == 0:
+                self._local.conn = None
+                self._checkin(conn)
+
+    def close_all(self):
+        """
+            Close every idle handle. Handles currently checked out are closed when returned.
+        """
+        self._closed = True
+        while True:
+            try:
+                conn = self._idle.get_nowait()
+            except Empty:
+                break
+            self._discard(conn)
+
 
 class Connection:
 
     DB_NAME = os.path.join(os.path.dirname(__file__), "academy.db")
+    POOL_SIZE = 5
+    CACHED_STATEMENTS = 128
+    PRAGMA_PROFILE = "fast"
+    PRAGMA_OVERRIDES = {}
+
+    _pool = None
+    _pool_lock = threading.Lock()
 
     @staticmethod
     def connect():
@@ -11,11 +183,74 @@ class Connection:
             Open to connection to academy db
         """
         try:
-            return sqlite3.connect(Connection.DB_NAME)
+            return apply_pragmas(sqlite3.connect(Connection.DB_NAME), Connection.pragmas())
         except Exception as e:
             print(f"Error to connect db: {e}")
             return None
-    
+
+    @staticmethod
+    def pragmas() -> dict:
+        """
+            Return the PRAGMA set for the active profile plus overrides
+        """
+        pragmas = dict(PRAGMA_PROFILES[Connection.PRAGMA_PROFILE])
+        pragmas.update(Connection.PRAGMA_OVERRIDES)
+        return pragmas
+
+    @staticmethod
+    def configure_pragmas(profile: str = None, **overrides):
+        """
+            Switch the PRAGMA profile ("durable" or "fast") and replace the PRAGMA overrides.
+            The current pool is closed so new handles pick up the settings.
+        """
+        if profile is not None and profile not in PRAGMA_PROFILES:
+            raise ValueError(f"Unknown PRAGMA profile: {profile}")
+        with Connection._pool_lock:
+            if profile is not None:
+                Connection.PRAGMA_PROFILE = profile
+            Connection.PRAGMA_OVERRIDES = dict(overrides)
+            if Connection._pool is not None:
+                Connection._pool.close_all()
+                Connection._pool = None
+
+    @staticmethod
+    def pool() -> ConnectionPool:
+        """
+            Return the shared pool, creating it on first use
+        """
+        with Connection._pool_lock:
+            if Connection._pool is None or Connection._pool.database != Connection.DB_NAME:
+                if Connection._pool is not None:
+                    Connection._pool.close_all()
+                Connection._pool = ConnectionPool(
+                    Connection.DB_NAME,
+                    size=Connection.POOL_SIZE,
+                    cached_statements=Connection.CACHED_STATEMENTS,
+                    pragmas=Connection.pragmas()
+                )
+            return Connection._pool
+
+    @staticmethod
+    def configure_pool(size: int = None, cached_statements: int = None):
+        """
+            Change pool sizing. The current pool is closed and rebuilt on next use.
+        """
+        with Connection._pool_lock:
+            if size is not None:
+                Connection.POOL_SIZE = size
+            if cached_statements is not None:
+                Connection.CACHED_STATEMENTS = cached_statements
+            if Connection._pool is not None:
+                Connection._pool.close_all()
+                Connection._pool = None
+
+    @staticmethod
+    def acquire():
+        """
+            Check out a pooled connection: `with Connection.acquire() as conn:`
+        """
+        return Connection.pool().connection()
+
     @staticmethod
     def cursor():
         """
@@ -0,0 +1,99 @@
+"""
+Change notifications for repository writes.
+
+BaseRepository publishes one ChangeEvent per write (insert, update, delete)
+with the table name and the affected ids. Views and caches subscribe to the
+tables they show and refresh only when one of them changed:
+
+    unsubscribe = change_bus.subscribe(on_change, tables=("student",))
+
+Events raised inside a transaction are held back and delivered after the
+commit; a rollback discards them. Callbacks run on the thread that committed
+the write, so Tk views should hand the work to the main loop (e.g. after()).
+"""
+
+import threading
+from contextlib import contextmanager
+from typing import NamedTuple, Optional
+
+
+class ChangeEvent(NamedTuple):
+    table: str
+    action: str                    # "insert", "update" or "delete"
+    ids: Optional[tuple] = None    # None when the affected ids are unknown
+
+
+class ChangeBus:
+    """
+        Publish/subscribe hub for ChangeEvent, safe to use from several threads.
+    """
+
+    def __init__(self):
+        self._subscribers = []
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def subscribe(self, callback, tables=None):
+        """
+            Register a callback for changes.
+
+            Args:
+                callback (callable): Called with each ChangeEvent.
+                tables (iterable[str], optional): Only these tables; all if None.
+            Returns:
+                callable: Function that removes the subscription.
+        """
+        entry = (callback, frozenset(tables) if tables is not None else None)
+        with self._lock:
+            self._subscribers.append(entry)
+
+        def unsubscribe():
+            with self._lock:
+                if entry in self._subscribers:
+                    self._subscribers.remove(entry)
+        return unsubscribe
+
+    def publish(self, table: str, action: str, ids=None):
+        """
+            Publish a change, or hold it until the enclosing deferred() block commits.
+        """
+        event = ChangeEvent(table, action, tuple(ids) if ids is not None else None)
+        pending = getattr(self._local, "pending", None)
+        if pending is not None:
+            pending.append(event)
+        else:
+            self._dispatch([event])
+
+    @contextmanager
+    def deferred(self):
+        """
+            Hold events published in this thread until the block ends without error.
+            Nested blocks flush with the outermost one.
+        """
+        outer = getattr(self._local, "pending", None)
+        if outer is not None:
+            yield
+            return
+        self._local.pending = []
+        try:
+            yield
+            events = self._local.pending
+        finally:
+            self._local.pending = None
+        self._dispatch(events)
+
+    def _dispatch(self, events):
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for event in events:
+            for callback, tables in subscribers:
+                if tables is not None and event.table not in tables:
+                    continue
+                try:
+                    callback(event)
+                except Exception as e:
+                    print(f"Error in change subscriber for {event.table}: {e}")
+
+
+# Shared bus used by every repository
+change_bus = ChangeBus()
@@ -44,32 +44,16 @@ class CicleRepository(BaseRepository):
             bool: True si se eliminó correctamente, False en caso contrario
         """
         try:
-            # 1. Obtener todas las aulas del ciclo
-            aulas = self.classroom_repo.get_all_rows()
-            aulas_ciclo = [aula for aula in aulas if aula.get("id_cicle") == cicle_id]
-            
-            # 2. Para cada aula, eliminar sus inscripciones y pagos
-            for aula in aulas_ciclo:
-                aula_id = aula.get("id")
-                if aula_id:
-                    # Obtener inscripciones de la aula
-                    inscripciones = self.inscription_repo.get_all_rows()
-                    inscripciones_aula = [insc for insc in inscripciones if insc.get("id_classroom") == aula_id]
-                    
-                    # Eliminar pagos de cada inscripción
-                    for inscripcion in inscripciones_aula:
-                        inscripcion_id = inscripcion.get("id")
-                        if inscripcion_id:
-                            self.payment_repo.delete_row({"id_inscription": inscripcion_id})
-                    
-                    # Eliminar inscripciones de la aula
-                    self.inscription_repo.delete_row({"id_classroom": aula_id})
-            
-            # 3. Eliminar todas las aulas del ciclo
-            self.classroom_repo.delete_row({"id_cicle": cicle_id})
-            
-            # 4. Finalmente, eliminar el ciclo
-            result = self.delete_row({"id": cicle_id})
+            with self.transaction() as cursor:
+                if not self.cascades_natively(cursor):
+                    # 1. Aulas del ciclo con sus inscripciones y pagos
+                    self.classroom_repo.delete_classrooms_where(cursor, "id_cicle", cicle_id)
+                
+                # 2. Finalmente, eliminar el ciclo (ON DELETE CASCADE elimina el resto)
+                cursor.execute(f"DELETE FROM {self.table} WHERE id = ?", (cicle_id,))
+                result = cursor.rowcount
+                if result > 0:
+                    self.notify_cascade_delete(cursor, [cicle_id])
             
             return result > 0
             
@@ -3,6 +3,8 @@ from .inscription_repository import InscriptionRepository
 from .payment_repository import PaymentRepository
 
 class ClassroomRepository(BaseRepository):
+    INDEXES = [("id_cicle",), ("id_course",), ("id_teacher",)]
+
     def __init__(self, conn=None):
         super().__init__("classroom", conn)
         self.inscription_repo = InscriptionRepository(conn)
@@ -17,9 +19,9 @@ class ClassroomRepository(BaseRepository):
                 name (VARCHAR(100)): Name of the classroom.
                 start_date (DATE): Start date of the classroom.
                 end_date (DATE): End date of the classroom.
-                id_teacher (INTEGER): Foreign key to teacher table.
-                id_course (INTEGER): Foreign key to course table.
-                id_cicle (INTEGER): Foreign key to cicle table.
+                id_teacher (INTEGER): Foreign key to teacher table (ON DELETE CASCADE).
+                id_course (INTEGER): Foreign key to course table (ON DELETE CASCADE).
+                id_cicle (INTEGER): Foreign key to cicle table (ON DELETE CASCADE).
             
             Returns:
                 None
@@ -32,9 +34,9 @@ class ClassroomRepository(BaseRepository):
             id_teacher INTEGER,
             id_course INTEGER,
             id_cicle INTEGER,
-            FOREIGN KEY (id_teacher) REFERENCES teacher(id),
-            FOREIGN KEY (id_course) REFERENCES course(id),
-            FOREIGN KEY (id_cicle) REFERENCES cicle(id)
+            FOREIGN KEY (id_teacher) REFERENCES teacher(id) ON DELETE CASCADE,
+            FOREIGN KEY (id_course) REFERENCES course(id) ON DELETE CASCADE,
+            FOREIGN KEY (id_cicle) REFERENCES cicle(id) ON DELETE CASCADE
         """
         return super().create_table(columns)
     
@@ -49,24 +51,47 @@ class ClassroomRepository(BaseRepository):
             bool: True si se eliminó correctamente, False en caso contrario
         """
         try:
-            # 1. Obtener inscripciones del aula
-            inscripciones = self.inscription_repo.get_all_rows()
-            inscripciones_aula = [insc for insc in inscripciones if insc.get("id_classroom") == classroom_id]
-            
-            # 2. Eliminar pagos de cada inscripción
-            for inscripcion in inscripciones_aula:
-                inscripcion_id = inscripcion.get("id")
-                if inscripcion_id:
-                    self.payment_repo.delete_row({"id_inscription": inscripcion_id})
-            
-            # 3. Eliminar todas las inscripciones del aula
-            self.inscription_repo.delete_row({"id_classroom": classroom_id})
-            
-            # 4. Eliminar el aula
-            result = self.delete_row({"id": classroom_id})
+            with self.transaction() as cursor:
+                if self.cascades_natively(cursor):
+                    # ON DELETE CASCADE elimina inscripciones y pagos
+                    cursor.execute(f"DELETE FROM {self.table} WHERE id = ?", (classroom_id,))
+                    result = cursor.rowcount
+                else:
+                    result = self.delete_classrooms_where(cursor, "id", classroom_id)
+                if result > 0:
+                    self.notify_cascade_delete(cursor, [classroom_id])
             
             return result > 0
             
         except Exception as e:
             print(f"Error al eliminar aula en cascada: {e}")
-            return False
\ No newline at end of file
+            return False
+
+    def delete_classrooms_where(self, cursor, column: str, value) -> int:
+        """
+        Eliminar las aulas con `column = value` junto con sus inscripciones y pagos.
+
+        Usa una sentencia DELETE por tabla sobre el cursor recibido, sin hacer
+        commit, para que el llamador lo ejecute dentro de su transacción. Solo
+        hace falta cuando la conexión no aplica ON DELETE CASCADE.
+        
+        Args:
+            cursor: Cursor de la transacción en curso
+            column (str): Columna de classroom a filtrar (id, id_cicle, id_course, id_teacher)
+            value: Valor buscado
+            
+        Returns:
+            int: Número de aulas eliminadas
+        """
+        classrooms = f"SELECT id FROM classroom WHERE {column} = ?"
+        # 1. Pagos de las inscripciones de esas aulas
+        cursor.execute(
+            f"""DELETE FROM payment WHERE id_inscription IN (
+                SELECT id FROM inscription WHERE id_classroom IN ({classrooms}))""",
+            (value,)
+        )
+        # 2. Inscripciones de esas aulas
+        cursor.execute(f"DELETE FROM inscription WHERE id_classroom IN ({classrooms})", (value,))
+        # 3. Las aulas
+        cursor.execute(f"DELETE FROM classroom WHERE {column} = ?", (value,))
+        return cursor.rowcount
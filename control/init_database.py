@@ -11,6 +11,7 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from control.bd.db_connection import Connection
 from control.session.user_repository import UserRepository
+from control.session.login_attempt_repository import LoginAttemptRepository
 from control.student_repository import StudentRepository
 from control.teacher_repository import TeacherRepository
 from control.team_repository import TeamRepository
@@ -25,39 +26,40 @@ def init_database():
     print("Inicializando base de datos...")
     
     try:
-        # Crear conexión
-        conn = Connection.connect()
-        if not conn:
-            print("Error: No se pudo conectar a la base de datos")
-            return False
-        
-        # Crear todas las tablas
-        repositories = [
-            UserRepository(conn),
-            TeamRepository(conn),
-            StudentRepository(conn),
-            TeacherRepository(conn),
-            CourseRepository(conn),
-            ClassroomRepository(conn),
-            CicleRepository(conn),
-            InscriptionRepository(conn),
-            PaymentRepository(conn)
-        ]
-        
-        for repo in repositories:
-            print(f"Creando tabla {repo.table}...")
-            repo.create_table()
-        
-        # Crear usuario administrador por defecto
-        user_repo = UserRepository(conn)
-        existing_admin = user_repo.get_row_value({"user": "admin"})
-        if not existing_admin:
-            print("Creando usuario administrador por defecto...")
-            user_repo.create_user("admin", "Administrador", "admin")
-            print("Usuario admin creado: admin/admin")
-        
-        conn.commit()
-        conn.close()
+        # Conexión del pool; se devuelve al salir del bloque
+        with Connection.acquire() as conn:
+            # Crear todas las tablas
+            repositories = [
+                UserRepository(conn),
+                LoginAttemptRepository(conn),
+                TeamRepository(conn),
+                StudentRepository(conn),
+                TeacherRepository(conn),
+                CourseRepository(conn),
+                ClassroomRepository(conn),
+                CicleRepository(conn),
+                InscriptionRepository(conn),
+                PaymentRepository(conn)
+            ]
+            
+            for repo in repositories:
+                print(f"Creando tabla {repo.table}...")
+                repo.create_table()
+                repo.migrate_foreign_keys()
+                repo.create_indexes()
+                repo.create_search_index()
+            
+            # Crear usuario administrador por defecto
+            user_repo = UserRepository(conn)
+            existing_admin = user_repo.get_row_value({"user": "admin"})
+            if not existing_admin:
+                print("Creando usuario administrador por defecto...")
+                user_repo.create_user("admin", "Administrador", "admin")
+                print("Usuario admin creado: admin/admin")
+            
+            conn.commit()
+            # Actualizar estadísticas del planificador tras crear/cambiar índices
+            conn.execute("PRAGMA optimize")
         
         print("Base de datos inicializada correctamente")
         return True
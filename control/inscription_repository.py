@@ -2,6 +2,8 @@ from .base_repository import BaseRepository
 from .payment_repository import PaymentRepository
 
 class InscriptionRepository(BaseRepository):
+    INDEXES = [("id_classroom",), ("id_student",), ("date_inscription",)]
+
     def __init__(self, conn=None):
         super().__init__("inscription", conn)
         self.payment_repo = PaymentRepository(conn)
@@ -16,7 +18,8 @@ class InscriptionRepository(BaseRepository):
                 date_inscription (DATE): Date of the inscription.
                 type_material (VARCHAR(50)): Type of material.
                 status_material (BOOLEAN): Status of the material.
-                id_classroom (INTEGER): Foreign key to classroom table.
+                id_student (INTEGER): Foreign key to student table (ON DELETE CASCADE).
+                id_classroom (INTEGER): Foreign key to classroom table (ON DELETE CASCADE).
             
             Returns:
                 None
@@ -32,8 +35,8 @@ class InscriptionRepository(BaseRepository):
             status BOOLEAN DEFAULT 1,
             date_inscription DATE DEFAULT CURRENT_DATE,
             status_material BOOLEAN DEFAULT 1,
-            FOREIGN KEY (id_student) REFERENCES student(id),
-            FOREIGN KEY (id_classroom) REFERENCES classroom(id)
+            FOREIGN KEY (id_student) REFERENCES student(id) ON DELETE CASCADE,
+            FOREIGN KEY (id_classroom) REFERENCES classroom(id) ON DELETE CASCADE
         """
         return super().create_table(columns)
     
@@ -49,21 +52,14 @@ class InscriptionRepository(BaseRepository):
             dict: Resultado con success, inscription_id y payment_id
         """
         try:
-            # 1. Crear la inscripción primero
-            self.insert_row(inscription_data)
-            
-            # 2. Obtener el ID de la inscripción recién creada
-            inscription_id = self.get_last_inserted_id()
-            if not inscription_id:
-                return {"success": False, "error": "No se pudo obtener ID de inscripción"}
-            
-            # 3. Agregar el ID de inscripción al pago
-            payment_data["id_inscription"] = inscription_id
-            
-            # 4. Crear el pago
-            self.payment_repo.insert_row(payment_data)
-            
-            payment_id = self.payment_repo.get_last_inserted_id()
+            with self.transaction() as cursor:
+                # 1. Crear la inscripción y tomar su ID del mismo cursor
+                inscription_id = self.insert_into(cursor, inscription_data)
+                
+                # 2. Crear el pago enlazado; un solo commit para ambos
+                payment_id = self.payment_repo.insert_into(
+                    cursor, {**payment_data, "id_inscription": inscription_id}
+                )
             
             return {
                 "success": True, 
@@ -91,7 +87,7 @@ class InscriptionRepository(BaseRepository):
                 return result[0] if result and result[0] else None
             else:
                 from .bd.db_connection import Connection
-                with Connection.connect() as conn:
+                with Connection.acquire() as conn:
                     cursor = conn.cursor()
                     cursor.execute(f"SELECT MAX(id) FROM {self.table}")
                     result = cursor.fetchone()
@@ -117,7 +113,7 @@ class InscriptionRepository(BaseRepository):
                 return None
             
             # Obtener los pagos de la inscripción
-            payments = self.payment_repo.get_all_rows({"id_inscription": inscription_id})
+            payments = self.payment_repo.get_payments_by_inscription(inscription_id)
             
             return {
                 "inscription": inscription,
@@ -128,6 +124,39 @@ class InscriptionRepository(BaseRepository):
             print(f"Error al obtener inscripción con pagos: {e}")
             return None
 
+    def get_classroom_roster(self, classroom_id: int) -> list[dict]:
+        """
+        Obtener los matriculados de un aula en una sola consulta.
+        
+        Une inscripción, estudiante y equipo, y cuenta los pagos de cada
+        inscripción con una subconsulta que usa el índice de payment.id_inscription.
+        Las inscripciones cuyo estudiante ya no existe no se incluyen.
+        
+        Args:
+            classroom_id (int): ID del aula
+            
+        Returns:
+            list[dict]: Columnas de la inscripción más student_name,
+                student_lastname, team_name (None sin equipo) y payment_count,
+                en orden de inscripción
+        """
+        return self.query_rows(
+            f"""
+            SELECT i.*,
+                   s.name AS student_name,
+                   s.lastname AS student_lastname,
+                   t.name AS team_name,
+                   (SELECT COUNT(*) FROM {self.payment_repo.table} AS p
+                    WHERE p.id_inscription = i.id) AS payment_count
+            FROM {self.table} AS i
+            JOIN student AS s ON s.id = i.id_student
+            LEFT JOIN team AS t ON t.id = s.id_team
+            WHERE i.id_classroom = ?
+            ORDER BY i.id
+            """,
+            (classroom_id,)
+        )
+
     def delete_inscription_cascade(self, inscription_id: int) -> bool:
         """
         Eliminar inscripción y todas sus dependencias en cascada.
@@ -139,11 +168,16 @@ class InscriptionRepository(BaseRepository):
             bool: True si se eliminó correctamente, False en caso contrario
         """
         try:
-            # 1. Eliminar todos los pagos de la inscripción
-            self.payment_repo.delete_row({"id_inscription": inscription_id})
-            
-            # 2. Eliminar la inscripción
-            result = self.delete_row({"id": inscription_id})
+            with self.transaction() as cursor:
+                if not self.cascades_natively(cursor):
+                    # 1. Eliminar todos los pagos de la inscripción
+                    cursor.execute("DELETE FROM payment WHERE id_inscription = ?", (inscription_id,))
+                
+                # 2. Eliminar la inscripción (ON DELETE CASCADE elimina sus pagos)
+                cursor.execute(f"DELETE FROM {self.table} WHERE id = ?", (inscription_id,))
+                result = cursor.rowcount
+                if result > 0:
+                    self.notify_cascade_delete(cursor, [inscription_id])
             
             return result > 0
             
@@ -1,6 +1,8 @@
 from .base_repository import BaseRepository
 
 class PaymentRepository(BaseRepository):
+    INDEXES = [("id_inscription",)]
+
     def __init__(self, conn=None):
         super().__init__("payment", conn)
 
@@ -13,7 +15,7 @@ class PaymentRepository(BaseRepository):
                 method_payment (VARCHAR(50)): Method of payment.
                 amount (INTEGER): Amount of payment.
                 created_datetime (DATETIME): Creation date and time of the payment.
-                id_inscription (INTEGER): Foreign key to inscription table.
+                id_inscription (INTEGER): Foreign key to inscription table (ON DELETE CASCADE).
             
             Returns:
                 None
@@ -24,7 +26,7 @@ class PaymentRepository(BaseRepository):
             amount INTEGER,
             created_datetime DATETIME DEFAULT CURRENT_TIMESTAMP,
             id_inscription INTEGER,
-            FOREIGN KEY (id_inscription) REFERENCES inscription(id)
+            FOREIGN KEY (id_inscription) REFERENCES inscription(id) ON DELETE CASCADE
         """
         return super().create_table(columns)
     
@@ -43,11 +45,46 @@ class PaymentRepository(BaseRepository):
                 return result[0] if result and result[0] else None
             else:
                 from .bd.db_connection import Connection
-                with Connection.connect() as conn:
+                with Connection.acquire() as conn:
                     cursor = conn.cursor()
                     cursor.execute(f"SELECT MAX(id) FROM {self.table}")
                     result = cursor.fetchone()
                     return result[0] if result and result[0] else None
         except Exception as e:
             print(f"Error al obtener último ID insertado: {e}")
-            return None
\ No newline at end of file
+            return None
+
+    def get_payments_by_inscription(self, inscription_id: int) -> list[dict]:
+        """
+        Obtener los pagos de una inscripción (coincidencia exacta, usa el índice).
+        
+        Args:
+            inscription_id (int): ID de la inscripción
+            
+        Returns:
+            list[dict]: Pagos ordenados por ID
+        """
+        return self.query_rows(
+            f"SELECT * FROM {self.table} WHERE id_inscription = ? ORDER BY id", (inscription_id,)
+        )
+
+    def get_payments_by_student(self, student_id: int) -> dict:
+        """
+        Obtener en una sola consulta los pagos de todas las inscripciones de un estudiante.
+        
+        Args:
+            student_id (int): ID del estudiante
+            
+        Returns:
+            dict: Listas de pagos agrupadas por id_inscription
+        """
+        payments = self.query_rows(
+            f"""SELECT * FROM {self.table}
+                WHERE id_inscription IN (SELECT id FROM inscription WHERE id_student = ?)
+                ORDER BY id_inscription, id""",
+            (student_id,)
+        )
+        grouped = {}
+        for payment in payments:
+            grouped.setdefault(payment["id_inscription"], []).append(payment)
+        return grouped
@@ -0,0 +1,181 @@
+"""
+Structured filters compiled to parameterized SQL for BaseRepository.
+
+A filter is a dict; its keys are AND-ed together:
+
+    {"id_classroom": 3}                         id_classroom = ?
+    {"id_team": None}                           id_team IS NULL
+    {"id": [1, 2, 3]}                           id IN (?, ?, ?)
+    {"amount": {"gte": 50, "lt": 100}}          amount >= ? AND amount < ?
+    {"date_inscription": {"between": (a, b)}}   date_inscription BETWEEN ? AND ?
+    {"name": {"prefix": "Jo"}}                  name >= 'Jo' AND name < 'Jp'
+    {"name": {"contains": "an"}}                substring, case-insensitive
+    {"$or": [{"gender": "M"}, {"gender": "F"}]} grouped OR ($and also accepted)
+
+Column names are checked against an identifier pattern before they are
+interpolated; every value is passed as a bound parameter.
+
+"prefix" compiles to a range so SQLite can answer it from an index on the
+column (LIKE cannot use one on BINARY-collated columns). It is therefore
+case-sensitive and meant for TEXT columns: on NUMERIC columns such as DATE a
+numeric-looking bound is compared as a number, so filter those with explicit
+ranges ({"gte": "2024-01-01", "lt": "2025-01-01"}).
+"""
+
+import re
+
+_IDENTIFIER = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*(\.[A-Za-z_][A-Za-z0-9_]*)?$")
+
+_COMPARISONS = {
+    "eq": "=",
+    "ne": "!=",
+    "lt": "<",
+    "lte": "<=",
+    "gt": ">",
+    "gte": ">=",
+}
+
+
+def _column(name: str) -> str:
+    if not isinstance(name, str) or not _IDENTIFIER.match(name):
+        raise ValueError(f"Invalid column name: {name!r}")
+    return name
+
+
+def _escape_like(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _prefix_upper_bound(prefix: str):
+    """Smallest string greater than every string starting with prefix, None if there is none."""
+    while prefix:
+        last = ord(prefix[-1])
+        if last < 0x10FFFF:
+            return prefix[:-1] + chr(last + 1)
+        prefix = prefix[:-1]
+    return None
+
+
+def _in_clause(column: str, values, negate: bool = False):
+    values = list(values)
+    if not values:
+        # Empty IN never matches; empty NOT IN always does
+        return ("1 = 1" if negate else "0 = 1"), []
+    placeholders = ", ".join(["?" for _ in values])
+    return f"{column} {'NOT IN' if negate else 'IN'} ({placeholders})", values
+
+
+def _operator_clause(column: str, op: str, value):
+    if op in _COMPARISONS:
+        if value is None:
+            return f"{column} IS {'NOT ' if op == 'ne' else ''}NULL", []
+        return f"{column} {_COMPARISONS[op]} ?", [value]
+    if op == "in":
+        return _in_clause(column, value)
+    if op == "not_in":
+        return _in_clause(column, value, negate=True)
+    if op == "between":
+        low, high = value
+        return f"{column} BETWEEN ? AND ?", [low, high]
+    if op == "prefix":
+        prefix = str(value)
+        upper = _prefix_upper_bound(prefix)
+        if not prefix:
+            return f"{column} IS NOT NULL", []
+        if upper is None:
+            return f"{column} >= ?", [prefix]
+        return f"({column} >= ? AND {column} < ?)", [prefix, upper]
+    if op == "contains":
+        return f"{column} LIKE ? ESCAPE '\\'", [f"%{_escape_like(value)}%"]
+    if op == "is_null":
+        return f"{column} IS {'' if value else 'NOT '}NULL", []
+    raise ValueError(f"Unknown filter operator: {op!r}")
+
+
+def compile_where(filters) -> tuple:
+    """
+        Compile a structured filter to a WHERE expression.
+
+        Args:
+            filters (dict): Filter as described in the module docstring.
+        Returns:
+            tuple: (sql, params); sql is "" when there is nothing to filter.
+    """
+    if not filters:
+        return "", []
+    clauses, params = [], []
+    for key, value in filters.items():
+        if key in ("$or", "$and"):
+            parts = [compile_where(group) for group in value]
+            parts = [(sql, group_params) for sql, group_params in parts if sql]
+            if not parts:
+                continue
+            joiner = " OR " if key == "$or" else " AND "
+            clauses.append("(" + joiner.join(sql for sql, _ in parts) + ")")
+            for _, group_params in parts:
+                params.extend(group_params)
+            continue
+
+        column = _column(key)
+        if isinstance(value, dict):
+            for op, operand in value.items():
+                sql, op_params = _operator_clause(column, op, operand)
+                clauses.append(sql)
+                params.extend(op_params)
+        elif isinstance(value, (list, tuple, set, frozenset)):
+            sql, op_params = _in_clause(column, value)
+            clauses.append(sql)
+            params.extend(op_params)
+        elif value is None:
+            clauses.append(f"{column} IS NULL")
+        else:
+            clauses.append(f"{column} = ?")
+            params.append(value)
+    return " AND ".join(clauses), params
+
+
+def compile_order(order_by) -> str:
+    """
+        Compile an ORDER BY list.
+
+        Args:
+            order_by (str | list[str]): Column names; a leading "-" sorts descending.
+        Returns:
+            str: ORDER BY expression without the keywords, "" if empty.
+    """
+    if not order_by:
+        return ""
+    if isinstance(order_by, str):
+        order_by = [order_by]
+    terms = []
+    for term in order_by:
+        descending = term.startswith("-")
+        terms.append(f"{_column(term.lstrip('-'))} {'DESC' if descending else 'ASC'}")
+    return ", ".join(terms)
+
+
+def compile_select(table: str, where=None, order_by=None, limit: int = None, offset: int = None,
+                   columns: str = "*") -> tuple:
+    """
+        Build a full SELECT for a table.
+
+        Returns:
+            tuple: (sql, params)
+    """
+    where_sql, params = compile_where(where)
+    sql = f"SELECT {columns} FROM {table}"
+    if where_sql:
+        sql += f" WHERE {where_sql}"
+    order_sql = compile_order(order_by)
+    if order_sql:
+        sql += f" ORDER BY {order_sql}"
+    if limit is not None:
+        sql += " LIMIT ?"
+        params.append(int(limit))
+        if offset:
+            sql += " OFFSET ?"
+            params.append(int(offset))
+    elif offset:
+        sql += " LIMIT -1 OFFSET ?"
+        params.append(int(offset))
+    return sql, params
@@ -0,0 +1,36 @@
+"""
+Authentication off the Tk thread.
+
+Argon2 verification is slow on purpose (see control/utils/encrypt_password.py);
+running it in a button callback freezes the window until it finishes.
+authenticate_async() runs UserRepository.authenticate on a worker thread and
+returns a Future; views poll it with after() and update the UI on the Tk thread.
+"""
+
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from .user_repository import UserRepository
+from .login_throttle import LoginThrottle, LoginLockedError
+
+__all__ = ["authenticate_async", "throttle", "LoginLockedError"]
+
+# Failure ledger shared by every login form of the app
+throttle = LoginThrottle()
+
+# One worker: login attempts are verified one at a time, in order.
+_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="auth")
+
+
+def authenticate_async(user: str, password: str) -> Future:
+    """
+        Verify credentials on the authentication worker.
+
+        Args:
+            user (str): Username.
+            password (str): Password.
+        Returns:
+            Future: Resolves to the user data (without password hash) or None;
+            raises LoginLockedError while the username or the session is
+            throttled, without verifying the password.
+    """
+    return _executor.submit(throttle.authenticate, UserRepository().authenticate, user, password)
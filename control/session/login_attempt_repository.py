@@ -0,0 +1,75 @@
+from control.base_repository import BaseRepository
+
+class LoginAttemptRepository(BaseRepository):
+    def __init__(self, conn=None):
+        super().__init__("login_attempt", conn)
+
+    def create_table(self):
+        """
+            Create the table 'login_attempt' if it does not exist.
+
+            Only usernames that are currently throttled are stored; a
+            successful login removes the row.
+
+            Columns:
+                id (INTEGER PRIMARY KEY AUTOINCREMENT): Unique identifier.
+                user (VARCHAR(100) UNIQUE): Normalized username.
+                failures (INTEGER): Consecutive failed attempts.
+                locked_until (REAL): Unix time until which logins are rejected.
+
+            Returns:
+                None
+        """
+        columns = """
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            user VARCHAR(100) UNIQUE,
+            failures INTEGER DEFAULT 0,
+            locked_until REAL DEFAULT 0
+        """
+        return super().create_table(columns)
+
+    def get_lockout(self, user: str):
+        """
+            Get the stored failure count and lockout of a username.
+
+            Args:
+                user (str): Normalized username.
+
+            Returns:
+                tuple: (failures, locked_until); (0, 0) if none is stored.
+        """
+        row = super().get_row_value({"user": user})
+        if not row:
+            return 0, 0.0
+        return row["failures"] or 0, row["locked_until"] or 0.0
+
+    def save_lockout(self, user: str, failures: int, locked_until: float):
+        """
+            Insert or replace the lockout of a username.
+
+            Returns:
+                None
+        """
+        try:
+            with self.transaction() as cursor:
+                cursor.execute(
+                    f"""INSERT INTO {self.table} (user, failures, locked_until) VALUES (?, ?, ?)
+                        ON CONFLICT(user) DO UPDATE SET
+                            failures = excluded.failures, locked_until = excluded.locked_until""",
+                    (user, failures, locked_until)
+                )
+        except Exception as e:
+            print(f"Error to save lockout {user}: {e}")
+
+    def clear_lockout(self, user: str):
+        """
+            Remove the lockout of a username.
+
+            Returns:
+                None
+        """
+        try:
+            with self.transaction() as cursor:
+                cursor.execute(f"DELETE FROM {self.table} WHERE user = ?", (user,))
+        except Exception as e:
+            print(f"Error to clear lockout {user}: {e}")
@@ -0,0 +1,145 @@
+"""
+Login throttling.
+
+Failed attempts are counted per username and per session (this running
+app). After a few free failures each new one locks further attempts for an
+exponentially growing window, capped at MAX_LOCK_SECONDS. Checks are
+answered from memory, so a locked attempt is rejected before any Argon2
+work. Per-username lockouts are also stored in the login_attempt table
+and survive restarts.
+"""
+
+import math
+import threading
+import time
+from collections import OrderedDict
+
+from .login_attempt_repository import LoginAttemptRepository
+
+# Failures allowed before the first lockout, per username and per session
+FREE_ATTEMPTS = 3
+SESSION_FREE_ATTEMPTS = 10
+# Lockout after the first throttled failure; doubles with each further one
+BASE_LOCK_SECONDS = 2
+MAX_LOCK_SECONDS = 15 * 60
+# Usernames kept in memory; older entries are reloaded from the table
+MAX_TRACKED_USERS = 1000
+
+
+class LoginLockedError(Exception):
+    """
+        Raised when a login is rejected because of a lockout.
+    """
+
+    def __init__(self, seconds: float):
+        self.seconds = math.ceil(seconds)
+        super().__init__(f"Login locked for {self.seconds} seconds")
+
+
+def lock_seconds(failures: int, free_attempts: int) -> float:
+    """
+        Lockout window after the given number of consecutive failures.
+    """
+    if failures < free_attempts:
+        return 0
+    return min(MAX_LOCK_SECONDS, BASE_LOCK_SECONDS * 2 ** (failures - free_attempts))
+
+
+class LoginThrottle:
+    """
+        Failure ledger for usernames and for the current session, thread-safe.
+    """
+
+    def __init__(self, repo: LoginAttemptRepository = None, clock=time.time):
+        self.repo = repo or LoginAttemptRepository()
+        self.clock = clock
+        self._users = OrderedDict()     # user -> [failures, locked_until]
+        self._session = [0, 0.0]
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(user: str) -> str:
+        # Case variants of a name share one counter
+        return (user or "").strip().lower()
+
+    def _entry(self, key: str) -> list:
+        entry = self._users.get(key)
+        if entry is None:
+            entry = list(self.repo.get_lockout(key))
+            self._users[key] = entry
+            while len(self._users) > MAX_TRACKED_USERS:
+                self._users.popitem(last=False)
+        else:
+            self._users.move_to_end(key)
+        return entry
+
+    def check(self, user: str) -> float:
+        """
+            Seconds left before this username may try again; 0 if allowed.
+        """
+        with self._lock:
+            now = self.clock()
+            locked_until = max(self._entry(self._key(user))[1], self._session[1])
+            return max(0.0, locked_until - now)
+
+    def record_failure(self, user: str) -> float:
+        """
+            Count a failed attempt and start or extend the lockout.
+
+            Returns:
+                float: Seconds the username is now locked for (0 if not locked).
+        """
+        key = self._key(user)
+        with self._lock:
+            now = self.clock()
+            entry = self._entry(key)
+            if entry[1] and now - entry[1] > MAX_LOCK_SECONDS:
+                # The last lockout ended long ago: start counting again
+                entry[0] = 0
+            entry[0] += 1
+            user_lock = lock_seconds(entry[0], FREE_ATTEMPTS)
+            entry[1] = now + user_lock if user_lock else 0.0
+
+            self._session[0] += 1
+            session_lock = lock_seconds(self._session[0], SESSION_FREE_ATTEMPTS)
+            self._session[1] = now + session_lock if session_lock else 0.0
+            failures, locked_until = entry
+        if user_lock:
+            self.repo.save_lockout(key, failures, locked_until)
+        return max(user_lock, session_lock)
+
+    def record_success(self, user: str):
+        """
+            Reset the counters of the username and of the session.
+        """
+        key = self._key(user)
+        with self._lock:
+            had_failures = self._entry(key)[0] > 0
+            self._users[key] = [0, 0.0]
+            self._session = [0, 0.0]
+        if had_failures:
+            self.repo.clear_lockout(key)
+
+    def authenticate(self, authenticate, user: str, password: str):
+        """
+            Run authenticate(user, password) unless the username is locked.
+
+            Args:
+                authenticate (callable): E.g. UserRepository().authenticate;
+                    returns the user data or None.
+                user (str): Username.
+                password (str): Password.
+            Returns:
+                dict or None: Result of authenticate.
+            Raises:
+                LoginLockedError: Locked, before calling authenticate.
+        """
+        remaining = self.check(user)
+        if remaining > 0:
+            raise LoginLockedError(remaining)
+        user_data = authenticate(user, password)
+        if user_data:
+            self.record_success(user)
+        else:
+            self.record_failure(user)
+        return user_data
@@ -1,7 +1,10 @@
 from control.base_repository import BaseRepository
-from control.utils.encrypt_password import encrypt_password, verify_password
+from control.utils.encrypt_password import encrypt_password, verify_password, needs_rehash
 
 class UserRepository(BaseRepository):
+    INDEXES = [("user",)]
+    SEARCH_COLUMNS = ("user",)
+
     def __init__(self, conn=None):
         super().__init__("user", conn)
 
@@ -39,12 +42,46 @@ class UserRepository(BaseRepository):
             Returns:
                 True or Pass / False to no session.
         """
+        return self.authenticate(user, password) is not None
+
+    def authenticate(self, user: str, password: str):
+        """
+            Verify credentials with a single user lookup.
+
+            Args:
+                user (str): Username.
+                password (str): Password.
+
+            Returns:
+                dict or None: User data without the password hash, or None
+                if the user does not exist or the password is incorrect.
+        """
         user_data = super().get_row_value({"user":user})
-        if user_data and verify_password(user_data["password"], password):
-            #Password correct
-            return True
-        else:
+        if not user_data or not verify_password(user_data["password"], password):
             #User not exists or password incorrect
+            return None
+        #Password correct
+        self.rehash_password(user_data, password)
+        return {key: value for key, value in user_data.items() if key != "password"}
+
+    def rehash_password(self, user_data: dict, password: str) -> bool:
+        """
+            Re-hash a verified password when its hash uses outdated Argon2
+            parameters. A failure is logged and does not affect the login.
+
+            Args:
+                user_data (dict): User row, with id and password.
+                password (str): Plain password that was just verified.
+
+            Returns:
+                bool: True if the stored hash was replaced.
+        """
+        if not needs_rehash(user_data["password"]):
+            return False
+        try:
+            return super().update_row({"password": encrypt_password(password)}, {"id": user_data["id"]}) > 0
+        except Exception as e:
+            print(f"Error to rehash password for {user_data.get('user')}: {e}")
             return False
 
 
@@ -2,6 +2,9 @@ from .base_repository import BaseRepository
 from .inscription_repository import InscriptionRepository
 
 class StudentRepository(BaseRepository):
+    INDEXES = [("id_team",)]
+    SEARCH_COLUMNS = ("name", "lastname")
+
     def __init__(self, conn=None):
         super().__init__("student", conn)
         self.inscription_repo = InscriptionRepository(conn)
@@ -17,7 +20,7 @@ class StudentRepository(BaseRepository):
                 phone (VARCHAR(20)): Phone number of the student.
                 date_baptism (DATE): Date of baptism.
                 date_of_birth (DATE): Date of birth.
-                id_team (INTEGER): Foreign key to team table.
+                id_team (INTEGER): Foreign key to team table, NULL once the team is deleted.
             
             Returns:
                 None
@@ -30,7 +33,7 @@ class StudentRepository(BaseRepository):
             date_baptism DATE,
             date_of_birth DATE,
             id_team INTEGER,
-            FOREIGN KEY (id_team) REFERENCES team(id)
+            FOREIGN KEY (id_team) REFERENCES team(id) ON DELETE SET NULL
         """
         return super().create_table(columns)
     
@@ -45,13 +48,51 @@ class StudentRepository(BaseRepository):
             bool: True si se eliminó correctamente, False en caso contrario
         """
         try:
-            # 1. Eliminar todas las inscripciones del estudiante
-            # Nota: Necesitamos verificar si hay una relación directa estudiante-inscripción
-            # Por ahora, eliminamos el estudiante directamente
-            result = self.delete_row({"id": student_id})
+            with self.transaction() as cursor:
+                if not self.cascades_natively(cursor):
+                    # 1. Pagos e inscripciones del estudiante
+                    cursor.execute(
+                        """DELETE FROM payment WHERE id_inscription IN (
+                            SELECT id FROM inscription WHERE id_student = ?)""",
+                        (student_id,)
+                    )
+                    cursor.execute("DELETE FROM inscription WHERE id_student = ?", (student_id,))
+                
+                # 2. Eliminar el estudiante (ON DELETE CASCADE elimina el resto)
+                cursor.execute(f"DELETE FROM {self.table} WHERE id = ?", (student_id,))
+                result = cursor.rowcount
+                if result > 0:
+                    self.notify_cascade_delete(cursor, [student_id])
             
             return result > 0
             
         except Exception as e:
             print(f"Error al eliminar estudiante en cascada: {e}")
-            return False
\ No newline at end of file
+            return False
+
+    def get_by_full_name(self, full_name: str):
+        """
+        Buscar un estudiante por "nombre apellido".
+
+        El índice de búsqueda solo reduce los candidatos; la igualdad exacta se
+        comprueba en la misma consulta, sin límite de coincidencias.
+        
+        Args:
+            full_name (str): Nombre y apellido tal como se muestran en las tablas
+            
+        Returns:
+            dict: Datos del estudiante, o None si ninguno coincide exactamente
+        """
+        full_name = full_name.strip()
+        query = self.match_query(full_name)
+        if not query:
+            return None
+        rows = self.query_rows(
+            f"""SELECT s.* FROM {self.table} AS s
+                JOIN {self.search_table} AS f ON f.rowid = s.id
+                WHERE {self.search_table} MATCH ?
+                  AND TRIM(COALESCE(s.name, '') || ' ' || COALESCE(s.lastname, '')) = ?
+                ORDER BY s.id LIMIT 1""",
+            (query, full_name)
+        )
+        return rows[0] if rows else None
@@ -4,6 +4,9 @@ from .inscription_repository import InscriptionRepository
 from .payment_repository import PaymentRepository
 
 class TeacherRepository(BaseRepository):
+    INDEXES = [("id_team",)]
+    SEARCH_COLUMNS = ("name", "lastname")
+
     def __init__(self, conn=None):
         super().__init__("teacher", conn)
         self.classroom_repo = ClassroomRepository(conn)
@@ -21,7 +24,7 @@ class TeacherRepository(BaseRepository):
                 phone (VARCHAR(20)): Phone number of the teacher.
                 date_baptism (DATE): Date of baptism.
                 date_of_birth (DATE): Date of birth.
-                id_team (INTEGER): Foreign key to team table.
+                id_team (INTEGER): Foreign key to team table, NULL once the team is deleted.
             
             Returns:
                 None
@@ -34,7 +37,7 @@ class TeacherRepository(BaseRepository):
             date_baptism DATE,
             date_of_birth DATE,
             id_team INTEGER,
-            FOREIGN KEY (id_team) REFERENCES team(id)
+            FOREIGN KEY (id_team) REFERENCES team(id) ON DELETE SET NULL
         """
         return super().create_table(columns)
     
@@ -49,32 +52,16 @@ class TeacherRepository(BaseRepository):
             bool: True si se eliminó correctamente, False en caso contrario
         """
         try:
-            # 1. Obtener aulas del docente
-            aulas = self.classroom_repo.get_all_rows()
-            aulas_docente = [aula for aula in aulas if aula.get("id_teacher") == teacher_id]
-            
-            # 2. Para cada aula, eliminar inscripciones y pagos
-            for aula in aulas_docente:
-                aula_id = aula.get("id")
-                if aula_id:
-                    # Obtener inscripciones de la aula
-                    inscripciones = self.inscription_repo.get_all_rows()
-                    inscripciones_aula = [insc for insc in inscripciones if insc.get("id_classroom") == aula_id]
-                    
-                    # Eliminar pagos de cada inscripción
-                    for inscripcion in inscripciones_aula:
-                        inscripcion_id = inscripcion.get("id")
-                        if inscripcion_id:
-                            self.payment_repo.delete_row({"id_inscription": inscripcion_id})
-                    
-                    # Eliminar inscripciones de la aula
-                    self.inscription_repo.delete_row({"id_classroom": aula_id})
-            
-            # 3. Eliminar todas las aulas del docente
-            self.classroom_repo.delete_row({"id_teacher": teacher_id})
-            
-            # 4. Eliminar el docente
-            result = self.delete_row({"id": teacher_id})
+            with self.transaction() as cursor:
+                if not self.cascades_natively(cursor):
+                    # 1. Aulas del docente con sus inscripciones y pagos
+                    self.classroom_repo.delete_classrooms_where(cursor, "id_teacher", teacher_id)
+                
+                # 2. Finalmente, eliminar el docente (ON DELETE CASCADE elimina el resto)
+                cursor.execute(f"DELETE FROM {self.table} WHERE id = ?", (teacher_id,))
+                result = cursor.rowcount
+                if result > 0:
+                    self.notify_cascade_delete(cursor, [teacher_id])
             
             return result > 0
             
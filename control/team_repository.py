@@ -43,21 +43,9 @@ class TeamRepository(BaseRepository):
             # Remove id for insertion
             team_data.pop("id", None)
             
-            self.insert_row(team_data)
-            
-            # Get the last inserted ID
-            if self.conn and self.cursor:
-                team.id = self.cursor.lastrowid
-            else:
-                # If no connection, get the last inserted ID
-                conn = self._get_connection()
-                if conn:
-                    cursor = conn.cursor()
-                    cursor.execute("SELECT last_insert_rowid()")
-                    team.id = cursor.fetchone()[0]
-                    conn.close()
-                else:
-                    raise Exception("No se pudo obtener conexión a la base de datos")
+            team.id = self.insert_row(team_data)
+            if team.id is None:
+                raise Exception("No se pudo insertar el equipo en la base de datos")
             
             return team
         except Exception as e:
@@ -170,7 +158,7 @@ class TeamRepository(BaseRepository):
             list[Team]: List of Team instances with specified gender
         """
         try:
-            teams_data = self.get_all_rows({"gender": gender})
+            teams_data = self.get_all_rows(where={"gender": gender})
             return [Team.from_dict(team_data) for team_data in teams_data]
         except Exception as e:
             print(f"Error getting teams by gender: {e}")
@@ -198,7 +186,8 @@ class TeamRepository(BaseRepository):
                 teams_data = self.cursor.fetchall()
                 columns = [description[0] for description in self.cursor.description]
             else:
-                with self._get_connection() as conn:
+                from control.bd.db_connection import Connection
+                with Connection.acquire() as conn:
                     cursor = conn.cursor()
                     cursor.execute("""
                         SELECT * FROM team 
@@ -218,8 +207,3 @@ class TeamRepository(BaseRepository):
         except Exception as e:
             print(f"Error getting teams by age range: {e}")
             return []
-    
-    def _get_connection(self):
-        """Get database connection if not already set"""
-        from control.bd.db_connection import Connection
-        return Connection.connect()
\ No newline at end of file
@@ -0,0 +1,160 @@
+"""
+Datos de los gráficos del panel principal agrupados en SQL.
+Cada consulta devuelve una fila por grupo, no por registro, y el resultado
+se entrega como arreglos NumPy listos para matplotlib.
+"""
+
+from datetime import date
+import numpy as np
+
+from ..student_repository import StudentRepository
+from ..team_repository import TeamRepository
+from ..course_repository import CourseRepository
+from ..classroom_repository import ClassroomRepository
+from ..inscription_repository import InscriptionRepository
+from ..payment_repository import PaymentRepository
+from .dashboard_stats import month_range
+
+MONTH_LABELS = ["Ene", "Feb", "Mar", "Abr", "May", "Jun",
+                "Jul", "Ago", "Sep", "Oct", "Nov", "Dic"]
+
+
+def _columns(rows: list, *names) -> tuple:
+    """
+    Convertir filas agrupadas en un arreglo por columna.
+    Las columnas "label" quedan como texto y el resto como enteros.
+    """
+    return tuple(
+        np.array([row[name] for row in rows], dtype=str if name == "label" else np.int64)
+        for name in names
+    )
+
+
+class ChartData:
+    """
+    Proveedor de datos de gráficos basado en consultas GROUP BY.
+    """
+
+    def __init__(self, conn=None):
+        self.student_repo = StudentRepository(conn)
+        self.team_repo = TeamRepository(conn)
+        self.course_repo = CourseRepository(conn)
+        self.classroom_repo = ClassroomRepository(conn)
+        self.inscription_repo = InscriptionRepository(conn)
+        self.payment_repo = PaymentRepository(conn)
+
+    def payments_by_method(self) -> tuple:
+        """
+        Cantidad de pagos por método de pago.
+
+        Returns:
+            tuple: (cantidades, métodos), ordenados de mayor a menor
+        """
+        rows = self.payment_repo.query_rows(
+            f"""
+            SELECT COALESCE(method_payment, 'Desconocido') AS label, COUNT(*) AS total
+            FROM {self.payment_repo.table}
+            GROUP BY label
+            ORDER BY total DESC, label
+            """
+        )
+        return _columns(rows, "total", "label")
+
+    def students_by_team(self) -> tuple:
+        """
+        Cantidad de estudiantes por equipo (id_team).
+
+        Returns:
+            tuple: (cantidades, nombres de equipo), en orden de id_team
+        """
+        rows = self.student_repo.query_rows(
+            f"""
+            SELECT COALESCE(t.name, 'Sin equipo') AS label, s.total
+            FROM (
+                SELECT id_team, COUNT(*) AS total
+                FROM {self.student_repo.table}
+                GROUP BY id_team
+            ) AS s
+            LEFT JOIN {self.team_repo.table} AS t ON t.id = s.id_team
+            ORDER BY s.id_team IS NULL, s.id_team
+            """
+        )
+        return _columns(rows, "total", "label")
+
+    def student_ages(self, day: date = None) -> tuple:
+        """
+        Distribución de edades calculadas desde date_of_birth.
+        Las fechas vacías o inválidas no se cuentan.
+
+        Args:
+            day (date, optional): Fecha de referencia, hoy por defecto
+
+        Returns:
+            tuple: (edades, cantidad de estudiantes por edad)
+        """
+        today = (day or date.today()).isoformat()
+        rows = self.student_repo.query_rows(
+            f"""
+            SELECT CAST(strftime('%Y', ?) AS INTEGER) - CAST(strftime('%Y', date_of_birth) AS INTEGER)
+                   - (strftime('%m-%d', ?) < strftime('%m-%d', date_of_birth)) AS age,
+                   COUNT(*) AS total
+            FROM {self.student_repo.table}
+            WHERE date(date_of_birth) IS NOT NULL
+            GROUP BY age
+            ORDER BY age
+            """,
+            (today, today)
+        )
+        return _columns(rows, "age", "total")
+
+    def inscriptions_by_month(self, months: int = 6, day: date = None) -> dict:
+        """
+        Matrículas por mes según date_inscription, para los últimos meses.
+        Los meses sin matrículas aparecen con cero.
+
+        Args:
+            months (int): Cantidad de meses, terminando en el mes actual
+            day (date, optional): Fecha de referencia, hoy por defecto
+
+        Returns:
+            dict: 'x' con las etiquetas de mes y 'y' con las cantidades
+        """
+        day = day or date.today()
+        index = day.year * 12 + day.month - 1
+        keys = [(i // 12, i % 12 + 1) for i in range(index - months + 1, index + 1)]
+        start = date(keys[0][0], keys[0][1], 1).isoformat()
+        _, end = month_range(day)
+
+        rows = self.inscription_repo.query_rows(
+            f"""
+            SELECT strftime('%Y-%m', date_inscription) AS month, COUNT(*) AS total
+            FROM {self.inscription_repo.table}
+            WHERE date_inscription >= ? AND date_inscription < ?
+            GROUP BY month
+            """,
+            (start, end)
+        )
+        totals = {row["month"]: row["total"] for row in rows}
+        return {
+            "x": np.array([MONTH_LABELS[m - 1] for _, m in keys]),
+            "y": np.array([totals.get(f"{y:04d}-{m:02d}", 0) for y, m in keys], dtype=np.int64)
+        }
+
+    def inscriptions_by_course(self) -> tuple:
+        """
+        Matrículas por curso, a través de classroom.id_course.
+
+        Returns:
+            tuple: (cantidades, nombres de curso), en orden de id de curso
+        """
+        rows = self.course_repo.query_rows(
+            f"""
+            SELECT c.name AS label, COUNT(i.id) AS total
+            FROM {self.course_repo.table} AS c
+            LEFT JOIN {self.classroom_repo.table} AS cl ON cl.id_course = c.id
+            LEFT JOIN {self.inscription_repo.table} AS i ON i.id_classroom = cl.id
+            GROUP BY c.id
+            ORDER BY c.id
+            """
+        )
+        return _columns(rows, "total", "label")
@@ -0,0 +1,61 @@
+"""
+Indicadores del panel principal calculados con agregados SQL.
+Ninguna consulta carga filas completas: solo se leen los conteos.
+"""
+
+from datetime import date
+from ..student_repository import StudentRepository
+from ..classroom_repository import ClassroomRepository
+from ..inscription_repository import InscriptionRepository
+
+
+def month_range(day: date = None) -> tuple:
+    """
+    Obtener el rango [inicio, fin) del mes de una fecha en formato ISO.
+
+    Args:
+        day (date, optional): Fecha de referencia, hoy por defecto
+
+    Returns:
+        tuple: (primer día del mes, primer día del mes siguiente) como "YYYY-MM-DD"
+    """
+    day = day or date.today()
+    start = day.replace(day=1)
+    end = start.replace(year=start.year + 1, month=1) if start.month == 12 else start.replace(month=start.month + 1)
+    return start.isoformat(), end.isoformat()
+
+
+class DashboardStats:
+    """
+    Servicio de estadísticas del panel principal.
+    """
+
+    def __init__(self, conn=None):
+        self.student_repo = StudentRepository(conn)
+        self.classroom_repo = ClassroomRepository(conn)
+        self.inscription_repo = InscriptionRepository(conn)
+
+    def get_statistics(self, day: date = None) -> dict:
+        """
+        Obtener los indicadores del panel en una sola consulta agregada.
+
+        Args:
+            day (date, optional): Fecha de referencia para "Matrículas del Mes"
+
+        Returns:
+            dict: total_students, active_classrooms y monthly_inscriptions
+        """
+        start, end = month_range(day)
+        rows = self.inscription_repo.query_rows(
+            f"""
+            SELECT
+                (SELECT COUNT(*) FROM {self.student_repo.table}) AS total_students,
+                (SELECT COUNT(*) FROM {self.classroom_repo.table}) AS active_classrooms,
+                (SELECT COUNT(*) FROM {self.inscription_repo.table}
+                 WHERE date_inscription >= ? AND date_inscription < ?) AS monthly_inscriptions
+            """,
+            (start, end)
+        )
+        if not rows:
+            return {"total_students": 0, "active_classrooms": 0, "monthly_inscriptions": 0}
+        return rows[0]
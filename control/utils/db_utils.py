@@ -16,18 +16,13 @@ def get_db_connection():
             # Use connection here
             pass
     """
-    conn = None
     try:
-        conn = Connection.connect()
-        if not conn:
-            raise Exception("No se pudo establecer conexión con la base de datos")
-        yield conn
+        # Conexión del pool: se devuelve al salir, no se cierra
+        with Connection.acquire() as conn:
+            yield conn
     except Exception as e:
         print(f"Error en conexión de base de datos: {e}")
         raise
-    finally:
-        if conn:
-            conn.close()
 
 
 def safe_execute_query(conn, query, params=None, fetch_one=False, fetch_all=False):
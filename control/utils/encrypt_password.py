@@ -1,13 +1,143 @@
+"""
+Hash de contraseñas con Argon2.
+
+Se usa un único PasswordHasher para toda la aplicación. Al arrancar,
+load_hasher_settings() lo configura con los parámetros medidos en este equipo
+por calibrate_profile() (se calibra una vez y se guarda en el almacenamiento
+local). Al iniciar sesión, los hashes creados con parámetros anteriores se
+detectan con needs_rehash() y se reemplazan.
+"""
+
+import time
+
 from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
+
+# Perfiles de costo (memory_cost en KiB). El tiempo por hash depende del
+# equipo; calibrate_profile() lo mide.
+PROFILES = {
+    # Mínimo recomendado por OWASP
+    "weak": {"time_cost": 2, "memory_cost": 19456, "parallelism": 1},
+    # Valores por defecto de argon2-cffi (RFC 9106, poca memoria)
+    "default": {"time_cost": 3, "memory_cost": 65536, "parallelism": 4},
+    # Para equipos con memoria de sobra
+    "strong": {"time_cost": 4, "memory_cost": 131072, "parallelism": 4},
+}
+DEFAULT_PROFILE = "default"
+# Clave del almacenamiento local con los parámetros calibrados
+SETTINGS_KEY = "password_hasher"
+# Latencia objetivo de un inicio de sesión
+TARGET_MS = 250
+
+_hasher = PasswordHasher(**PROFILES[DEFAULT_PROFILE])
+
+
+def configure_hasher(profile: str = DEFAULT_PROFILE, **params) -> PasswordHasher:
+    """
+    Reemplazar el hasher compartido.
+
+    Args:
+        profile (str): Nombre de un perfil de PROFILES
+        **params: time_cost, memory_cost o parallelism que cambian el perfil
+
+    Returns:
+        PasswordHasher: El nuevo hasher compartido
+    """
+    global _hasher
+    _hasher = PasswordHasher(**{**PROFILES[profile], **params})
+    return _hasher
+
+
+def get_hasher() -> PasswordHasher:
+    """Obtener el hasher compartido."""
+    return _hasher
+
+
+def calibrate_profile(target_ms: float = 250, memory_cost: int = 65536, parallelism: int = 4,
+                      max_time_cost: int = 10) -> dict:
+    """
+    Medir en este equipo el time_cost más alto que no supere target_ms por hash.
+
+    Args:
+        target_ms (float): Latencia máxima aceptable por verificación
+        memory_cost (int): Memoria por hash en KiB
+        parallelism (int): Hilos por hash
+        max_time_cost (int): Límite de la búsqueda
+
+    Returns:
+        dict: Parámetros para configure_hasher(**params); time_cost mínimo 1
+    """
+    best = {"time_cost": 1, "memory_cost": memory_cost, "parallelism": parallelism}
+    for time_cost in range(1, max_time_cost + 1):
+        params = {"time_cost": time_cost, "memory_cost": memory_cost, "parallelism": parallelism}
+        start = time.perf_counter()
+        PasswordHasher(**params).hash("calibracion")
+        if (time.perf_counter() - start) * 1000 > target_ms:
+            break
+        best = params
+    return best
+
+
+def load_hasher_settings(storage, target_ms: float = TARGET_MS) -> PasswordHasher:
+    """
+    Configurar el hasher compartido con los parámetros calibrados de este equipo.
+
+    La primera vez se ejecuta calibrate_profile() y el resultado se guarda en
+    el almacenamiento local; los arranques siguientes solo lo leen. Para volver
+    a calibrar basta con borrar la clave SETTINGS_KEY.
+
+    Args:
+        storage: LocalStorage donde se guardan los parámetros
+        target_ms (float): Latencia máxima por hash al calibrar
+
+    Returns:
+        PasswordHasher: El nuevo hasher compartido
+    """
+    params = storage.load_data(SETTINGS_KEY)
+    if not params:
+        params = calibrate_profile(target_ms, **{
+            name: PROFILES[DEFAULT_PROFILE][name] for name in ("memory_cost", "parallelism")
+        })
+        storage.save_data(SETTINGS_KEY, params)
+    if not _valid_params(params):
+        print(f"Advertencia: parámetros de Argon2 inválidos en '{SETTINGS_KEY}', se usa el perfil {DEFAULT_PROFILE}")
+        return configure_hasher()
+    return configure_hasher(**params)
+
+
+def _valid_params(params) -> bool:
+    """
+    Revisar que los parámetros guardados sean exactamente time_cost, memory_cost
+    y parallelism, enteros dentro de los límites que acepta Argon2.
+    """
+    if not isinstance(params, dict) or set(params) != {"time_cost", "memory_cost", "parallelism"}:
+        return False
+    if not all(type(value) is int for value in params.values()):
+        return False
+    return (1 <= params["time_cost"] <= 100
+            and 1 <= params["parallelism"] <= 64
+            and 8 * params["parallelism"] <= params["memory_cost"] <= 4 * 1024 * 1024)
+
 
 def encrypt_password(password):
-    ph = PasswordHasher()
-    return ph.hash(password)
+    return _hasher.hash(password)
+
 
 def verify_password(hashed_password, password):
-    ph = PasswordHasher()
+    # Filas antiguas pueden no tener hash (None) o guardar otro tipo
+    if not isinstance(hashed_password, (str, bytes)):
+        return False
+    try:
+        return _hasher.verify(hashed_password, password)
+    except (VerificationError, InvalidHashError, TypeError):
+        return False
+
+
+def needs_rehash(hashed_password) -> bool:
+    """
+    Indicar si un hash se creó con parámetros distintos a los del hasher actual.
+    """
     try:
-        ph.verify(hashed_password, password)
-        return True
-    except:
-        return False
\ No newline at end of file
+        return _hasher.check_needs_rehash(hashed_password)
+    except (InvalidHashError, ValueError):
+        return False
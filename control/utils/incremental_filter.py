@@ -0,0 +1,129 @@
+"""
+Filtrado incremental en memoria para las pantallas de listas.
+Carga una sola vez las columnas filtrables de la tabla y, mientras el usuario
+sigue escribiendo, busca solo dentro de las coincidencias anteriores.
+
+Un criterio de texto puede delegarse al índice FTS5 del repositorio (search):
+desde SEARCH_MIN_CHARS caracteres se busca por inicio de palabra, sin acentos
+y por relevancia; los textos más cortos siguen buscándose por subcadena.
+"""
+
+from ..change_events import change_bus
+
+# Largo mínimo del texto para usar el índice de búsqueda en lugar de la subcadena
+SEARCH_MIN_CHARS = 2
+
+
+class IncrementalFilter:
+    """
+    Filtro de texto, igualdad y rangos sobre una proyección cacheada de una tabla.
+
+    Ejemplo:
+        engine = IncrementalFilter(student_repo, {"name": ("name", "lastname")}, exact=("id_team",))
+        ids = engine.match({"name": "ana"}, {"id_team": 3})
+    """
+
+    def __init__(self, repo, texts: dict, exact=(), ranges=(), search: str = None):
+        """
+        Args:
+            repo: Repositorio de la tabla a filtrar
+            texts (dict): Criterio de texto -> columnas donde se busca (basta una)
+            exact (tuple): Columnas comparadas por igualdad
+            ranges (tuple): Columnas comparadas por mínimo/máximo
+            search (str, optional): Criterio de texto que se responde con repo.search()
+        """
+        self.repo = repo
+        self.search = search
+        self.texts = {key: tuple(columns) for key, columns in texts.items()}
+        self.exact = tuple(exact)
+        self.ranges = tuple(ranges)
+        self._base = None
+        self._last = None
+        # La caché se descarta cuando la tabla cambia
+        self._unsubscribe = change_bus.subscribe(lambda event: self.invalidate(), tables=(repo.table,))
+
+    def invalidate(self):
+        """Descartar el conjunto base y las coincidencias anteriores."""
+        self._base = None
+        self._last = None
+
+    def close(self):
+        """Dejar de escuchar cambios de la tabla."""
+        self._unsubscribe()
+
+    def _load(self) -> list:
+        """
+        Cargar (id, textos en minúsculas, valores exactos, valores de rango) por fila.
+        """
+        columns = list(dict.fromkeys(
+            [column for group in self.texts.values() for column in group] + list(self.exact) + list(self.ranges)
+        ))
+        rows = self.repo.query_rows(f"SELECT id, {', '.join(columns)} FROM {self.repo.table} ORDER BY id")
+        base = []
+        for row in rows:
+            # Las columnas de un criterio se unen con un separador que nadie escribe
+            haystacks = tuple(
+                "\x00".join(str(row[column] or "") for column in group).lower()
+                for group in self.texts.values()
+            )
+            base.append((
+                row["id"],
+                haystacks,
+                tuple(row[column] for column in self.exact),
+                tuple(row[column] for column in self.ranges),
+            ))
+        return base
+
+    def match(self, texts: dict = None, exact: dict = None, ranges: dict = None) -> list:
+        """
+        Obtener los ids que cumplen los criterios, en orden de id.
+
+        Args:
+            texts (dict, optional): Criterio de texto -> texto buscado (parcial, sin mayúsculas)
+            exact (dict, optional): Columna -> valor exacto; se ignoran los ausentes
+            ranges (dict, optional): Columna -> (mínimo, máximo); None = sin límite
+
+        Returns:
+            list: Ids de las filas que coinciden; por relevancia si se usó el índice de búsqueda
+        """
+        search_text = (texts or {}).get(self.search, "").strip() if self.search else ""
+        if len(search_text) >= SEARCH_MIN_CHARS and self.repo.match_query(search_text):
+            ranked = self.repo.search(search_text, limit=None)
+            allowed = set(self._match({**texts, self.search: ""}, exact, ranges))
+            return [record_id for record_id in ranked if record_id in allowed]
+        return self._match(texts, exact, ranges)
+
+    def _match(self, texts: dict = None, exact: dict = None, ranges: dict = None) -> list:
+        needles = tuple((texts or {}).get(key, "").strip().lower() for key in self.texts)
+        exact_key = tuple((exact or {}).get(column) for column in self.exact)
+        range_key = tuple((ranges or {}).get(column, (None, None)) for column in self.ranges)
+
+        if self._base is None:
+            self._base = self._load()
+            self._last = None
+
+        # Si los textos solo se alargaron, las nuevas coincidencias están dentro de las anteriores
+        candidates = self._base
+        if self._last is not None:
+            last_needles, last_exact, last_ranges, last_matches = self._last
+            if (last_exact == exact_key and last_ranges == range_key
+                    and all(old in new for old, new in zip(last_needles, needles))):
+                candidates = last_matches
+
+        matches = [
+            record for record in candidates
+            if all(needle in haystack for needle, haystack in zip(needles, record[1]) if needle)
+            and all(wanted is None or value == wanted for wanted, value in zip(exact_key, record[2]))
+            and all(self._in_range(value, bounds) for bounds, value in zip(range_key, record[3]))
+        ]
+        self._last = (needles, exact_key, range_key, matches)
+        return [record[0] for record in matches]
+
+    @staticmethod
+    def _in_range(value, bounds) -> bool:
+        low, high = bounds
+        if low is None and high is None:
+            return True
+        if value is None:
+            return False
+        return (low is None or value >= low) and (high is None or value <= high)
@@ -15,6 +15,10 @@ class InscriptionFlowManager:
     Gestor del flujo completo de inscripción y pago.
     """
     
+    # Campos requeridos por registro en create_inscriptions_bulk
+    BULK_FIELDS = ("student_id", "classroom_id", "year", "cycle",
+                   "type_material", "payment_method", "amount")
+    
     def __init__(self, conn=None):
         self.inscription_repo = InscriptionRepository(conn)
         self.payment_repo = PaymentRepository(conn)
@@ -85,6 +89,122 @@ class InscriptionFlowManager:
         except Exception as e:
             return {"success": False, "error": f"Error en el flujo de inscripción: {str(e)}"}
     
+    def create_inscriptions_bulk(self, records) -> dict:
+        """
+        Crear muchas inscripciones con su pago en una sola transacción.
+        
+        Valida los IDs de estudiantes y aulas con una consulta por tabla e
+        inserta inscripciones y pagos con executemany. Los registros inválidos
+        se reportan en su resultado y no impiden guardar los demás.
+        
+        Args:
+            records (iterable[dict]): Registros con student_id, classroom_id, year,
+                cycle, type_material, payment_method y amount (los mismos
+                parámetros que create_complete_inscription)
+            
+        Returns:
+            dict: success, created, failed y results (un resultado por registro, en orden).
+                success es True si se creó al menos una inscripción; puede haber
+                registros fallidos aun así, por lo que conviene revisar failed.
+        """
+        try:
+            records = list(records)
+            results = [None] * len(records)
+            
+            # 1. Revisar campos y convertir los IDs (pueden llegar como texto desde los formularios)
+            candidates = []
+            for index, record in enumerate(records):
+                missing = [field for field in self.BULK_FIELDS if field not in record]
+                if missing:
+                    results[index] = {"success": False, "error": f"Faltan campos: {', '.join(missing)}"}
+                    continue
+                try:
+                    student_id = self._parse_id(record["student_id"], "estudiante")
+                    classroom_id = self._parse_id(record["classroom_id"], "aula")
+                except ValueError as e:
+                    results[index] = {"success": False, "error": str(e)}
+                    continue
+                candidates.append((index, {**record, "student_id": student_id, "classroom_id": classroom_id}))
+            
+            # 2. Validar todos los IDs con una consulta por tabla
+            students = self.student_repo.get_rows_by_ids(
+                (record["student_id"] for _, record in candidates), "id, name, lastname"
+            )
+            classrooms = self.classroom_repo.get_rows_by_ids(
+                (record["classroom_id"] for _, record in candidates), "id, name"
+            )
+            
+            valid = []
+            for index, record in candidates:
+                if record["student_id"] not in students:
+                    results[index] = {"success": False, "error": "Estudiante no encontrado"}
+                elif record["classroom_id"] not in classrooms:
+                    results[index] = {"success": False, "error": "Aula no encontrada"}
+                else:
+                    valid.append((index, record))
+            
+            if valid:
+                # 3. Preparar inscripciones y pagos
+                current_date = datetime.now().strftime("%Y-%m-%d")
+                current_datetime = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                inscriptions = [{
+                    "id_student": record["student_id"],
+                    "id_classroom": record["classroom_id"],
+                    "year": record["year"],
+                    "cycle": record["cycle"],
+                    "date_taken": current_date,
+                    "type_material": record["type_material"],
+                    "status": True,
+                    "date_inscription": current_date,
+                    "status_material": True
+                } for _, record in valid]
+                
+                # 4. Insertar todo con executemany y un solo commit
+                with self.inscription_repo.transaction(immediate=True) as cursor:
+                    inscription_ids = self.inscription_repo.insert_many_into(cursor, inscriptions)
+                    payment_ids = self.payment_repo.insert_many_into(cursor, [{
+                        "method_payment": record["payment_method"],
+                        "amount": record["amount"],
+                        "created_datetime": current_datetime,
+                        "id_inscription": inscription_id
+                    } for (_, record), inscription_id in zip(valid, inscription_ids)])
+                
+                for (index, record), inscription_id, payment_id in zip(valid, inscription_ids, payment_ids):
+                    student = students[record["student_id"]]
+                    results[index] = {
+                        "success": True,
+                        "inscription_id": inscription_id,
+                        "payment_id": payment_id,
+                        "student_name": f"{student['name']} {student['lastname']}",
+                        "classroom_name": classrooms[record["classroom_id"]].get('name') or 'Aula sin nombre'
+                    }
+            
+            result = {
+                "success": bool(valid),
+                "created": len(valid),
+                "failed": len(records) - len(valid),
+                "results": results
+            }
+            if not valid:
+                result["error"] = "No se creó ninguna inscripción"
+            return result
+            
+        except Exception as e:
+            return {"success": False, "error": f"Error en la inscripción masiva: {str(e)}"}
+    
+    @staticmethod
+    def _parse_id(value, label: str) -> int:
+        """
+        Convertir un ID recibido como número o texto a entero.
+        
+        Raises:
+            ValueError: Si el valor no es un entero positivo
+        """
+        text = str(value).strip()
+        if isinstance(value, bool) or not text.isdigit() or int(text) <= 0:
+            raise ValueError(f"ID de {label} inválido: {value!r}")
+        return int(text)
+    
     def get_student_inscriptions(self, student_id: int) -> dict:
         """
         Obtener todas las inscripciones de un estudiante con sus pagos.
@@ -96,14 +216,17 @@ class InscriptionFlowManager:
             dict: Inscripciones del estudiante
         """
         try:
-            # Obtener inscripciones del estudiante
-            inscriptions = self.inscription_repo.get_all_rows({"id_student": student_id})
+            # Obtener inscripciones del estudiante (coincidencia exacta)
+            inscriptions = self.inscription_repo.get_all_rows(
+                where={"id_student": student_id}, order_by="id"
+            )
+            
+            # Obtener todos sus pagos en una consulta y agruparlos por inscripción
+            payments = self.payment_repo.get_payments_by_student(student_id)
             
             result = []
             for inscription in inscriptions:
-                # Obtener pagos de cada inscripción
-                payments = self.payment_repo.get_all_rows({"id_inscription": inscription["id"]})
-                inscription["payments"] = payments
+                inscription["payments"] = payments.get(inscription["id"], [])
                 result.append(inscription)
             
             return {"success": True, "inscriptions": result}
@@ -139,8 +262,7 @@ class InscriptionFlowManager:
             }
             
             # Crear el pago
-            self.payment_repo.insert_row(payment_data)
-            payment_id = self.payment_repo.get_last_inserted_id()
+            payment_id = self.payment_repo.insert_row(payment_data)
             
             if payment_id:
                 return {
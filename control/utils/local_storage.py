@@ -1,15 +1,45 @@
+import atexit
+import copy
 import json
 import os
+import tempfile
+import threading
+import time
+import weakref
 from typing import Any, Dict, Optional
 
 class LocalStorage:
     """
     Sistema de almacenamiento local para la aplicación Bible Academy
+
+    Los datos leídos o guardados se conservan en memoria. save_data,
+    delete_data y clear_all actualizan la caché directamente; para notar
+    cambios hechos fuera de esta instancia, load_data revisa la fecha de
+    modificación y el tamaño del archivo como mucho una vez cada
+    stat_interval segundos por clave. list_keys usa un índice de claves que
+    mantienen save_data, delete_data y clear_all.
     """
+
+    # Segundos entre revisiones del archivo de una clave ya cacheada
+    STAT_INTERVAL = 1.0
     
-    def __init__(self, storage_path: str = "storage/data"):
+    def __init__(self, storage_path: str = "storage/data", stat_interval: float = STAT_INTERVAL):
         self.storage_path = storage_path
+        self.stat_interval = stat_interval
+        self._lock = threading.RLock()
+        # clave -> ((mtime_ns, tamaño) o None si no existe, datos, momento de la última revisión)
+        self._cache = {}
+        # Se llena con el primer list_keys
+        self._keys = None
         self.ensure_storage_directory()
+
+    def _file_path(self, key: str) -> str:
+        return os.path.join(self.storage_path, f"{key}.json")
+
+    @staticmethod
+    def _signature(file_path: str):
+        stat = os.stat(file_path)
+        return stat.st_mtime_ns, stat.st_size
     
     def ensure_storage_directory(self):
         """Asegura que el directorio de almacenamiento existe"""
@@ -28,9 +58,25 @@ class LocalStorage:
             bool: True si se guardó exitosamente, False en caso contrario
         """
         try:
-            file_path = os.path.join(self.storage_path, f"{key}.json")
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            file_path = self._file_path(key)
+            # Se escribe en un temporal y se renombra: un corte a mitad de la
+            # escritura deja el archivo anterior intacto
+            fd, temp_path = tempfile.mkstemp(dir=self.storage_path, prefix=f".{key}.", suffix=".tmp")
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, ensure_ascii=False, indent=2)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(temp_path, file_path)
+            except BaseException:
+                if os.path.exists(temp_path):
+                    os.remove(temp_path)
+                raise
+            # Copia propia: el llamador puede seguir modificando data
+            with self._lock:
+                self._cache[key] = (self._signature(file_path), copy.deepcopy(data), time.monotonic())
+                if self._keys is not None:
+                    self._keys.add(key)
             return True
         except Exception as e:
             print(f"Error guardando datos para la clave '{key}': {e}")
@@ -48,11 +94,27 @@ class LocalStorage:
             Los datos cargados o el valor por defecto
         """
         try:
-            file_path = os.path.join(self.storage_path, f"{key}.json")
-            if os.path.exists(file_path):
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            return default
+            now = time.monotonic()
+            with self._lock:
+                cached = self._cache.get(key)
+            if cached is None or now - cached[2] >= self.stat_interval:
+                file_path = self._file_path(key)
+                try:
+                    signature = self._signature(file_path)
+                except FileNotFoundError:
+                    signature = None
+                if cached is not None and cached[0] == signature:
+                    cached = (signature, cached[1], now)
+                elif signature is None:
+                    cached = (None, None, now)
+                else:
+                    with open(file_path, 'r', encoding='utf-8') as f:
+                        cached = (signature, json.load(f), now)
+                with self._lock:
+                    self._cache[key] = cached
+            if cached[0] is None:
+                return default
+            return copy.deepcopy(cached[1])
         except Exception as e:
             print(f"Error cargando datos para la clave '{key}': {e}")
             return default
@@ -68,7 +130,11 @@ class LocalStorage:
             bool: True si se eliminó exitosamente, False en caso contrario
         """
         try:
-            file_path = os.path.join(self.storage_path, f"{key}.json")
+            file_path = self._file_path(key)
+            with self._lock:
+                self._cache.pop(key, None)
+                if self._keys is not None:
+                    self._keys.discard(key)
             if os.path.exists(file_path):
                 os.remove(file_path)
                 return True
@@ -85,11 +151,14 @@ class LocalStorage:
             list: Lista de claves disponibles
         """
         try:
-            keys = []
-            for filename in os.listdir(self.storage_path):
-                if filename.endswith('.json'):
-                    keys.append(filename[:-5])  # Remover la extensión .json
-            return keys
+            with self._lock:
+                if self._keys is None:
+                    self._keys = {
+                        filename[:-5]  # Remover la extensión .json
+                        for filename in os.listdir(self.storage_path)
+                        if filename.endswith('.json')
+                    }
+                return sorted(self._keys)
         except Exception as e:
             print(f"Error listando claves: {e}")
             return []
@@ -102,6 +171,9 @@ class LocalStorage:
             bool: True si se limpió exitosamente, False en caso contrario
         """
         try:
+            with self._lock:
+                self._cache.clear()
+                self._keys = set()
             for filename in os.listdir(self.storage_path):
                 if filename.endswith('.json'):
                     file_path = os.path.join(self.storage_path, filename)
@@ -111,14 +183,41 @@ class LocalStorage:
             print(f"Error limpiando almacenamiento: {e}")
             return False
 
+# Estados abiertos que se escriben al cerrar el programa; la referencia débil
+# no los mantiene vivos (un estado con cambios pendientes sigue vivo por su temporizador)
+_open_states = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_open_states():
+    for state in list(_open_states):
+        state.flush()
+
+
 class AppState:
     """
     Gestor del estado de la aplicación
+
+    Los cambios no se escriben al momento: save_state() marca el estado como
+    pendiente y una sola escritura ocurre flush_delay segundos después del
+    primer cambio, o al llamar a flush()/close() o al cerrar el programa.
     """
+
+    # Segundos que se acumulan cambios antes de escribir
+    FLUSH_DELAY = 1.0
     
-    def __init__(self, storage: LocalStorage):
+    def __init__(self, storage: LocalStorage, flush_delay: float = FLUSH_DELAY):
         self.storage = storage
+        self.flush_delay = flush_delay
+        # _lock protege _state, _dirty y _timer; _write_lock mantiene el
+        # orden de las escrituras entre el temporizador y flush()
+        self._lock = threading.RLock()
+        self._write_lock = threading.Lock()
+        self._dirty = False
+        self._timer = None
+        self._closed = False
         self._state = self.load_state()
+        _open_states.add(self)
     
     def load_state(self) -> Dict[str, Any]:
         """Carga el estado desde el almacenamiento local"""
@@ -131,8 +230,59 @@ class AppState:
         })
     
     def save_state(self) -> bool:
-        """Guarda el estado actual en el almacenamiento local"""
-        return self.storage.save_data("app_state", self._state)
+        """
+        Marca el estado como pendiente de guardar y programa la escritura
+
+        Returns:
+            bool: True; con flush_delay <= 0 se escribe al momento y se
+            devuelve el resultado de flush()
+        """
+        with self._lock:
+            self._dirty = True
+            if self.flush_delay > 0:
+                self._schedule()
+                return True
+        return self.flush()
+
+    def _schedule(self):
+        """Programa una escritura si no hay una pendiente (llamar con _lock tomado)"""
+        if self._timer is None and not self._closed:
+            self._timer = threading.Timer(self.flush_delay, self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def flush(self) -> bool:
+        """
+        Escribe el estado pendiente en el almacenamiento local
+
+        Returns:
+            bool: True si no había cambios o se guardó exitosamente
+        """
+        with self._write_lock:
+            with self._lock:
+                if self._timer is not None:
+                    self._timer.cancel()
+                    self._timer = None
+                if not self._dirty:
+                    return True
+                # Se escribe una copia para no bloquear a los setters durante la escritura
+                snapshot = copy.deepcopy(self._state)
+                self._dirty = False
+            saved = self.storage.save_data("app_state", snapshot)
+            if not saved:
+                # El estado sigue pendiente y se reintenta más tarde
+                with self._lock:
+                    self._dirty = True
+                    if self.flush_delay > 0:
+                        self._schedule()
+            return saved
+
+    def close(self) -> bool:
+        """Escribe los cambios pendientes y deja de esperar al cierre del programa"""
+        _open_states.discard(self)
+        with self._lock:
+            self._closed = True
+        return self.flush()
     
     def get_user(self) -> Optional[Dict[str, Any]]:
         """Obtiene el usuario actual"""
@@ -140,12 +290,14 @@ class AppState:
     
     def set_user(self, user: Dict[str, Any]) -> bool:
         """Establece el usuario actual"""
-        self._state["user"] = user
+        with self._lock:
+            self._state["user"] = user
         return self.save_state()
     
     def clear_user(self) -> bool:
         """Limpia el usuario actual"""
-        self._state["user"] = None
+        with self._lock:
+            self._state["user"] = None
         return self.save_state()
     
     def get_current_route(self) -> str:
@@ -154,7 +306,8 @@ class AppState:
     
     def set_current_route(self, route: str) -> bool:
         """Establece la ruta actual"""
-        self._state["current_route"] = route
+        with self._lock:
+            self._state["current_route"] = route
         return self.save_state()
     
     def get_theme(self) -> str:
@@ -163,18 +316,19 @@ class AppState:
     
     def set_theme(self, theme: str) -> bool:
         """Establece el tema"""
-        self._state["theme"] = theme
+        with self._lock:
+            self._state["theme"] = theme
         return self.save_state()
     
     def get_preference(self, key: str, default: Any = None) -> Any:
         """Obtiene una preferencia específica"""
-        return self._state.get("preferences", {}).get(key, default)
+        with self._lock:
+            return self._state.get("preferences", {}).get(key, default)
     
     def set_preference(self, key: str, value: Any) -> bool:
         """Establece una preferencia específica"""
-        if "preferences" not in self._state:
-            self._state["preferences"] = {}
-        self._state["preferences"][key] = value
+        with self._lock:
+            self._state.setdefault("preferences", {})[key] = value
         return self.save_state()
     
     def is_logged_in(self) -> bool:
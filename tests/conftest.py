@@ -22,4 +22,5 @@ def setup_test_db(test_db):
     cursor.execute("DROP TABLE IF EXISTS teacher")
     cursor.execute("DROP TABLE IF EXISTS team")
     cursor.execute("DROP TABLE IF EXISTS user")
+    cursor.execute("DROP TABLE IF EXISTS login_attempt")
     test_db.commit()
@@ -0,0 +1,76 @@
+import pytest
+
+from control.change_events import ChangeBus, ChangeEvent, change_bus
+from control.cicle_repository import CicleRepository
+from control.course_repository import CourseRepository
+
+
+@pytest.fixture
+def events():
+    received = []
+    unsubscribe = change_bus.subscribe(received.append)
+    yield received
+    unsubscribe()
+
+
+def test_repository_writes_publish_events(setup_test_db, test_db, events):
+    """Test insert, update and delete publish the table and affected ids"""
+    repo = CourseRepository(test_db)
+    repo.create_table()
+
+    course_id = repo.insert_row({'name': 'Génesis', 'level': 1})
+    repo.update_row({'level': 2}, {'id': course_id})
+    repo.update_row({'level': 3}, {'id': 999})
+    repo.delete_row({'id': course_id})
+
+    assert events == [
+        ChangeEvent('course', 'insert', (course_id,)),
+        ChangeEvent('course', 'update', (course_id,)),
+        ChangeEvent('course', 'delete', (course_id,)),
+    ]
+
+
+def test_transaction_delivers_after_commit_and_drops_on_rollback(setup_test_db, test_db, events):
+    """Test events inside a transaction wait for the commit and vanish on rollback"""
+    repo = CourseRepository(test_db)
+    repo.create_table()
+
+    with repo.transaction() as cursor:
+        repo.insert_into(cursor, {'name': 'Éxodo'})
+        assert events == []
+    assert [event.action for event in events] == ['insert']
+
+    with pytest.raises(RuntimeError):
+        with repo.transaction() as cursor:
+            repo.insert_into(cursor, {'name': 'Levítico'})
+            raise RuntimeError('abort')
+    assert len(events) == 1
+
+
+def test_cascade_delete_notifies_dependent_tables(setup_test_db, test_db, events):
+    """Test a cascading delete reports the parent id and every dependent table"""
+    repo = CicleRepository(test_db)
+    repo.create_table()
+    repo.classroom_repo.create_table()
+    repo.inscription_repo.create_table()
+    repo.payment_repo.create_table()
+    cicle_id = repo.insert_row({'cicle': 'A1'})
+    events.clear()
+
+    assert repo.delete_cicle_cascade(cicle_id)
+
+    assert events[0] == ChangeEvent('cicle', 'delete', (cicle_id,))
+    assert {event.table for event in events[1:]} == {'classroom', 'inscription', 'payment'}
+    assert all(event.ids is None for event in events[1:])
+
+
+def test_subscribe_filters_tables():
+    """Test a subscriber only sees the tables it asked for"""
+    bus = ChangeBus()
+    seen = []
+    unsubscribe = bus.subscribe(seen.append, tables=('student',))
+    bus.publish('teacher', 'insert', [1])
+    bus.publish('student', 'delete', [2])
+    unsubscribe()
+    bus.publish('student', 'delete', [3])
+    assert seen == [ChangeEvent('student', 'delete', (2,))]
@@ -0,0 +1,29 @@
+import numpy as np
+
+from view.components.chart.chart_cache import ChartCache, data_fingerprint
+
+
+def test_data_fingerprint_is_stable():
+    """Test equal aggregates give equal fingerprints and any change alters it"""
+    data = (np.array([3, 1]), np.array(['Yape', 'Plin']))
+    assert data_fingerprint(data) == data_fingerprint((np.array([3, 1]), np.array(['Yape', 'Plin'])))
+    assert data_fingerprint(data) != data_fingerprint((np.array([3, 2]), np.array(['Yape', 'Plin'])))
+    assert data_fingerprint({'x': [1], 'y': [2]}) == data_fingerprint({'y': [2], 'x': [1]})
+
+
+def test_chart_cache_lru_eviction():
+    """Test the least recently used image is evicted first"""
+    cache = ChartCache(max_entries=2)
+    first = cache.key('pie', (5.5, 4), [1])
+    second = cache.key('bar', (5.5, 4), [1])
+    third = cache.key('pie', (6, 4), [1])
+
+    cache.put(first, b'a')
+    cache.put(second, b'b')
+    assert cache.get(first) == b'a'
+    cache.put(third, b'c')
+
+    assert cache.get(second) is None
+    assert cache.get(first) == b'a'
+    assert cache.get(third) == b'c'
+    assert len(cache) == 2
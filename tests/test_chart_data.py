@@ -0,0 +1,58 @@
+from datetime import date
+
+from control.utils.chart_data import ChartData
+
+
+def create_chart_tables(test_db):
+    data = ChartData(test_db)
+    for repo in (data.team_repo, data.student_repo, data.course_repo, data.classroom_repo,
+                 data.inscription_repo, data.payment_repo):
+        repo.create_table()
+    cursor = test_db.cursor()
+    cursor.executemany("INSERT INTO team (id, name) VALUES (?, ?)", [(1, 'Leones'), (2, 'Águilas')])
+    cursor.executemany(
+        "INSERT INTO student (id, name, id_team, date_of_birth) VALUES (?, ?, ?, ?)",
+        [(1, 'Ana', 1, '2000-03-10'), (2, 'Luis', 1, '2000-03-11'),
+         (3, 'Eva', 2, '1990-01-01'), (4, 'Leo', None, 'sin fecha')]
+    )
+    cursor.executemany("INSERT INTO course (id, name) VALUES (?, ?)", [(1, 'Génesis'), (2, 'Éxodo')])
+    cursor.executemany("INSERT INTO classroom (id, name, id_course) VALUES (?, ?, ?)",
+                       [(1, 'Aula 1', 1), (2, 'Aula 2', 1)])
+    cursor.executemany(
+        "INSERT INTO inscription (id, id_student, id_classroom, date_inscription) VALUES (?, ?, ?, ?)",
+        [(1, 1, 1, '2023-12-20'), (2, 2, 2, '2024-03-02'), (3, 3, 2, '2024-03-30'), (4, 4, 1, '2023-09-01')]
+    )
+    cursor.executemany("INSERT INTO payment (method_payment, id_inscription) VALUES (?, ?)",
+                       [('Yape', 1), ('Efectivo', 2), ('Yape', 3), (None, 4)])
+    test_db.commit()
+    return data
+
+
+def test_grouped_chart_data(setup_test_db, test_db):
+    """Test GROUP BY providers return one entry per group as NumPy arrays"""
+    data = create_chart_tables(test_db)
+
+    counts, methods = data.payments_by_method()
+    assert methods.tolist() == ['Yape', 'Desconocido', 'Efectivo']
+    assert counts.tolist() == [2, 1, 1]
+
+    counts, teams = data.students_by_team()
+    assert teams.tolist() == ['Leones', 'Águilas', 'Sin equipo']
+    assert counts.tolist() == [2, 1, 1]
+
+    counts, courses = data.inscriptions_by_course()
+    assert courses.tolist() == ['Génesis', 'Éxodo']
+    assert counts.tolist() == [4, 0]
+
+
+def test_student_ages_and_monthly_trend(setup_test_db, test_db):
+    """Test real ages from date_of_birth and zero-filled months from date_inscription"""
+    data = create_chart_tables(test_db)
+
+    ages, counts = data.student_ages(date(2024, 3, 10))
+    assert ages.tolist() == [23, 24, 34]
+    assert counts.tolist() == [1, 1, 1]
+
+    trend = data.inscriptions_by_month(months=4, day=date(2024, 3, 15))
+    assert trend['x'].tolist() == ['Dic', 'Ene', 'Feb', 'Mar']
+    assert trend['y'].tolist() == [1, 0, 0, 2]
@@ -100,4 +100,29 @@ def test_delete_cicle(setup_test_db, test_db):
     repo.delete_row({'id': cicle_id})
     
     result = repo.get_row(cicle_id)
-    assert result is None
\ No newline at end of file
+    assert result is None
+
+def test_delete_cicle_cascade(setup_test_db, test_db):
+    """Test cascade delete removes classrooms, inscriptions and payments of the cycle only"""
+    repo = CicleRepository(test_db)
+    repo.create_table()
+    repo.classroom_repo.create_table()
+    repo.inscription_repo.create_table()
+    repo.payment_repo.create_table()
+
+    cursor = test_db.cursor()
+    cursor.executemany('INSERT INTO cicle (id, cicle) VALUES (?, ?)', [(1, 'A1'), (2, 'B1')])
+    cursor.executemany('INSERT INTO classroom (id, name, id_cicle) VALUES (?, ?, ?)',
+                       [(1, 'Aula 1', 1), (2, 'Aula 2', 1), (3, 'Aula 3', 2)])
+    cursor.executemany('INSERT INTO inscription (id, id_student, id_classroom) VALUES (?, ?, ?)',
+                       [(1, 1, 1), (2, 2, 2), (3, 3, 3)])
+    cursor.executemany('INSERT INTO payment (amount, id_inscription) VALUES (?, ?)',
+                       [(10, 1), (20, 2), (30, 3)])
+    test_db.commit()
+
+    assert repo.delete_cicle_cascade(1) is True
+
+    assert cursor.execute('SELECT id FROM cicle').fetchall() == [(2,)]
+    assert cursor.execute('SELECT id FROM classroom').fetchall() == [(3,)]
+    assert cursor.execute('SELECT id FROM inscription').fetchall() == [(3,)]
+    assert cursor.execute('SELECT id_inscription FROM payment').fetchall() == [(3,)]
@@ -105,4 +105,59 @@ def test_delete_classroom(setup_test_db, test_db):
     repo.delete_row({'id': classroom_id})
     
     result = repo.get_row(classroom_id)
-    assert result is None
\ No newline at end of file
+    assert result is None
+
+def test_delete_classroom_cascade_native(setup_test_db, test_db):
+    """Test ON DELETE CASCADE removes inscriptions and payments with a single DELETE"""
+    test_db.execute('PRAGMA foreign_keys = ON')
+    repo = ClassroomRepository(test_db)
+    repo.create_table()
+    repo.inscription_repo.create_table()
+    repo.payment_repo.create_table()
+    cursor = test_db.cursor()
+    for parent in ('teacher', 'course', 'cicle', 'student'):
+        cursor.execute(f'CREATE TABLE {parent} (id INTEGER PRIMARY KEY)')
+
+    cursor.executemany('INSERT INTO classroom (id, name) VALUES (?, ?)', [(1, 'Aula 1'), (2, 'Aula 2')])
+    cursor.executemany('INSERT INTO inscription (id, id_classroom) VALUES (?, ?)', [(1, 1), (2, 2)])
+    cursor.executemany('INSERT INTO payment (amount, id_inscription) VALUES (?, ?)', [(10, 1), (20, 2)])
+    test_db.commit()
+
+    assert repo.cascades_natively(cursor) is True
+    assert repo.delete_classroom_cascade(1) is True
+
+    assert cursor.execute('SELECT id FROM classroom').fetchall() == [(2,)]
+    assert cursor.execute('SELECT id FROM inscription').fetchall() == [(2,)]
+    assert cursor.execute('SELECT id_inscription FROM payment').fetchall() == [(2,)]
+    test_db.execute('PRAGMA foreign_keys = OFF')
+
+
+def test_dependency_graph_is_cached_per_database(tmp_path):
+    """Test deletes read the foreign key graph once per schema version of a database file"""
+    import sqlite3
+
+    conn = sqlite3.connect(str(tmp_path / 'academy.db'))
+    try:
+        conn.execute('PRAGMA foreign_keys = ON')
+        repo = ClassroomRepository(conn)
+        repo.create_table()
+        repo.inscription_repo.create_table()
+        cursor = conn.cursor()
+
+        statements = []
+        conn.set_trace_callback(statements.append)
+        try:
+            assert repo.cascades_natively(cursor) is True
+            first = sum('foreign_key_list' in sql for sql in statements)
+            assert repo.cascades_natively(cursor) is True
+        finally:
+            conn.set_trace_callback(None)
+        assert first > 0
+        assert sum('foreign_key_list' in sql for sql in statements) == first
+        assert 'inscription' not in repo._reference_graph(cursor)
+
+        # A schema change is picked up without clearing anything
+        repo.payment_repo.create_table()
+        assert [child for child, _ in repo._reference_graph(cursor)['inscription']] == ['payment']
+    finally:
+        conn.close()
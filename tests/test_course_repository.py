@@ -88,4 +88,33 @@ def test_delete_course(setup_test_db, test_db):
     repo.delete_row({'id': course_id})
     
     result = repo.get_row(course_id)
-    assert result is None
\ No newline at end of file
+    assert result is None
+
+def test_course_count_and_page(setup_test_db, test_db):
+    """Test COUNT(*) and LIMIT/OFFSET paging with filters"""
+    repo = CourseRepository(test_db)
+    repo.create_table()
+    repo.insert_rows([{'name': f'Curso {i}', 'level': 1 if i <= 15 else 2} for i in range(1, 26)])
+
+    assert repo.count() == 25
+    assert repo.count(where={'level': 2}) == 10
+
+    page = repo.get_page(page=2, per_page=10, where={'level': 1})
+    assert page['total'] == 15
+    assert page['pages'] == 2
+    assert [row['id'] for row in page['rows']] == [11, 12, 13, 14, 15]
+
+    page = repo.get_page(page=9, per_page=10)
+    assert page['page'] == 3
+    assert len(page['rows']) == 5
+
+
+def test_get_row_by_id(setup_test_db, test_db):
+    """Test primary-key lookup returns a dictionary or None"""
+    repo = CourseRepository(test_db)
+    repo.create_table()
+    repo.insert_row({'name': 'Génesis', 'level': 1})
+    course_id = repo.insert_row({'name': 'Génesis', 'level': 2})
+
+    assert repo.get_row_by_id(course_id)['level'] == 2
+    assert repo.get_row_by_id(999) is None
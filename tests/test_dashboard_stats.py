@@ -0,0 +1,28 @@
+from datetime import date
+
+from control.utils.dashboard_stats import DashboardStats, month_range
+
+
+def test_month_range():
+    """Test the month range rolls over at December"""
+    assert month_range(date(2024, 3, 17)) == ('2024-03-01', '2024-04-01')
+    assert month_range(date(2024, 12, 5)) == ('2024-12-01', '2025-01-01')
+
+
+def test_dashboard_statistics(setup_test_db, test_db):
+    """Test headline indicators come from counts and the month of date_inscription"""
+    stats = DashboardStats(test_db)
+    stats.student_repo.create_table()
+    stats.classroom_repo.create_table()
+    stats.inscription_repo.create_table()
+    cursor = test_db.cursor()
+    cursor.executemany('INSERT INTO student (name, lastname) VALUES (?, ?)',
+                       [('Ana', 'Pérez'), ('Luis', 'Gómez'), ('Eva', 'Ruiz')])
+    cursor.executemany('INSERT INTO classroom (name) VALUES (?)', [('Aula 1',), ('Aula 2',)])
+    cursor.executemany('INSERT INTO inscription (id_student, date_inscription) VALUES (?, ?)',
+                       [(1, '2024-02-28'), (1, '2024-03-01'), (2, '2024-03-31'), (3, '2024-04-01')])
+    test_db.commit()
+
+    result = stats.get_statistics(date(2024, 3, 10))
+
+    assert result == {'total_students': 3, 'active_classrooms': 2, 'monthly_inscriptions': 2}
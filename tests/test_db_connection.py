@@ -0,0 +1,96 @@
+import threading
+
+import pytest
+
+from control.bd.db_connection import ConnectionPool, Connection, PRAGMA_PROFILES
+
+
+def test_pool_reuses_handle(tmp_path):
+    """Test that sequential checkouts reuse the same pooled handle"""
+    pool = ConnectionPool(str(tmp_path / "pool.db"), size=2)
+    with pool.connection() as first:
+        pass
+    with pool.connection() as second:
+        pass
+    assert first is second
+    pool.close_all()
+
+
+def test_pool_nested_checkout_same_thread(tmp_path):
+    """Test that nested checkouts in one thread share the handle"""
+    pool = ConnectionPool(str(tmp_path / "pool.db"), size=1)
+    with pool.connection() as outer:
+        with pool.connection() as inner:
+            assert outer is inner
+    pool.close_all()
+
+
+def test_pool_per_thread_handles(tmp_path):
+    """Test that concurrent threads get distinct handles"""
+    pool = ConnectionPool(str(tmp_path / "pool.db"), size=2)
+    seen = []
+    barrier = threading.Barrier(2)
+
+    def worker():
+        with pool.connection() as conn:
+            seen.append(id(conn))
+            barrier.wait()
+
+    threads = [threading.Thread(target=worker) for _ in range(2)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len(set(seen)) == 2
+    pool.close_all()
+
+
+def test_pool_replaces_unhealthy_handle(tmp_path):
+    """Test that a closed idle handle fails the health check and is replaced"""
+    pool = ConnectionPool(str(tmp_path / "pool.db"), size=1)
+    with pool.connection() as conn:
+        pass
+    conn.close()
+    with pool.connection() as fresh:
+        assert fresh is not conn
+        assert fresh.execute("SELECT 1").fetchone() == (1,)
+    pool.close_all()
+
+
+def test_pool_commits_on_exit(tmp_path):
+    """Test that writes are committed when the checkout ends"""
+    pool = ConnectionPool(str(tmp_path / "pool.db"), size=1)
+    with pool.connection() as conn:
+        conn.execute("CREATE TABLE item (id INTEGER)")
+        conn.execute("INSERT INTO item VALUES (1)")
+    pool.close_all()
+
+    other = ConnectionPool(str(tmp_path / "pool.db"), size=1)
+    with other.connection() as conn:
+        assert conn.execute("SELECT COUNT(*) FROM item").fetchone() == (1,)
+    other.close_all()
+
+
+def test_pool_applies_pragma_profile(tmp_path):
+    """Test that pooled handles open with the fast PRAGMA profile"""
+    pool = ConnectionPool(str(tmp_path / "pool.db"), size=1, pragmas=PRAGMA_PROFILES["fast"])
+    with pool.connection() as conn:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1      # NORMAL
+        assert conn.execute("PRAGMA foreign_keys").fetchone()[0] == 1
+        assert conn.execute("PRAGMA temp_store").fetchone()[0] == 2       # MEMORY
+    pool.close_all()
+
+
+def test_configure_pragmas_switches_profile(tmp_path, monkeypatch):
+    """Test the durable/fast preset switch and single PRAGMA overrides"""
+    monkeypatch.setattr(Connection, "DB_NAME", str(tmp_path / "academy.db"))
+    try:
+        Connection.configure_pragmas("durable", cache_size=-1000)
+        with Connection.acquire() as conn:
+            assert conn.execute("PRAGMA synchronous").fetchone()[0] == 2  # FULL
+            assert conn.execute("PRAGMA cache_size").fetchone()[0] == -1000
+        with pytest.raises(ValueError):
+            Connection.configure_pragmas("unknown")
+    finally:
+        Connection.configure_pragmas("fast")
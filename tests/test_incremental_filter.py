@@ -0,0 +1,90 @@
+from control.student_repository import StudentRepository
+from control.team_repository import TeamRepository
+from control.utils.incremental_filter import IncrementalFilter
+
+
+def make_students(test_db):
+    repo = StudentRepository(test_db)
+    repo.create_table()
+    for name, lastname, phone, team in [
+        ('Ana', 'Pérez', '987111', 1),
+        ('Andrés', 'Díaz', '987222', 2),
+        ('Luis', 'Anaya', '955333', 1),
+        ('Marta', 'Ruiz', '987444', None),
+    ]:
+        repo.insert_row({'name': name, 'lastname': lastname, 'phone': phone, 'id_team': team})
+    return repo
+
+
+def test_text_filter_narrows_previous_matches(setup_test_db, test_db):
+    """Test partial, case-insensitive search over several columns and narrowing"""
+    repo = make_students(test_db)
+    engine = IncrementalFilter(repo, {'name': ('name', 'lastname'), 'phone': ('phone',)}, exact=('id_team',))
+    try:
+        assert engine.match({'name': 'an'}) == [1, 2, 3]
+        assert engine.match({'name': 'ana'}) == [1, 3]
+        assert engine.match({'name': 'ana'}, {'id_team': 1}) == [1, 3]
+        assert engine.match({'name': 'an', 'phone': '987'}) == [1, 2]
+        assert engine.match() == [1, 2, 3, 4]
+    finally:
+        engine.close()
+
+
+def test_writes_invalidate_cached_rows(setup_test_db, test_db):
+    """Test the cached projection is reloaded after a write to the table"""
+    repo = make_students(test_db)
+    engine = IncrementalFilter(repo, {'name': ('name', 'lastname')})
+    try:
+        assert engine.match({'name': 'mar'}) == [4]
+        new_id = repo.insert_row({'name': 'Mariela', 'lastname': 'Soto'})
+        assert engine.match({'name': 'mari'}) == [new_id]
+        repo.delete_row({'id': new_id})
+        assert engine.match({'name': 'mari'}) == []
+    finally:
+        engine.close()
+
+
+def test_exact_and_range_filters(setup_test_db, test_db):
+    """Test equality and min/max bounds, skipping rows without a value"""
+    repo = TeamRepository(test_db)
+    repo.create_table()
+    repo.insert_row({'name': 'Niños', 'gender': 'Mixto', 'age_start': 6, 'age_end': 11})
+    repo.insert_row({'name': 'Jóvenes', 'gender': 'Mixto', 'age_start': 12, 'age_end': 25})
+    repo.insert_row({'name': 'Damas', 'gender': 'Femenino', 'age_start': 18, 'age_end': None})
+    engine = IncrementalFilter(repo, {'name': ('name',)}, exact=('gender',), ranges=('age_start', 'age_end'))
+    try:
+        assert engine.match(exact={'gender': 'Mixto'}) == [1, 2]
+        assert engine.match(ranges={'age_start': (12, None)}) == [2, 3]
+        assert engine.match(ranges={'age_end': (None, 20)}) == [1]
+    finally:
+        engine.close()
+
+
+def test_get_page_by_ids_keeps_order(setup_test_db, test_db):
+    """Test paging an id list keeps its order and clamps the page"""
+    repo = make_students(test_db)
+    page = repo.get_page_by_ids([4, 3, 1], page=1, per_page=2)
+    assert [row['id'] for row in page['rows']] == [4, 3]
+    assert (page['total'], page['pages']) == (3, 2)
+    page = repo.get_page_by_ids([4, 3, 1], page=9, per_page=2)
+    assert page['page'] == 2
+    assert [row['id'] for row in page['rows']] == [1]
+
+
+def test_search_criterion_uses_fts_index(setup_test_db, test_db):
+    """Test the delegated text criterion is ranked by the search index and combined with the rest"""
+    repo = make_students(test_db)
+    repo.create_search_index()
+    engine = IncrementalFilter(repo, {'name': ('name', 'lastname'), 'phone': ('phone',)},
+                               exact=('id_team',), search='name')
+    try:
+        # Accent-insensitive word prefixes from the index
+        assert engine.match({'name': 'andres'}) == [2]
+        assert sorted(engine.match({'name': 'ana'})) == [1, 3]
+        assert engine.match({'name': 'ana'}, {'id_team': 1}) in ([1, 3], [3, 1])
+        assert engine.match({'name': 'ana', 'phone': '955'}) == [3]
+        # Shorter texts keep the in-memory substring search
+        assert engine.match({'name': 'a'}) == [1, 2, 3, 4]
+        assert engine.match({'phone': '987'}, {'id_team': 2}) == [2]
+    finally:
+        engine.close()
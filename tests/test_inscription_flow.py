@@ -0,0 +1,98 @@
+from control.utils.inscription_flow import InscriptionFlowManager
+
+
+def create_flow_tables(test_db):
+    flow = InscriptionFlowManager(test_db)
+    flow.student_repo.create_table()
+    flow.classroom_repo.create_table()
+    flow.inscription_repo.create_table()
+    flow.payment_repo.create_table()
+    cursor = test_db.cursor()
+    cursor.executemany('INSERT INTO student (id, name, lastname) VALUES (?, ?, ?)',
+                       [(1, 'Ana', 'Pérez'), (2, 'Luis', 'Gómez')])
+    cursor.execute("INSERT INTO classroom (id, name) VALUES (1, 'Aula 1')")
+    test_db.commit()
+    return flow
+
+
+def test_create_inscriptions_bulk(setup_test_db, test_db):
+    """Test bulk enrollment inserts valid records and reports invalid ones in order"""
+    flow = create_flow_tables(test_db)
+    base = {'classroom_id': 1, 'year': 2024, 'cycle': 'A1', 'type_material': 'Libro',
+            'payment_method': 'Efectivo', 'amount': 100}
+    records = [
+        {**base, 'student_id': 1},
+        {**base, 'student_id': 99},
+        {**base, 'student_id': 2, 'amount': 80},
+        {**base, 'student_id': 1, 'classroom_id': 7},
+    ]
+
+    result = flow.create_inscriptions_bulk(iter(records))
+
+    assert result['success'] is True
+    assert result['created'] == 2
+    assert result['failed'] == 2
+    results = result['results']
+    assert results[0]['success'] and results[0]['student_name'] == 'Ana Pérez'
+    assert results[1] == {'success': False, 'error': 'Estudiante no encontrado'}
+    assert results[2]['success'] and results[2]['classroom_name'] == 'Aula 1'
+    assert results[3] == {'success': False, 'error': 'Aula no encontrada'}
+
+    cursor = test_db.cursor()
+    cursor.execute('SELECT id, id_student FROM inscription ORDER BY id')
+    assert cursor.fetchall() == [(results[0]['inscription_id'], 1), (results[2]['inscription_id'], 2)]
+    cursor.execute('SELECT id_inscription, amount FROM payment ORDER BY id')
+    assert cursor.fetchall() == [(results[0]['inscription_id'], 100), (results[2]['inscription_id'], 80)]
+
+
+def test_create_inscriptions_bulk_parses_text_ids(setup_test_db, test_db):
+    """Test ids typed in forms are converted and malformed ones are rejected clearly"""
+    flow = create_flow_tables(test_db)
+    base = {'year': 2024, 'cycle': 'A1', 'type_material': 'Libro',
+            'payment_method': 'Efectivo', 'amount': 100}
+    records = [
+        {**base, 'student_id': ' 1 ', 'classroom_id': '1'},
+        {**base, 'student_id': 'abc', 'classroom_id': 1},
+        {**base, 'student_id': 2, 'classroom_id': None},
+    ]
+
+    result = flow.create_inscriptions_bulk(records)
+
+    assert result['created'] == 1
+    results = result['results']
+    assert results[0]['success'] and results[0]['student_name'] == 'Ana Pérez'
+    assert results[1] == {'success': False, 'error': "ID de estudiante inválido: 'abc'"}
+    assert results[2] == {'success': False, 'error': 'ID de aula inválido: None'}
+    cursor = test_db.cursor()
+    cursor.execute('SELECT id_student, id_classroom FROM inscription')
+    assert cursor.fetchall() == [(1, 1)]
+
+
+def test_create_inscriptions_bulk_without_valid_records(setup_test_db, test_db):
+    """Test a batch where every record fails is not reported as a success"""
+    flow = create_flow_tables(test_db)
+    result = flow.create_inscriptions_bulk([{'student_id': 99, 'classroom_id': 1}])
+
+    assert result['success'] is False
+    assert result['created'] == 0
+    assert result['failed'] == 1
+    assert result['error'] == 'No se creó ninguna inscripción'
+
+
+def test_get_student_inscriptions_groups_payments(setup_test_db, test_db):
+    """Test payments are grouped per inscription with exact id matching"""
+    flow = create_flow_tables(test_db)
+    cursor = test_db.cursor()
+    cursor.executemany('INSERT INTO inscription (id, id_student, id_classroom) VALUES (?, ?, ?)',
+                       [(1, 1, 1), (11, 1, 1), (21, 2, 1)])
+    cursor.executemany('INSERT INTO payment (amount, id_inscription) VALUES (?, ?)',
+                       [(10, 1), (20, 11), (30, 11), (40, 21)])
+    test_db.commit()
+
+    result = flow.get_student_inscriptions(1)
+
+    assert result['success'] is True
+    inscriptions = result['inscriptions']
+    assert [inscription['id'] for inscription in inscriptions] == [1, 11]
+    assert [payment['amount'] for payment in inscriptions[0]['payments']] == [10]
+    assert [payment['amount'] for payment in inscriptions[1]['payments']] == [20, 30]
@@ -134,3 +134,126 @@ def test_delete_inscription(setup_test_db, test_db):
     
     result = repo.get_row(inscription_id)
     assert result is None
+
+
+def test_create_inscription_indexes(setup_test_db, test_db):
+    """Test declared indexes are created idempotently and used for lookups"""
+    repo = InscriptionRepository(test_db)
+    repo.create_table()
+    repo.create_indexes()
+    repo.create_indexes()
+
+    cursor = test_db.cursor()
+    cursor.execute("SELECT name FROM sqlite_master WHERE type='index' AND tbl_name='inscription'")
+    names = {row[0] for row in cursor.fetchall()}
+    assert names == {'idx_inscription_id_classroom', 'idx_inscription_id_student',
+                     'idx_inscription_date_inscription'}
+
+    cursor.execute("EXPLAIN QUERY PLAN SELECT * FROM inscription WHERE id_classroom = ?", (1,))
+    plan = " ".join(str(row[-1]) for row in cursor.fetchall())
+    assert 'idx_inscription_id_classroom' in plan
+
+
+def test_create_indexes_drops_stale_managed_index(setup_test_db, test_db):
+    """Test an index no longer declared by the repository is removed"""
+    repo = InscriptionRepository(test_db)
+    repo.create_table()
+    cursor = test_db.cursor()
+    cursor.execute("CREATE INDEX idx_inscription_year ON inscription (year)")
+    test_db.commit()
+
+    repo.create_indexes()
+
+    cursor.execute("SELECT name FROM sqlite_master WHERE type='index' AND name='idx_inscription_year'")
+    assert cursor.fetchone() is None
+
+
+def test_create_indexes_keeps_unmanaged_lookalike_index(setup_test_db, test_db):
+    """Test an index whose name only matches the managed prefix through LIKE wildcards is kept"""
+    repo = InscriptionRepository(test_db)
+    repo.create_table()
+    cursor = test_db.cursor()
+    cursor.execute("CREATE INDEX idx1inscriptionXyear ON inscription (year)")
+    cursor.execute("CREATE INDEX IDX_INSCRIPTION_cycle ON inscription (cycle)")
+    test_db.commit()
+
+    repo.create_indexes()
+
+    cursor.execute("SELECT name FROM sqlite_master WHERE type='index' AND tbl_name='inscription'")
+    names = {row[0] for row in cursor.fetchall()}
+    assert {'idx1inscriptionXyear', 'IDX_INSCRIPTION_cycle'} <= names
+
+
+def test_create_inscription_with_payment(setup_test_db, test_db):
+    """Test inscription and payment are created together with their real ids"""
+    repo = InscriptionRepository(test_db)
+    repo.create_table()
+    repo.payment_repo.create_table()
+    inscription_data = {
+        'id_student': 5,
+        'id_classroom': 50,
+        'year': 2024,
+        'cycle': 'A1',
+        'type_material': 'Libro'
+    }
+    payment_data = {'method_payment': 'Efectivo', 'amount': 150}
+
+    result = repo.create_inscription_with_payment(inscription_data, payment_data)
+
+    assert result['success'] is True
+    cursor = test_db.cursor()
+    cursor.execute('SELECT id FROM inscription WHERE id_classroom = ?', (50,))
+    assert cursor.fetchone()[0] == result['inscription_id']
+    cursor.execute('SELECT id, id_inscription, amount FROM payment')
+    assert cursor.fetchall() == [(result['payment_id'], result['inscription_id'], 150)]
+    assert 'id_inscription' not in payment_data
+
+
+def test_insert_many_into_ids_after_deleting_highest_rows(setup_test_db, test_db):
+    """Test bulk inserts return the real ids when the AUTOINCREMENT sequence is ahead of MAX(id)"""
+    repo = InscriptionRepository(test_db)
+    repo.create_table()
+    with repo.transaction(immediate=True) as cursor:
+        repo.insert_many_into(cursor, [{'id_student': n, 'id_classroom': 1} for n in range(1, 4)])
+    repo.delete_row({'id': 3})
+
+    with repo.transaction(immediate=True) as cursor:
+        ids = repo.insert_many_into(cursor, [{'id_student': 7, 'id_classroom': 1},
+                                             {'id_student': 8, 'id_classroom': 1}])
+        explicit = repo.insert_many_into(cursor, [{'id': 20, 'id_student': 9, 'id_classroom': 1}])
+
+    assert ids == [4, 5]
+    assert explicit == [20]
+    cursor = test_db.cursor()
+    cursor.execute('SELECT id, id_student FROM inscription WHERE id >= 4 ORDER BY id')
+    assert cursor.fetchall() == [(4, 7), (5, 8), (20, 9)]
+
+
+def test_get_classroom_roster(setup_test_db, test_db):
+    """Test roster joins student and team and counts payments per inscription"""
+    from control.student_repository import StudentRepository
+    from control.team_repository import TeamRepository
+    from control.payment_repository import PaymentRepository
+
+    repo = InscriptionRepository(test_db)
+    students = StudentRepository(test_db)
+    teams = TeamRepository(test_db)
+    payments = PaymentRepository(test_db)
+    for r in (repo, students, teams, payments):
+        r.create_table()
+
+    team_id = teams.insert_row({'name': 'Jóvenes'})
+    ana = students.insert_row({'name': 'Ana', 'lastname': 'Pérez', 'id_team': team_id})
+    luis = students.insert_row({'name': 'Luis', 'lastname': 'Soto'})
+    first = repo.insert_row({'id_student': ana, 'id_classroom': 1})
+    second = repo.insert_row({'id_student': luis, 'id_classroom': 1})
+    repo.insert_row({'id_student': ana, 'id_classroom': 2})
+    repo.insert_row({'id_student': 999, 'id_classroom': 1})
+    payments.insert_row({'id_inscription': first, 'amount': 50})
+    payments.insert_row({'id_inscription': first, 'amount': 100})
+
+    roster = repo.get_classroom_roster(1)
+    assert [(row['id'], row['student_name'], row['team_name'], row['payment_count']) for row in roster] == [
+        (first, 'Ana', 'Jóvenes', 2),
+        (second, 'Luis', None, 0),
+    ]
@@ -0,0 +1,214 @@
+import json
+import os
+
+from control.utils.local_storage import AppState, LocalStorage
+
+
+def test_save_data_replaces_file_atomically(tmp_path):
+    """Test that saving leaves only the final JSON file, without temporaries"""
+    storage = LocalStorage(str(tmp_path))
+    assert storage.save_data('config', {'a': 1})
+    assert storage.save_data('config', {'a': 2})
+    assert os.listdir(tmp_path) == ['config.json']
+    assert storage.load_data('config') == {'a': 2}
+
+
+def test_save_data_failure_keeps_previous_file(tmp_path):
+    """Test that a value that cannot be serialized does not corrupt the stored one"""
+    storage = LocalStorage(str(tmp_path))
+    storage.save_data('config', {'a': 1})
+    assert not storage.save_data('config', {'a': object()})
+    assert os.listdir(tmp_path) == ['config.json']
+    assert storage.load_data('config') == {'a': 1}
+
+
+def test_app_state_coalesces_writes(tmp_path, monkeypatch):
+    """Test that several changes cost a single write on flush"""
+    storage = LocalStorage(str(tmp_path))
+    writes = []
+    save_data = storage.save_data
+    monkeypatch.setattr(storage, 'save_data', lambda key, data: writes.append(key) or save_data(key, data))
+
+    state = AppState(storage, flush_delay=60)
+    try:
+        state.set_current_route('dashboard')
+        state.set_theme('dark')
+        state.set_preference('page_size', 20)
+        assert writes == []
+        assert state.get_theme() == 'dark'
+
+        assert state.flush()
+        assert writes == ['app_state']
+        assert state.flush()
+        assert writes == ['app_state']
+    finally:
+        state.close()
+
+    with open(tmp_path / 'app_state.json', encoding='utf-8') as f:
+        saved = json.load(f)
+    assert saved['current_route'] == 'dashboard'
+    assert saved['preferences'] == {'page_size': 20}
+    assert AppState(storage, flush_delay=0).get_theme() == 'dark'
+
+
+def test_app_state_flushes_after_delay(tmp_path):
+    """Test that the timer writes the pending state by itself"""
+    storage = LocalStorage(str(tmp_path))
+    state = AppState(storage, flush_delay=0.05)
+    try:
+        state.set_user({'id': 1, 'user': 'admin'})
+        state._timer.join(1)
+        assert storage.load_data('app_state')['user'] == {'id': 1, 'user': 'admin'}
+    finally:
+        state.close()
+
+
+def test_app_state_setters_race_with_flush(tmp_path, monkeypatch):
+    """Test that changes made while flushes run are never lost or torn"""
+    import threading
+
+    storage = LocalStorage(str(tmp_path))
+    results = []
+    save_data = storage.save_data
+    monkeypatch.setattr(storage, 'save_data', lambda key, data: results.append(save_data(key, data)) or results[-1])
+
+    state = AppState(storage, flush_delay=60)
+    done = threading.Event()
+
+    def change():
+        for i in range(2000):
+            state.set_preference(f'key{i % 50}', i)
+            state.set_current_route(f'route{i}')
+        done.set()
+
+    writer = threading.Thread(target=change)
+    writer.start()
+    while not done.is_set():
+        state.flush()
+    writer.join()
+    state.close()
+
+    assert results and all(results)
+    saved = storage.load_data('app_state')
+    assert saved['current_route'] == 'route1999'
+    assert saved['preferences']['key49'] == 1999
+
+
+def test_app_state_retries_failed_flush(tmp_path, monkeypatch):
+    """Test that a failed write keeps the state dirty and schedules another one"""
+    storage = LocalStorage(str(tmp_path))
+    state = AppState(storage, flush_delay=60)
+    try:
+        monkeypatch.setattr(storage, 'save_data', lambda key, data: False)
+        state.set_theme('dark')
+        assert not state.flush()
+        assert state._dirty and state._timer is not None
+
+        monkeypatch.undo()
+        assert state.flush()
+        assert storage.load_data('app_state')['theme'] == 'dark'
+    finally:
+        state.close()
+
+
+def test_app_states_are_not_kept_alive_for_exit(tmp_path):
+    """Test exit flushing tracks live states weakly and closed states not at all"""
+    import gc
+    from control.utils import local_storage
+
+    storage = LocalStorage(str(tmp_path))
+    state = AppState(storage, flush_delay=60)
+    assert state in local_storage._open_states
+    state.close()
+    assert state not in local_storage._open_states
+
+    before = len(local_storage._open_states)
+    AppState(storage, flush_delay=60)
+    gc.collect()
+    assert len(local_storage._open_states) == before
+
+
+def test_exit_flush_writes_open_states(tmp_path):
+    """Test the exit hook writes pending changes of states still open"""
+    from control.utils import local_storage
+
+    storage = LocalStorage(str(tmp_path))
+    state = AppState(storage, flush_delay=60)
+    state.set_theme('dark')
+    local_storage._flush_open_states()
+    assert storage.load_data('app_state')['theme'] == 'dark'
+    state.close()
+
+
+def test_load_data_reads_file_once(tmp_path, monkeypatch):
+    """Test that repeated loads come from memory and return independent copies"""
+    storage = LocalStorage(str(tmp_path))
+    storage.save_data('config', {'items': [1]})
+    storage._cache.clear()
+
+    loads = []
+    json_load = json.load
+    monkeypatch.setattr(json, 'load', lambda f: loads.append(1) or json_load(f))
+
+    first = storage.load_data('config')
+    first['items'].append(2)
+    assert storage.load_data('config') == {'items': [1]}
+    assert len(loads) == 1
+
+
+def test_load_data_sees_external_changes(tmp_path):
+    """Test that a file changed outside the instance is read again"""
+    storage = LocalStorage(str(tmp_path), stat_interval=0)
+    storage.save_data('config', {'a': 1})
+    assert storage.load_data('config') == {'a': 1}
+
+    with open(tmp_path / 'config.json', 'w', encoding='utf-8') as f:
+        json.dump({'a': 22}, f)
+    assert storage.load_data('config') == {'a': 22}
+
+    os.remove(tmp_path / 'config.json')
+    assert storage.load_data('config', 'missing') == 'missing'
+
+
+def test_load_data_throttles_stat(tmp_path, monkeypatch):
+    """Test that cached keys are checked on disk at most once per interval"""
+    storage = LocalStorage(str(tmp_path), stat_interval=60)
+    storage.save_data('config', {'a': 1})
+
+    calls = []
+    real_signature = LocalStorage._signature
+    monkeypatch.setattr(LocalStorage, '_signature',
+                        staticmethod(lambda path: calls.append(path) or real_signature(path)))
+    for _ in range(5):
+        assert storage.load_data('config') == {'a': 1}
+    assert storage.load_data('absent', 'missing') == 'missing'
+    assert storage.load_data('absent', 'missing') == 'missing'
+    assert len(calls) == 1
+
+    storage.save_data('config', {'a': 2})
+    assert storage.load_data('config') == {'a': 2}
+    storage.delete_data('config')
+    assert storage.load_data('config', 'missing') == 'missing'
+
+    with open(tmp_path / 'config.json', 'w', encoding='utf-8') as f:
+        json.dump({'a': 3}, f)
+    storage.stat_interval = 0
+    assert storage.load_data('config') == {'a': 3}
+
+
+def test_list_keys_uses_index(tmp_path, monkeypatch):
+    """Test that the key index follows save, delete and clear without listing the directory"""
+    storage = LocalStorage(str(tmp_path))
+    storage.save_data('a', 1)
+    assert storage.list_keys() == ['a']
+
+    monkeypatch.setattr(os, 'listdir', lambda path: [])
+    storage.save_data('b', 2)
+    assert storage.list_keys() == ['a', 'b']
+    storage.delete_data('a')
+    assert storage.list_keys() == ['b']
+
+    monkeypatch.undo()
+    storage.clear_all()
+    assert storage.list_keys() == []
+    assert os.listdir(tmp_path) == []
@@ -0,0 +1,78 @@
+import pytest
+
+from control.session.login_attempt_repository import LoginAttemptRepository
+from control.session.login_throttle import (
+    LoginThrottle, LoginLockedError, FREE_ATTEMPTS, SESSION_FREE_ATTEMPTS,
+    BASE_LOCK_SECONDS, MAX_LOCK_SECONDS, lock_seconds
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def repo(setup_test_db, test_db):
+    repo = LoginAttemptRepository(test_db)
+    repo.create_table()
+    return repo
+
+
+def make_authenticate(calls, password='clave'):
+    def authenticate(user, given):
+        calls.append(user)
+        return {'user': user} if given == password else None
+    return authenticate
+
+
+def test_lock_seconds_backoff():
+    """Test lockouts double after the free attempts and are capped"""
+    assert lock_seconds(FREE_ATTEMPTS - 1, FREE_ATTEMPTS) == 0
+    assert lock_seconds(FREE_ATTEMPTS, FREE_ATTEMPTS) == BASE_LOCK_SECONDS
+    assert lock_seconds(FREE_ATTEMPTS + 2, FREE_ATTEMPTS) == BASE_LOCK_SECONDS * 4
+    assert lock_seconds(FREE_ATTEMPTS + 50, FREE_ATTEMPTS) == MAX_LOCK_SECONDS
+
+
+def test_locked_attempts_skip_verification(repo):
+    """Test a locked username is rejected without calling authenticate"""
+    clock, calls = FakeClock(), []
+    throttle = LoginThrottle(repo, clock)
+    authenticate = make_authenticate(calls)
+
+    for _ in range(FREE_ATTEMPTS):
+        assert throttle.authenticate(authenticate, 'Admin', 'mal') is None
+    with pytest.raises(LoginLockedError) as locked:
+        throttle.authenticate(authenticate, 'admin', 'clave')
+    assert locked.value.seconds == BASE_LOCK_SECONDS
+    assert len(calls) == FREE_ATTEMPTS
+
+    clock.now += BASE_LOCK_SECONDS
+    assert throttle.authenticate(authenticate, 'admin', 'clave') == {'user': 'admin'}
+    assert throttle.check('admin') == 0
+    assert repo.get_lockout('admin') == (0, 0.0)
+
+
+def test_lockout_survives_restart(repo):
+    """Test a persisted lockout is enforced by a new throttle instance"""
+    clock = FakeClock()
+    throttle = LoginThrottle(repo, clock)
+    for _ in range(FREE_ATTEMPTS + 1):
+        throttle.record_failure('secretaria')
+
+    restarted = LoginThrottle(repo, clock)
+    assert restarted.check('secretaria') == BASE_LOCK_SECONDS * 2
+    assert restarted.check('otro') == 0
+
+
+def test_session_counter_spans_usernames(repo):
+    """Test many failures with different usernames lock the whole session"""
+    clock = FakeClock()
+    throttle = LoginThrottle(repo, clock)
+    for i in range(SESSION_FREE_ATTEMPTS):
+        throttle.record_failure(f'usuario{i}')
+
+    assert throttle.check('nuevo') == BASE_LOCK_SECONDS
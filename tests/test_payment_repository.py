@@ -107,3 +107,42 @@ def test_delete_payment(setup_test_db, test_db):
     
     result = repo.get_row(payment_id)
     assert result is None
+
+
+def test_migrate_payment_foreign_keys(setup_test_db, test_db):
+    """Test a legacy payment table is rebuilt with ON DELETE CASCADE keeping its rows"""
+    cursor = test_db.cursor()
+    cursor.execute("""
+        CREATE TABLE payment (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            method_payment VARCHAR(50),
+            amount INTEGER,
+            created_datetime DATETIME DEFAULT CURRENT_TIMESTAMP,
+            id_inscription INTEGER,
+            FOREIGN KEY (id_inscription) REFERENCES inscription(id)
+        )
+    """)
+    cursor.execute("INSERT INTO payment (method_payment, amount, id_inscription) VALUES ('Efectivo', 50, 1)")
+    test_db.commit()
+
+    repo = PaymentRepository(test_db)
+    assert repo.migrate_foreign_keys() is True
+    assert repo.migrate_foreign_keys() is False
+
+    cursor.execute("PRAGMA foreign_key_list(payment)")
+    assert cursor.fetchone()[6] == 'CASCADE'
+    cursor.execute("SELECT method_payment, amount, id_inscription FROM payment")
+    assert cursor.fetchall() == [('Efectivo', 50, 1)]
+
+
+def test_migrate_foreign_keys_noop_is_silent(setup_test_db, test_db, capsys):
+    """Test an up-to-date table is checked without creating a staging table or printing"""
+    repo = PaymentRepository(test_db)
+    repo.create_table()
+    capsys.readouterr()
+
+    assert repo.migrate_foreign_keys() is False
+    assert capsys.readouterr().out == ''
+    cursor = test_db.cursor()
+    cursor.execute("SELECT name FROM sqlite_master WHERE name = 'payment_migration'")
+    assert cursor.fetchone() is None
@@ -0,0 +1,56 @@
+import pytest
+
+from control.query_filter import compile_where, compile_select
+from control.course_repository import CourseRepository
+
+
+def test_compile_where_operators():
+    """Test equality, IN, range, NULL and grouped filters compile to parameterized SQL"""
+    sql, params = compile_where({
+        'id_team': 3,
+        'id': [1, 2],
+        'amount': {'gte': 50, 'lt': 100},
+        'phone': None,
+        '$or': [{'name': {'prefix': 'Jo'}}, {'lastname': {'contains': '50%'}}],
+    })
+    assert sql == ("id_team = ? AND id IN (?, ?) AND amount >= ? AND amount < ? AND phone IS NULL"
+                   " AND ((name >= ? AND name < ?) OR lastname LIKE ? ESCAPE '\\')")
+    assert params == [3, 1, 2, 50, 100, 'Jo', 'Jp', '%50\\%%']
+
+
+def test_compile_rejects_invalid_column():
+    """Test column names cannot smuggle SQL"""
+    with pytest.raises(ValueError):
+        compile_where({'id; DROP TABLE user': 1})
+    with pytest.raises(ValueError):
+        compile_select('course', order_by='name desc')
+
+
+def test_get_all_rows_where_order_limit(setup_test_db, test_db):
+    """Test structured filter, ordering and paging through get_all_rows"""
+    repo = CourseRepository(test_db)
+    repo.create_table()
+    repo.insert_rows([{'name': f'Curso {i}', 'level': i % 3} for i in range(1, 11)])
+
+    rows = repo.get_all_rows(where={'level': {'in': [1, 2]}}, order_by='-id', limit=3, offset=1)
+    assert [row['id'] for row in rows] == [8, 7, 5]
+
+    rows = repo.get_all_rows({'name': 'curso 1'})
+    assert [row['id'] for row in rows] == [1, 10]
+
+
+def test_prefix_filter_uses_index(setup_test_db, test_db):
+    """Test prefix filters compile to a range that matches like a prefix and uses the column index"""
+    repo = CourseRepository(test_db)
+    repo.create_table()
+    repo.insert_rows([{'name': name, 'level': 1} for name in ('Jonás', 'José', 'Jp', 'Juan', 'jo')])
+    cursor = test_db.cursor()
+    cursor.execute('CREATE INDEX idx_course_name_test ON course (name)')
+
+    rows = repo.get_all_rows(where={'name': {'prefix': 'Jo'}}, order_by='name')
+    assert [row['name'] for row in rows] == ['Jonás', 'José']
+
+    sql, params = compile_select('course', {'name': {'prefix': 'Jo'}})
+    cursor.execute(f'EXPLAIN QUERY PLAN {sql}', params)
+    plan = ' '.join(str(row[-1]) for row in cursor.fetchall())
+    assert 'idx_course_name_test' in plan
@@ -117,3 +117,61 @@ def test_delete_student(setup_test_db, test_db):
     
     result = repo.get_row(student_id)
     assert result is None
+
+
+def test_search_index_prefix_and_accents(setup_test_db, test_db):
+    """Test full-text search matches word prefixes ignoring case and accents"""
+    repo = StudentRepository(test_db)
+    repo.create_table()
+    repo.insert_row({'name': 'José', 'lastname': 'Ramírez'})
+    repo.create_search_index()
+    repo.insert_row({'name': 'Josefina', 'lastname': 'Díaz'})
+    repo.insert_row({'name': 'María', 'lastname': 'Jose'})
+
+    assert sorted(repo.search('jose')) == [1, 2, 3]
+    assert repo.search('JOSE ram') == [1]
+    assert repo.search('diaz') == [2]
+    assert repo.search('"') == []
+
+
+def test_search_index_follows_updates_and_deletes(setup_test_db, test_db):
+    """Test triggers keep the index in sync and recreating it is idempotent"""
+    repo = StudentRepository(test_db)
+    repo.create_table()
+    repo.create_search_index()
+    student_id = repo.insert_row({'name': 'Ana', 'lastname': 'Pérez'})
+
+    repo.update_row({'lastname': 'Soto'}, {'id': student_id})
+    assert repo.search('perez') == []
+    assert repo.search('soto') == [student_id]
+
+    repo.create_search_index()
+    assert repo.search('ana') == [student_id]
+
+    repo.delete_row({'id': student_id})
+    assert repo.search('ana') == []
+
+
+def test_get_by_full_name(setup_test_db, test_db):
+    """Test exact "name lastname" lookup through the search index"""
+    repo = StudentRepository(test_db)
+    repo.create_table()
+    repo.create_search_index()
+    repo.insert_row({'name': 'Ana', 'lastname': 'Pérez Soto'})
+    ana_id = repo.insert_row({'name': 'Ana', 'lastname': 'Pérez'})
+
+    assert repo.get_by_full_name('Ana Pérez')['id'] == ana_id
+    assert repo.get_by_full_name('Ana Perez') is None
+
+
+def test_get_by_full_name_beyond_search_limit(setup_test_db, test_db):
+    """Test the exact match is found even when many students share its words"""
+    repo = StudentRepository(test_db)
+    repo.create_table()
+    repo.create_search_index()
+    for i in range(60):
+        repo.insert_row({'name': 'Ana', 'lastname': f'Pérez {i}'})
+    ana_id = repo.insert_row({'name': 'Ana', 'lastname': 'Pérez'})
+
+    assert repo.get_by_full_name(' Ana Pérez ')['id'] == ana_id
+    assert repo.get_by_full_name('') is None
@@ -107,3 +107,47 @@ def test_delete_team(setup_test_db, test_db):
     
     result = repo.get_row(team_id)
     assert result is None
+
+
+def test_delete_team_with_members(setup_test_db, test_db):
+    """Test deleting a team with enforced foreign keys keeps its members without a team"""
+    from control.change_events import change_bus
+    from control.student_repository import StudentRepository
+    from control.teacher_repository import TeacherRepository
+
+    test_db.execute("PRAGMA foreign_keys = ON")
+    repo = TeamRepository(test_db)
+    repo.create_table()
+    students = StudentRepository(test_db)
+    students.create_table()
+    teachers = TeacherRepository(test_db)
+    teachers.create_table()
+    repo.insert_row({'name': 'Team Alpha', 'age_start': 10, 'age_end': 15, 'gender': 'Male'})
+    students.insert_row({'name': 'Ana', 'lastname': 'Pérez', 'id_team': 1})
+    teachers.insert_row({'name': 'Luis', 'lastname': 'Díaz', 'id_team': 1})
+
+    events = []
+    unsubscribe = change_bus.subscribe(events.append)
+    try:
+        assert repo.delete_team(1) is True
+    finally:
+        unsubscribe()
+
+    assert students.get_row_value({'id': 1})['id_team'] is None
+    assert teachers.get_row_value({'id': 1})['id_team'] is None
+    assert {(event.table, event.action) for event in events} == {
+        ('team', 'delete'), ('student', 'update'), ('teacher', 'update')
+    }
+
+
+def test_get_teams_by_gender_exact(setup_test_db, test_db):
+    """Test gender filter is an exact, parameterized match"""
+    repo = TeamRepository(test_db)
+    repo.create_table()
+    repo.insert_rows([
+        {'name': 'Team Alpha', 'age_start': 10, 'age_end': 15, 'gender': 'Masculino'},
+        {'name': 'Team Beta', 'age_start': 10, 'age_end': 15, 'gender': 'Femenino'},
+    ])
+
+    assert [team.name for team in repo.get_teams_by_gender('Masculino')] == ['Team Alpha']
+    assert repo.get_teams_by_gender('Mas') == []
@@ -55,3 +55,103 @@ def test_login_nonexistent_user(setup_test_db, test_db):
     repo.create_table()
     
     assert repo.login('nonexistent_user', 'password') is False
+
+
+def test_search_users(setup_test_db, test_db):
+    """Test full-text search over usernames"""
+    repo = UserRepository(test_db)
+    repo.create_table()
+    repo.create_search_index()
+    repo.create_user('secretaria', 'Usuario', 'clave')
+    repo.create_user('admin', 'Administrador', 'clave')
+
+    assert repo.search('secre') == [1]
+
+
+def test_login_rehashes_outdated_hash(setup_test_db, test_db):
+    """Test a successful login upgrades a hash made with an older cost profile"""
+    from control.utils.encrypt_password import configure_hasher, needs_rehash
+
+    repo = UserRepository(test_db)
+    repo.create_table()
+    try:
+        configure_hasher("weak")
+        repo.create_user('legacy', 'Usuario', 'clave')
+        old_hash = repo.get_user_by_username('legacy')['password']
+
+        configure_hasher("weak", time_cost=3)
+        assert needs_rehash(old_hash)
+        assert repo.login('legacy', 'wrong') is False
+        assert repo.get_user_by_username('legacy')['password'] == old_hash
+
+        assert repo.login('legacy', 'clave') is True
+        new_hash = repo.get_user_by_username('legacy')['password']
+        assert new_hash != old_hash
+        assert not needs_rehash(new_hash)
+        assert repo.login('legacy', 'clave') is True
+    finally:
+        configure_hasher()
+
+
+def test_load_hasher_settings_calibrates_once(tmp_path, monkeypatch):
+    """Test the hasher is calibrated on first start and read from storage afterwards"""
+    from control.utils import encrypt_password
+    from control.utils.local_storage import LocalStorage
+
+    calls = []
+    params = {'time_cost': 2, 'memory_cost': 65536, 'parallelism': 4}
+    monkeypatch.setattr(encrypt_password, 'calibrate_profile', lambda *args, **kwargs: calls.append(1) or params)
+    storage = LocalStorage(str(tmp_path))
+    try:
+        hasher = encrypt_password.load_hasher_settings(storage)
+        assert hasher.time_cost == 2
+        assert storage.load_data(encrypt_password.SETTINGS_KEY) == params
+
+        encrypt_password.load_hasher_settings(storage)
+        assert calls == [1]
+        assert encrypt_password.get_hasher().time_cost == 2
+    finally:
+        encrypt_password.configure_hasher()
+
+
+def test_load_hasher_settings_rejects_corrupt_params(tmp_path, capsys):
+    """Test invalid stored Argon2 parameters fall back to the default profile with a warning"""
+    from control.utils import encrypt_password
+    from control.utils.local_storage import LocalStorage
+
+    storage = LocalStorage(str(tmp_path))
+    default = encrypt_password.PROFILES[encrypt_password.DEFAULT_PROFILE]
+    try:
+        for params in ({'time_cost': 'x', 'memory_cost': 65536, 'parallelism': 4},
+                       {'time_cost': 0, 'memory_cost': 65536, 'parallelism': 4},
+                       {'time_cost': 2, 'memory_cost': 65536},
+                       [1, 2, 3]):
+            storage.save_data(encrypt_password.SETTINGS_KEY, params)
+            hasher = encrypt_password.load_hasher_settings(storage)
+            assert hasher.time_cost == default['time_cost']
+            assert 'Advertencia' in capsys.readouterr().out
+    finally:
+        encrypt_password.configure_hasher()
+
+
+def test_verify_password_with_missing_hash():
+    """Test legacy rows without a usable hash fail verification instead of raising"""
+    from control.utils.encrypt_password import verify_password
+
+    assert verify_password(None, 'clave') is False
+    assert verify_password(12345, 'clave') is False
+    assert verify_password('texto-plano', 'clave') is False
+
+
+def test_authenticate_returns_user_without_hash(setup_test_db, test_db):
+    """Test authenticate returns the user row in one lookup, without the password"""
+    repo = UserRepository(test_db)
+    repo.create_table()
+    repo.create_user('admin', 'Administrador', 'clave')
+
+    user = repo.authenticate('admin', 'clave')
+    assert user['user'] == 'admin'
+    assert user['role'] == 'Administrador'
+    assert 'password' not in user
+    assert repo.authenticate('admin', 'otra') is None
+    assert repo.authenticate('nadie', 'clave') is None
@@ -0,0 +1,33 @@
+"""
+Resultados de tareas en segundo plano para la interfaz.
+
+Tk solo puede tocarse desde su propio hilo: las tareas lentas se envían a un
+hilo de trabajo (concurrent.futures) y la ventana revisa con after() cuándo
+terminó el Future, sin bloquear el bucle de eventos.
+"""
+
+POLL_MS = 50
+
+
+def after_future(widget, future, callback, poll_ms=POLL_MS):
+    """
+    Llamar callback(future) en el hilo de Tk cuando el Future termine.
+
+    Args:
+        widget: Widget cuyo after() se usa; si se destruye, se deja de revisar
+        future: Future de la tarea
+        callback: Función que recibe el Future terminado
+        poll_ms: Intervalo de revisión en milisegundos
+    """
+    def poll():
+        try:
+            if not widget.winfo_exists():
+                return
+        except Exception:
+            return
+        if future.done():
+            callback(future)
+        else:
+            widget.after(poll_ms, poll)
+
+    widget.after(poll_ms, poll)
@@ -2,7 +2,8 @@
 Módulo de componentes de gráficos para el dashboard.
 """
 
-from .chart_generator import ChartGenerator, create_matplotlib_widget
+from .chart_generator import ChartGenerator, create_matplotlib_widget, render_png
+from .chart_cache import ChartCache, data_fingerprint
 
-__all__ = ['ChartGenerator', 'create_matplotlib_widget']
+__all__ = ['ChartGenerator', 'ChartCache', 'create_matplotlib_widget', 'data_fingerprint', 'render_png']
 
@@ -0,0 +1,87 @@
+"""
+Caché LRU de gráficos ya rasterizados.
+
+La clave combina el tipo de gráfico, su tamaño y una huella de los datos
+agregados; si los datos no cambiaron, la imagen se reutiliza sin volver a
+construir la figura.
+"""
+
+from collections import OrderedDict
+import hashlib
+import threading
+
+import numpy as np
+
+
+def data_fingerprint(data) -> str:
+    """
+    Calcular una huella estable de los datos de un gráfico.
+
+    Acepta arreglos NumPy, listas, tuplas y diccionarios anidados. A
+    diferencia de hash(), el resultado es igual entre ejecuciones.
+
+    Args:
+        data: Datos agregados del gráfico
+
+    Returns:
+        str: Huella hexadecimal (SHA-1)
+    """
+    digest = hashlib.sha1()
+
+    def feed(value):
+        if isinstance(value, np.ndarray):
+            digest.update(f"nd:{value.dtype.str}:{value.shape}:".encode())
+            digest.update(np.ascontiguousarray(value).tobytes())
+        elif isinstance(value, dict):
+            digest.update(b"dict:")
+            for key in sorted(value):
+                digest.update(f"{key}=".encode())
+                feed(value[key])
+        elif isinstance(value, (list, tuple)):
+            digest.update(f"seq:{len(value)}:".encode())
+            for item in value:
+                feed(item)
+        else:
+            digest.update(f"{type(value).__name__}:{value!r};".encode())
+
+    feed(data)
+    return digest.hexdigest()
+
+
+class ChartCache:
+    """Caché LRU de imágenes de gráficos, segura entre hilos"""
+
+    def __init__(self, max_entries=32):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(chart_type, size, data):
+        """Clave de caché: tipo de gráfico, tamaño y huella de los datos."""
+        return chart_type, tuple(size), data_fingerprint(data)
+
+    def get(self, key):
+        """Obtener una imagen y marcarla como la más reciente, o None."""
+        with self._lock:
+            image = self._entries.get(key)
+            if image is not None:
+                self._entries.move_to_end(key)
+            return image
+
+    def put(self, key, image):
+        """Guardar una imagen, descartando la menos usada si se supera el límite."""
+        with self._lock:
+            self._entries[key] = image
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """Vaciar la caché."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
@@ -6,6 +6,9 @@ en view/theme.py, y usan layout restringido para que títulos, ejes y etiquetas
 nunca se solapen.
 """
 
+import io
+
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from matplotlib.figure import Figure
 from matplotlib.ticker import MaxNLocator
@@ -221,7 +224,8 @@ class ChartGenerator:
                 label.set_horizontalalignment("right")
         return fig
 
-    def create_histogram(self, data, title, xlabel, ylabel, bins=10, width=6, height=4):
+    def create_histogram(self, data, title, xlabel, ylabel, bins=10, width=6, height=4,
+                         weights=None):
         """Crear histograma.
 
         Args:
@@ -232,6 +236,8 @@ class ChartGenerator:
             bins: Número de intervalos
             width: Ancho de la figura
             height: Alto de la figura
+            weights: Cantidad de ocurrencias de cada valor, si los datos ya
+                vienen agrupados
 
         Returns:
             Figure: Figura de matplotlib
@@ -241,7 +247,7 @@ class ChartGenerator:
             return self._empty_message(fig, title)
 
         ax = fig.add_subplot(111)
-        ax.hist(data, bins=bins, color=theme.CHART_PALETTE[0],
+        ax.hist(data, bins=bins, weights=weights, color=theme.CHART_PALETTE[0],
                 edgecolor=theme.SURFACE, linewidth=1)
 
         self._style_axes(ax, title, xlabel, ylabel, grid_axis="y")
@@ -286,195 +292,6 @@ class ChartGenerator:
         ax.margins(0.12)
         return fig
 
-    def get_matriculas_trend_data(self, inscription_repo):
-        """
-        Obtener datos de tendencia de matrículas por mes
-        
-        Args:
-            inscription_repo: Repositorio de inscripciones
-            
-        Returns:
-            dict: Datos para gráfico de línea
-        """
-        try:
-            inscriptions = inscription_repo.get_all_rows()
-            
-            # Agrupar por mes (simulado para demostración)
-            months = ['Ene', 'Feb', 'Mar', 'Abr', 'May', 'Jun']
-            values = [0] * len(months)
-            
-            # Simular distribución basada en datos existentes
-            total_inscriptions = len(inscriptions)
-            if total_inscriptions > 0:
-                # Distribuir las inscripciones existentes en los meses
-                base_per_month = total_inscriptions // len(months)
-                remainder = total_inscriptions % len(months)
-                
-                for i in range(len(months)):
-                    values[i] = base_per_month + (1 if i < remainder else 0)
-                    # Agregar variación aleatoria
-                    values[i] += np.random.randint(-2, 3)
-                    values[i] = max(0, values[i])
-            
-            return {
-                'x': months,
-                'y': values
-            }
-        except Exception as e:
-            print(f"Error obteniendo datos de tendencia: {e}")
-            return {
-                'x': ['Ene', 'Feb', 'Mar', 'Abr', 'May', 'Jun'],
-                'y': [12, 18, 15, 22, 19, 25]
-            }
-    
-    def get_equipos_distribution_data(self, team_repo, student_repo):
-        """
-        Obtener datos de distribución de estudiantes por equipo
-        
-        Args:
-            team_repo: Repositorio de equipos
-            student_repo: Repositorio de estudiantes
-            
-        Returns:
-            tuple: (datos, etiquetas)
-        """
-        try:
-            teams = team_repo.get_all_rows()
-            students = student_repo.get_all_rows()
-            
-            # Simular distribución
-            team_data = []
-            team_labels = []
-            
-            for i, team in enumerate(teams):
-                team_name = team.get('name', f'Equipo {i+1}')
-                # Simular conteo basado en hash
-                count = len([s for s in students if hash(s.get('name', '')) % len(teams) == i])
-                team_data.append(count)
-                team_labels.append(team_name)
-            
-            # Si no hay datos, usar valores simulados
-            if not team_data:
-                team_data = [8, 12, 5, 15, 7]
-                team_labels = ['Equipo A', 'Equipo B', 'Equipo C', 'Equipo D', 'Equipo E']
-            
-            return team_data, team_labels
-        except Exception as e:
-            print(f"Error obteniendo datos de equipos: {e}")
-            return [8, 12, 5, 15, 7], ['Equipo A', 'Equipo B', 'Equipo C', 'Equipo D', 'Equipo E']
-    
-    def get_payment_methods_data(self, payment_repo):
-        """
-        Obtener datos de métodos de pago
-        
-        Args:
-            payment_repo: Repositorio de pagos
-            
-        Returns:
-            tuple: (datos, etiquetas)
-        """
-        try:
-            payments = payment_repo.get_all_rows()
-            
-            # Agrupar por método de pago
-            method_counts = {}
-            for payment in payments:
-                method = payment.get('method_payment', 'Desconocido')
-                method_counts[method] = method_counts.get(method, 0) + 1
-            
-            # Si no hay datos, usar datos simulados
-            if not method_counts:
-                method_counts = {
-                    "Efectivo": 15,
-                    "Transferencia": 8,
-                    "Tarjeta": 5,
-                    "Yape": 12,
-                    "Plin": 3
-                }
-            
-            # Convertir a listas
-            methods = list(method_counts.keys())
-            counts = list(method_counts.values())
-            
-            return counts, methods
-        except Exception as e:
-            print(f"Error obteniendo datos de pagos: {e}")
-            return [15, 8, 5, 12, 3], ["Efectivo", "Transferencia", "Tarjeta", "Yape", "Plin"]
-    
-    def get_student_age_distribution_data(self, student_repo):
-        """
-        Obtener datos de distribución de edades de estudiantes
-        
-        Args:
-            student_repo: Repositorio de estudiantes
-            
-        Returns:
-            list: Lista de edades
-        """
-        try:
-            students = student_repo.get_all_rows()
-            
-            # Simular edades basadas en datos existentes
-            ages = []
-            for student in students:
-                # Simular edad basada en hash del nombre
-                age = 18 + (hash(student.get('name', '')) % 20)  # Edades entre 18-37
-                ages.append(age)
-            
-            # Si no hay datos, usar datos simulados
-            if not ages:
-                ages = [20, 22, 19, 25, 23, 21, 24, 26, 20, 22, 23, 25, 19, 21, 24, 22, 20, 23, 25, 21]
-            
-            return ages
-        except Exception as e:
-            print(f"Error obteniendo datos de edades: {e}")
-            return [20, 22, 19, 25, 23, 21, 24, 26, 20, 22, 23, 25, 19, 21, 24, 22, 20, 23, 25, 21]
-    
-    def get_course_performance_data(self, course_repo, student_repo, inscription_repo):
-        """
-        Obtener datos de rendimiento por curso
-        
-        Args:
-            course_repo: Repositorio de cursos
-            student_repo: Repositorio de estudiantes
-            inscription_repo: Repositorio de inscripciones
-            
-        Returns:
-            tuple: (x_data, y_data) para gráfico de dispersión
-        """
-        try:
-            courses = course_repo.get_all_rows()
-            students = student_repo.get_all_rows()
-            inscriptions = inscription_repo.get_all_rows()
-            
-            x_data = []  # Número de estudiantes inscritos
-            y_data = []  # Rendimiento simulado
-            
-            for course in courses:
-                # Contar estudiantes inscritos en este curso
-                course_inscriptions = [ins for ins in inscriptions 
-                                    if ins.get('course_id') == course.get('id')]
-                student_count = len(course_inscriptions)
-                
-                if student_count > 0:
-                    # Simular rendimiento basado en número de estudiantes
-                    # Más estudiantes = mejor rendimiento (simulado)
-                    performance = 60 + (student_count * 2) + np.random.randint(-10, 15)
-                    performance = min(100, max(40, performance))  # Entre 40-100
-                    
-                    x_data.append(student_count)
-                    y_data.append(performance)
-            
-            # Si no hay datos, usar datos simulados
-            if not x_data:
-                x_data = [5, 8, 12, 15, 3, 10, 7, 9, 6, 11]
-                y_data = [75, 82, 88, 92, 65, 85, 78, 80, 72, 87]
-            
-            return x_data, y_data
-        except Exception as e:
-            print(f"Error obteniendo datos de rendimiento: {e}")
-            return [5, 8, 12, 15, 3, 10, 7, 9, 6, 11], [75, 82, 88, 92, 65, 85, 78, 80, 72, 87]
-
 
 def create_matplotlib_widget(fig, parent_frame):
     """
@@ -491,3 +308,20 @@ def create_matplotlib_widget(fig, parent_frame):
     canvas.draw()
     return canvas
 
+
+def render_png(fig):
+    """
+    Rasterizar una figura a PNG con el backend Agg.
+
+    No usa Tk, así que puede ejecutarse fuera del hilo principal.
+
+    Args:
+        fig: Figura de matplotlib
+
+    Returns:
+        bytes: Imagen PNG con el tamaño y dpi de la figura
+    """
+    FigureCanvasAgg(fig)
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format="png", facecolor=fig.get_facecolor())
+    return buffer.getvalue()
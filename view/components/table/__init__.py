@@ -0,0 +1,8 @@
+"""
+Módulo de componentes de tablas para el dashboard.
+"""
+
+from .row_pool import RowPool
+from .debounce import Debouncer
+
+__all__ = ['RowPool', 'Debouncer']
@@ -0,0 +1,40 @@
+"""
+Retraso de los filtros mientras el usuario escribe.
+
+Cada tecla reprograma la llamada; el filtro solo se ejecuta cuando el
+usuario deja de escribir durante delay_ms milisegundos.
+"""
+
+
+class Debouncer:
+    """Llamada diferida con after(), cancelada y reprogramada en cada evento"""
+
+    def __init__(self, widget, delay_ms, callback):
+        """
+        Args:
+            widget: Cualquier widget de Tk (se usa su after/after_cancel)
+            delay_ms: Milisegundos de inactividad antes de llamar
+            callback: Función sin argumentos a ejecutar
+        """
+        self.widget = widget
+        self.delay_ms = delay_ms
+        self.callback = callback
+        self._after_id = None
+
+    def __call__(self, *args):
+        """Reprogramar la llamada; acepta y descarta los argumentos de eventos y traces."""
+        self.cancel()
+        self._after_id = self.widget.after(self.delay_ms, self._fire)
+
+    def cancel(self):
+        """Anular la llamada pendiente, si la hay."""
+        if self._after_id is not None:
+            try:
+                self.widget.after_cancel(self._after_id)
+            except Exception:
+                pass
+            self._after_id = None
+
+    def _fire(self):
+        self._after_id = None
+        self.callback()
@@ -0,0 +1,97 @@
+"""
+Filas de tabla reutilizables.
+
+Las tablas del dashboard muestran una página de registros a la vez. En lugar
+de destruir y volver a crear un frame, sus etiquetas y sus botones en cada
+cambio de página o de filtro, RowPool conserva las filas ya creadas y solo
+cambia el texto de las etiquetas y el comando de los botones. Las filas que
+sobran en una página más corta se ocultan, no se destruyen.
+"""
+
+import customtkinter as ctk
+
+from view import theme
+
+
+class RowPool:
+    """Pool de filas con columnas de ancho fijo y botones de acción"""
+
+    ROW_HEIGHT = 40
+    COLUMN_GAP = 5
+
+    def __init__(self, parent, widths, actions):
+        """
+        Args:
+            parent: Frame (normalmente CTkScrollableFrame) que contiene las filas
+            widths: Ancho de cada columna de datos
+            actions: Lista de (texto, ancho, color, color_hover, callback);
+                callback recibe el registro de la fila
+        """
+        self.parent = parent
+        self.widths = list(widths)
+        self.actions = list(actions)
+        self.rows = []
+        self.visible = 0
+
+    def _create_row(self):
+        """Crear una fila vacía: frame, etiquetas y botones."""
+        row_frame = ctk.CTkFrame(self.parent, fg_color=theme.SURFACE, height=self.ROW_HEIGHT)
+        row_frame.pack_propagate(False)
+
+        labels = []
+        for i, width in enumerate(self.widths):
+            label = ctk.CTkLabel(
+                row_frame,
+                text="",
+                font=theme.font(theme.SIZE_SMALL),
+                text_color=theme.TEXT,
+                width=width
+            )
+            label.place(x=sum(self.widths[:i]) + i * self.COLUMN_GAP, y=10)
+            labels.append(label)
+
+        # Botones de acción
+        actions_frame = ctk.CTkFrame(row_frame, fg_color="transparent")
+        actions_frame.place(x=sum(self.widths) + len(self.widths) * self.COLUMN_GAP, y=5)
+
+        buttons = []
+        for i, (text, width, color, hover, _callback) in enumerate(self.actions):
+            button = ctk.CTkButton(
+                actions_frame,
+                text=text,
+                width=width,
+                height=26,
+                font=theme.font(theme.SIZE_CAPTION),
+                fg_color=color,
+                hover_color=hover
+            )
+            button.pack(side="left", padx=(0, 4) if i < len(self.actions) - 1 else 0)
+            buttons.append(button)
+
+        return row_frame, labels, buttons
+
+    def render(self, items, values):
+        """
+        Mostrar los registros reutilizando las filas existentes.
+
+        Args:
+            items: Registros de la página actual
+            values: Función que devuelve el texto de cada columna de un registro
+        """
+        items = list(items)
+        while len(self.rows) < len(items):
+            self.rows.append(self._create_row())
+
+        for (row_frame, labels, buttons), item in zip(self.rows, items):
+            for label, text in zip(labels, values(item)):
+                if label.cget("text") != text:
+                    label.configure(text=text)
+            for button, action in zip(buttons, self.actions):
+                button.configure(command=lambda callback=action[4], record=item: callback(record))
+
+        # Mostrar las filas usadas, en orden, y ocultar las que sobran
+        for row_frame, _labels, _buttons in self.rows[self.visible:len(items)]:
+            row_frame.pack(fill="x", pady=2)
+        for row_frame, _labels, _buttons in self.rows[len(items):self.visible]:
+            row_frame.pack_forget()
+        self.visible = len(items)
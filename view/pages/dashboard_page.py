@@ -1,6 +1,10 @@
 import customtkinter as ctk
 import tkinter as tk
 from tkinter import messagebox
+from concurrent.futures import ThreadPoolExecutor
+import base64
+import queue
+import threading
 import sys
 import os
 
@@ -17,8 +21,13 @@ from control.student_repository import StudentRepository
 from control.team_repository import TeamRepository
 from control.inscription_repository import InscriptionRepository
 from control.payment_repository import PaymentRepository
+from control.utils.dashboard_stats import DashboardStats
+from control.utils.chart_data import ChartData
+from control.utils.incremental_filter import IncrementalFilter
+from control.change_events import change_bus
 from tkinter import ttk
-from view.components.chart import ChartGenerator, create_matplotlib_widget
+from view.components.chart import ChartGenerator, ChartCache, render_png
+from view.components.table import RowPool, Debouncer
 from view import theme
 
 # Anchos de columna de las tablas de personas (estudiantes y docentes).
@@ -27,6 +36,37 @@ from view import theme
 PERSON_TABLE_WIDTHS = [40, 130, 130, 110, 110, 110, 70]
 PERSON_TABLE_ACTIONS_WIDTH = 130
 
+# Los gráficos se consultan y rasterizan en hilos de trabajo; el hilo de Tk
+# revisa cada CHART_POLL_MS milisegundos si hay imágenes listas para mostrar.
+CHART_WORKERS = 2
+CHART_POLL_MS = 30
+# Imágenes de gráficos reutilizables mientras sus datos no cambien (LRU).
+CHART_CACHE_SIZE = 20
+
+# Tablas de las que depende cada indicador y gráfico; un cambio en ellas
+# (publicado por los repositorios en change_bus) invalida solo lo afectado.
+STATS_TABLES = {"student", "classroom", "inscription"}
+CHART_TABLES = {
+    "line": {"inscription"},
+    "pie": {"student", "team"},
+    "payments": {"payment"},
+    "ages": {"student"},
+    "courses": {"course", "classroom", "inscription"},
+}
+# Los eventos publicados desde otros hilos se encolan y el hilo de Tk los
+# atiende cada CHANGE_POLL_MS milisegundos (Tk no admite llamadas desde otros hilos).
+CHANGE_POLL_MS = 100
+# Tabla mostrada en cada sección y método que vuelve a aplicar sus filtros
+SECTION_TABLES = {
+    "red": ("team", "filter_teams"),
+    "cursos": ("course", "filter_courses"),
+    "estudiantes": ("student", "filter_students"),
+    "docentes": ("teacher", "filter_teachers"),
+    "configuracion": ("user", "filter_users"),
+}
+# Espera tras la última tecla antes de aplicar los filtros de las listas.
+FILTER_DEBOUNCE_MS = 250
+
 
 class DashboardPage:
     def __init__(self, parent, current_user=None):
@@ -44,9 +84,53 @@ class DashboardPage:
         self.team_repo = TeamRepository()
         self.inscription_repo = InscriptionRepository()
         self.payment_repo = PaymentRepository()
+        self.dashboard_stats = DashboardStats()
         
         # Generador de gráficos
         self.chart_generator = ChartGenerator()
+        self.chart_data = ChartData()
+        self.chart_executor = ThreadPoolExecutor(max_workers=CHART_WORKERS, thread_name_prefix="chart")
+        self.pending_charts = []
+        self.chart_cache = ChartCache(max_entries=CHART_CACHE_SIZE)
+        
+        # Datos ya consultados; se descartan cuando cambia una tabla de la que dependen
+        self.dashboard_stats_cache = None
+        self.chart_inputs = {}
+        self.chart_versions = dict.fromkeys(CHART_TABLES, 0)
+        self.pending_table_refresh = set()
+        self.closed = False
+        self.change_queue = queue.SimpleQueue()
+        self.change_poll_id = None
+        self.unsubscribe_changes = change_bus.subscribe(self.on_data_change)
+        
+        # Filtros en memoria de las listas; cada uno se invalida cuando cambia su tabla
+        person_texts = {"name": ("name", "lastname"), "phone": ("phone",)}
+        self.students_filter_engine = IncrementalFilter(
+            self.student_repo, person_texts, exact=("id_team",), search="name"
+        )
+        self.teachers_filter_engine = IncrementalFilter(
+            self.teacher_repo, person_texts, exact=("id_team",), search="name"
+        )
+        self.teams_filter_engine = IncrementalFilter(
+            self.team_repo, {"name": ("name",)}, exact=("gender",), ranges=("age_start", "age_end")
+        )
+        self.courses_filter_engine = IncrementalFilter(self.course_repo, {"name": ("name",)}, exact=("level",))
+        self.users_filter_engine = IncrementalFilter(
+            self.user_repo, {"user": ("user",)}, exact=("role",), search="user"
+        )
+        self.students_match_ids = None
+        self.teachers_match_ids = None
+        self.teams_match_ids = None
+        self.courses_match_ids = None
+        self.users_match_ids = None
+        
+        # Los filtros se aplican cuando el usuario deja de escribir
+        self.ciclo_filter_debounce = Debouncer(self.parent, FILTER_DEBOUNCE_MS, self.filter_ciclos)
+        self.users_filter_debounce = Debouncer(self.parent, FILTER_DEBOUNCE_MS, self.filter_users)
+        self.teams_filter_debounce = Debouncer(self.parent, FILTER_DEBOUNCE_MS, self.filter_teams)
+        self.courses_filter_debounce = Debouncer(self.parent, FILTER_DEBOUNCE_MS, self.filter_courses)
+        self.students_filter_debounce = Debouncer(self.parent, FILTER_DEBOUNCE_MS, self.filter_students)
+        self.teachers_filter_debounce = Debouncer(self.parent, FILTER_DEBOUNCE_MS, self.filter_teachers)
         
         # Variables para Academia
         self.academia_subsection = "ciclo"  # "ciclo", "aulas" o "matricula"
@@ -54,9 +138,12 @@ class DashboardPage:
         self.current_classroom_page = 1
         self.cicles_per_page = 10
         self.classrooms_per_page = 10
+        self.ciclo_total_pages = 1
+        self.classroom_total_pages = 1
         self.active_cicle = None  # Ciclo activo seleccionado
         self.selected_aula_for_matricula = None  # Aula seleccionada para matrícula
         self.setup_ui()
+        self.change_poll_id = self.parent.after(CHANGE_POLL_MS, self.drain_change_events)
         
     def setup_ui(self):
         """Configurar la interfaz del dashboard"""
@@ -70,6 +157,8 @@ class DashboardPage:
         # Frame principal del dashboard
         self.main_frame = ctk.CTkFrame(self.parent, fg_color="transparent")
         self.main_frame.pack(fill="both", expand=True)
+        # Al cerrar la ventana o reemplazar la página se liberan las suscripciones
+        self.main_frame.bind("<Destroy>", lambda event: self.cleanup(), add=True)
         
         # Crear sidebar izquierdo
         self.create_sidebar()
@@ -420,20 +509,10 @@ class DashboardPage:
     def get_dashboard_statistics(self):
         """Obtener estadísticas para el dashboard"""
         try:
-            # Total de estudiantes
-            total_students = len(self.student_repo.get_all_rows())
-            
-            # Aulas activas (todas las aulas por ahora)
-            active_classrooms = len(self.classroom_repo.get_all_rows())
-            
-            # Matrículas del mes (todas las inscripciones por ahora)
-            monthly_inscriptions = len(self.inscription_repo.get_all_rows())
-            
-            return {
-                "total_students": total_students,
-                "active_classrooms": active_classrooms,
-                "monthly_inscriptions": monthly_inscriptions
-            }
+            # Conteos agregados en SQL; "Matrículas del Mes" según date_inscription
+            if self.dashboard_stats_cache is None:
+                self.dashboard_stats_cache = self.dashboard_stats.get_statistics()
+            return self.dashboard_stats_cache
         except Exception as e:
             print(f"Error obteniendo estadísticas: {e}")
             return {
@@ -482,249 +561,237 @@ class DashboardPage:
         # Gráfico 4: Histograma - Distribución de Edades
         self.create_histogram_widget(second_row_frame, 0, 0)
         
-        # Gráfico 5: Gráfico de Dispersión - Rendimiento por Curso
-        self.create_scatter_plot_widget(second_row_frame, 0, 1)
+        # Gráfico 5: Gráfico de Barras - Matrículas por Curso
+        self.create_course_chart_widget(second_row_frame, 0, 1)
     
-    def create_line_chart_widget(self, parent, row=0, column=0):
-        """Crear widget de gráfico de línea"""
+    def create_chart_card(self, parent, row, column, chart_type, load, draw, size, error_text):
+        """Crear la tarjeta de un gráfico con un indicador de carga y dibujarlo en segundo plano"""
+        # Frame del gráfico
+        chart_frame = ctk.CTkFrame(
+            parent,
+            width=350,
+            height=320,
+            corner_radius=theme.RADIUS_LG,
+            fg_color=theme.SURFACE,
+            border_width=1,
+            border_color=theme.BORDER
+        )
+        chart_frame.grid(row=row, column=column,
+                         padx=(0 if column == 0 else theme.SPACE_SM, theme.SPACE_SM),
+                         pady=theme.SPACE_SM, sticky="nsew")
+        chart_frame.pack_propagate(False)
+        
+        # Indicador de carga hasta que la imagen esté lista
+        placeholder = ctk.CTkLabel(
+            chart_frame,
+            text="Cargando gráfico...",
+            font=theme.font(theme.SIZE_SMALL),
+            text_color=theme.TEXT_MUTED
+        )
+        placeholder.pack(expand=True)
+        
+        self.render_chart_async(chart_frame, placeholder, chart_type, load, draw, size, error_text)
+    
+    def render_chart_async(self, chart_frame, placeholder, chart_type, load, draw, size, error_text):
+        """Consultar y rasterizar un gráfico en el pool de trabajo; el resultado vuelve por after()"""
+        future = self.chart_executor.submit(self.rasterize_chart, chart_type, load, draw, size)
+        self.pending_charts.append((future, chart_frame, placeholder, error_text))
+        if len(self.pending_charts) == 1:
+            self.parent.after(CHART_POLL_MS, self.drain_chart_results)
+    
+    def rasterize_chart(self, chart_type, load, draw, size):
+        """
+        Obtener la imagen PNG de un gráfico (se ejecuta fuera del hilo de Tk).
+        Si los datos agregados no cambiaron, se reutiliza la imagen en caché.
+        """
+        data = self.chart_inputs.get(chart_type)
+        if data is None:
+            version = self.chart_versions[chart_type]
+            data = load()
+            # Guardar solo si no llegó un cambio mientras se consultaba
+            if self.chart_versions[chart_type] == version:
+                self.chart_inputs[chart_type] = data
+        key = self.chart_cache.key(chart_type, size, data)
+        png = self.chart_cache.get(key)
+        if png is None:
+            png = render_png(draw(data, size))
+            self.chart_cache.put(key, png)
+        return png
+    
+    def drain_chart_results(self):
+        """Mostrar los gráficos terminados y volver a revisar mientras queden pendientes"""
+        pending = []
+        for item in self.pending_charts:
+            if item[0].done():
+                self.show_chart_result(*item)
+            else:
+                pending.append(item)
+        self.pending_charts = pending
+        if pending:
+            self.parent.after(CHART_POLL_MS, self.drain_chart_results)
+    
+    def show_chart_result(self, future, chart_frame, placeholder, error_text):
+        """Reemplazar el indicador de carga por la imagen del gráfico o por el error"""
+        # La sección pudo cambiar mientras se dibujaba el gráfico
+        if not chart_frame.winfo_exists():
+            return
+        placeholder.destroy()
         try:
-            # Frame del gráfico
-            chart_frame = ctk.CTkFrame(
-                parent,
-                width=350,
-                height=320,
-                corner_radius=theme.RADIUS_LG,
-                fg_color=theme.SURFACE,
-                border_width=1,
-                border_color=theme.BORDER
-            )
-            chart_frame.grid(row=row, column=column,
-                             padx=(0 if column == 0 else theme.SPACE_SM, theme.SPACE_SM),
-                             pady=theme.SPACE_SM, sticky="nsew")
-            chart_frame.pack_propagate(False)
-            
-            # Obtener datos para el gráfico de línea
-            data = self.chart_generator.get_matriculas_trend_data(self.inscription_repo)
-            
-            # Crear gráfico de línea
-            fig = self.chart_generator.create_line_chart(
-                data=data,
-                title="Tendencia de Matrículas",
-                xlabel="Mes",
-                ylabel="Cantidad de Matrículas",
-                width=5.5,
-                height=4
-            )
-            
-            # Crear widget de matplotlib
-            canvas = create_matplotlib_widget(fig, chart_frame)
-            canvas.get_tk_widget().pack(fill="both", expand=True,
-                                        padx=theme.SPACE_SM, pady=theme.SPACE_SM)
-            
+            image = tk.PhotoImage(data=base64.b64encode(future.result()))
+            image_label = tk.Label(chart_frame, image=image, bg=theme.SURFACE, bd=0)
+            image_label.image = image  # Mantener referencia a la imagen
+            image_label.pack(fill="both", expand=True, padx=theme.SPACE_SM, pady=theme.SPACE_SM)
         except Exception as e:
-            print(f"Error creando gráfico de línea: {e}")
+            print(f"{error_text}: {e}")
             # Crear mensaje de error
             error_label = ctk.CTkLabel(
                 chart_frame,
-                text="Error al cargar gráfico de línea",
+                text=error_text,
                 font=theme.font(theme.SIZE_SMALL),
                 text_color=theme.DANGER
             )
             error_label.pack(expand=True)
     
+    def on_data_change(self, event):
+        """Invalidar solo lo que depende de la tabla modificada (evento de change_bus)"""
+        if threading.current_thread() is not threading.main_thread():
+            # Eventos de otros hilos (p. ej. trabajos en segundo plano): los atiende drain_change_events
+            self.change_queue.put(event)
+            return
+        if self.closed:
+            return
+        if event.table in STATS_TABLES:
+            self.dashboard_stats_cache = None
+        for chart_type, tables in CHART_TABLES.items():
+            if event.table in tables:
+                self.chart_versions[chart_type] += 1
+                self.chart_inputs.pop(chart_type, None)
+        
+        # Refrescar la tabla visible si es la que cambió; Tk solo desde su hilo
+        section = SECTION_TABLES.get(self.current_section)
+        if section and section[0] == event.table and event.table not in self.pending_table_refresh:
+            self.pending_table_refresh.add(event.table)
+            self.parent.after_idle(self.refresh_section_table, event.table)
+    
+    def drain_change_events(self):
+        """Atender en el hilo de Tk los eventos encolados por otros hilos y volver a revisar"""
+        self.change_poll_id = None
+        if self.closed:
+            return
+        while True:
+            try:
+                event = self.change_queue.get_nowait()
+            except queue.Empty:
+                break
+            self.on_data_change(event)
+        self.change_poll_id = self.parent.after(CHANGE_POLL_MS, self.drain_change_events)
+    
+    def bind_filter_debounce(self, debounce, entries=(), combos=()):
+        """Aplicar los filtros de una lista al dejar de escribir o al elegir una opción"""
+        for entry in entries:
+            entry.bind("<KeyRelease>", debounce)
+        for combo in combos:
+            combo.configure(command=debounce)
+    
+    def get_filtered_page(self, repo, match_ids, page, per_page):
+        """Página de la tabla completa o, si hay filtros activos, de los ids filtrados en memoria"""
+        if match_ids is None:
+            return repo.get_page(page, per_page)
+        return repo.get_page_by_ids(match_ids, page, per_page)
+    
+    def refresh_section_table(self, table):
+        """Volver a filtrar y consultar la página actual de la tabla visible"""
+        self.pending_table_refresh.discard(table)
+        section = SECTION_TABLES.get(self.current_section)
+        if section and section[0] == table:
+            getattr(self, section[1])(reset_page=False)
+    
+    def create_line_chart_widget(self, parent, row=0, column=0):
+        """Crear widget de gráfico de línea (tendencia de matrículas)"""
+        self.create_chart_card(parent, row, column, "line", self.chart_data.inscriptions_by_month,
+                               self.draw_line_chart, (5.5, 4), "Error al cargar gráfico de línea")
+    
+    def draw_line_chart(self, data, size):
+        """Crear gráfico de línea"""
+        return self.chart_generator.create_line_chart(
+            data=data,
+            title="Tendencia de Matrículas",
+            xlabel="Mes",
+            ylabel="Cantidad de Matrículas",
+            width=size[0],
+            height=size[1]
+        )
+    
     def create_pie_chart_widget(self, parent, row=0, column=0):
-        """Crear widget de gráfico de pastel"""
-        try:
-            # Frame del gráfico
-            chart_frame = ctk.CTkFrame(
-                parent,
-                width=350,
-                height=320,
-                corner_radius=theme.RADIUS_LG,
-                fg_color=theme.SURFACE,
-                border_width=1,
-                border_color=theme.BORDER
-            )
-            chart_frame.grid(row=row, column=column,
-                             padx=(0 if column == 0 else theme.SPACE_SM, theme.SPACE_SM),
-                             pady=theme.SPACE_SM, sticky="nsew")
-            chart_frame.pack_propagate(False)
-            
-            # Obtener datos para el gráfico de pastel
-            data, labels = self.chart_generator.get_equipos_distribution_data(
-                self.team_repo, self.student_repo
-            )
-            
-            # Crear gráfico de pastel
-            fig = self.chart_generator.create_pie_chart(
-                data=data,
-                labels=labels,
-                title="Estudiantes por Equipo",
-                width=5.5,
-                height=4.5
-            )
-            
-            # Crear widget de matplotlib
-            canvas = create_matplotlib_widget(fig, chart_frame)
-            canvas.get_tk_widget().pack(fill="both", expand=True,
-                                        padx=theme.SPACE_SM, pady=theme.SPACE_SM)
-            
-        except Exception as e:
-            print(f"Error creando gráfico de pastel: {e}")
-            # Crear mensaje de error
-            error_label = ctk.CTkLabel(
-                chart_frame,
-                text="Error al cargar gráfico de pastel",
-                font=theme.font(theme.SIZE_SMALL),
-                text_color=theme.DANGER
-            )
-            error_label.pack(expand=True)
+        """Crear widget de gráfico de pastel (estudiantes por equipo)"""
+        self.create_chart_card(parent, row, column, "pie", self.chart_data.students_by_team,
+                               self.draw_pie_chart, (5.5, 4.5), "Error al cargar gráfico de pastel")
+    
+    def draw_pie_chart(self, data, size):
+        """Crear gráfico de pastel"""
+        values, labels = data
+        return self.chart_generator.create_pie_chart(
+            data=values,
+            labels=labels,
+            title="Estudiantes por Equipo",
+            width=size[0],
+            height=size[1]
+        )
     
     def create_bar_chart_widget(self, parent, row=0, column=0):
-        """Crear widget de gráfico de barras"""
-        try:
-            # Frame del gráfico
-            chart_frame = ctk.CTkFrame(
-                parent,
-                width=350,
-                height=320,
-                corner_radius=theme.RADIUS_LG,
-                fg_color=theme.SURFACE,
-                border_width=1,
-                border_color=theme.BORDER
-            )
-            chart_frame.grid(row=row, column=column,
-                             padx=(0 if column == 0 else theme.SPACE_SM, theme.SPACE_SM),
-                             pady=theme.SPACE_SM, sticky="nsew")
-            chart_frame.pack_propagate(False)
-            
-            # Obtener datos para el gráfico de barras
-            data, labels = self.chart_generator.get_payment_methods_data(self.payment_repo)
-            
-            # Crear gráfico de barras
-            fig = self.chart_generator.create_bar_chart(
-                data=data,
-                labels=labels,
-                title="Pagos por Método",
-                xlabel="Método de Pago",
-                ylabel="Cantidad de Pagos",
-                width=5.5,
-                height=4
-            )
-            
-            # Crear widget de matplotlib
-            canvas = create_matplotlib_widget(fig, chart_frame)
-            canvas.get_tk_widget().pack(fill="both", expand=True,
-                                        padx=theme.SPACE_SM, pady=theme.SPACE_SM)
-            
-        except Exception as e:
-            print(f"Error creando gráfico de barras: {e}")
-            # Crear mensaje de error
-            error_label = ctk.CTkLabel(
-                chart_frame,
-                text="Error al cargar gráfico de barras",
-                font=theme.font(theme.SIZE_SMALL),
-                text_color=theme.DANGER
-            )
-            error_label.pack(expand=True)
+        """Crear widget de gráfico de barras (pagos por método)"""
+        self.create_chart_card(parent, row, column, "payments", self.chart_data.payments_by_method,
+                               self.draw_bar_chart, (5.5, 4), "Error al cargar gráfico de barras")
+    
+    def draw_bar_chart(self, data, size):
+        """Crear gráfico de barras"""
+        values, labels = data
+        return self.chart_generator.create_bar_chart(
+            data=values,
+            labels=labels,
+            title="Pagos por Método",
+            xlabel="Método de Pago",
+            ylabel="Cantidad de Pagos",
+            width=size[0],
+            height=size[1]
+        )
     
     def create_histogram_widget(self, parent, row=0, column=0):
-        """Crear widget de histograma"""
-        try:
-            # Frame del gráfico
-            chart_frame = ctk.CTkFrame(
-                parent,
-                width=350,
-                height=320,
-                corner_radius=theme.RADIUS_LG,
-                fg_color=theme.SURFACE,
-                border_width=1,
-                border_color=theme.BORDER
-            )
-            chart_frame.grid(row=row, column=column,
-                             padx=(0 if column == 0 else theme.SPACE_SM, theme.SPACE_SM),
-                             pady=theme.SPACE_SM, sticky="nsew")
-            chart_frame.pack_propagate(False)
-            
-            # Obtener datos para el histograma
-            ages = self.chart_generator.get_student_age_distribution_data(self.student_repo)
-            
-            # Crear histograma
-            fig = self.chart_generator.create_histogram(
-                data=ages,
-                title="Distribución de Edades",
-                xlabel="Edad",
-                ylabel="Cantidad de Estudiantes",
-                bins=8,
-                width=5.5,
-                height=4
-            )
-            
-            # Crear widget de matplotlib
-            canvas = create_matplotlib_widget(fig, chart_frame)
-            canvas.get_tk_widget().pack(fill="both", expand=True,
-                                        padx=theme.SPACE_SM, pady=theme.SPACE_SM)
-            
-        except Exception as e:
-            print(f"Error creando histograma: {e}")
-            # Crear mensaje de error
-            error_label = ctk.CTkLabel(
-                chart_frame,
-                text="Error al cargar histograma",
-                font=theme.font(theme.SIZE_SMALL),
-                text_color=theme.DANGER
-            )
-            error_label.pack(expand=True)
+        """Crear widget de histograma (distribución de edades)"""
+        self.create_chart_card(parent, row, column, "ages", self.chart_data.student_ages,
+                               self.draw_histogram, (5.5, 4), "Error al cargar histograma")
     
-    def create_scatter_plot_widget(self, parent, row=0, column=0):
-        """Crear widget de gráfico de dispersión"""
-        try:
-            # Frame del gráfico
-            chart_frame = ctk.CTkFrame(
-                parent,
-                width=350,
-                height=320,
-                corner_radius=theme.RADIUS_LG,
-                fg_color=theme.SURFACE,
-                border_width=1,
-                border_color=theme.BORDER
-            )
-            chart_frame.grid(row=row, column=column,
-                             padx=(0 if column == 0 else theme.SPACE_SM, theme.SPACE_SM),
-                             pady=theme.SPACE_SM, sticky="nsew")
-            chart_frame.pack_propagate(False)
-            
-            # Obtener datos para el gráfico de dispersión
-            x_data, y_data = self.chart_generator.get_course_performance_data(
-                self.course_repo, self.student_repo, self.inscription_repo
-            )
-            
-            # Crear gráfico de dispersión
-            fig = self.chart_generator.create_scatter_plot(
-                x_data=x_data,
-                y_data=y_data,
-                title="Rendimiento por Curso",
-                xlabel="Estudiantes Inscritos",
-                ylabel="Rendimiento (%)",
-                width=5.5,
-                height=4
-            )
-            
-            # Crear widget de matplotlib
-            canvas = create_matplotlib_widget(fig, chart_frame)
-            canvas.get_tk_widget().pack(fill="both", expand=True,
-                                        padx=theme.SPACE_SM, pady=theme.SPACE_SM)
-            
-        except Exception as e:
-            print(f"Error creando gráfico de dispersión: {e}")
-            # Crear mensaje de error
-            error_label = ctk.CTkLabel(
-                chart_frame,
-                text="Error al cargar gráfico de dispersión",
-                font=theme.font(theme.SIZE_SMALL),
-                text_color=theme.DANGER
-            )
-            error_label.pack(expand=True)
+    def draw_histogram(self, data, size):
+        """Crear histograma (edades ya agrupadas: cada edad pesa su cantidad)"""
+        ages, counts = data
+        return self.chart_generator.create_histogram(
+            data=ages,
+            weights=counts,
+            title="Distribución de Edades",
+            xlabel="Edad",
+            ylabel="Cantidad de Estudiantes",
+            bins=8,
+            width=size[0],
+            height=size[1]
+        )
+    
+    def create_course_chart_widget(self, parent, row=0, column=0):
+        """Crear widget de gráfico de matrículas por curso"""
+        self.create_chart_card(parent, row, column, "courses", self.chart_data.inscriptions_by_course,
+                               self.draw_course_chart, (5.5, 4), "Error al cargar gráfico de cursos")
+    
+    def draw_course_chart(self, data, size):
+        """Crear gráfico de barras de matrículas por curso (a través de las aulas)"""
+        values, labels = data
+        return self.chart_generator.create_bar_chart(
+            data=values,
+            labels=labels,
+            title="Matrículas por Curso",
+            xlabel="Curso",
+            ylabel="Cantidad de Matrículas",
+            width=size[0],
+            height=size[1]
+        )
     
     def get_chart_color(self, index):
         """Obtener color para gráficos basado en índice"""
@@ -882,7 +949,7 @@ class DashboardPage:
         encargado_label.pack(anchor="w")
         
         self.ciclo_encargado_var = ctk.StringVar()
-        self.ciclo_encargado_var.trace('w', self.filter_ciclos)
+        self.ciclo_encargado_var.trace('w', self.ciclo_filter_debounce)
         encargado_entry = ctk.CTkEntry(
             encargado_frame,
             placeholder_text="Buscar por encargado...",
@@ -901,7 +968,7 @@ class DashboardPage:
         
         self.ciclo_año_var = ctk.StringVar()
         self.ciclo_año_var.set("Todos")
-        self.ciclo_año_var.trace('w', self.filter_ciclos)
+        self.ciclo_año_var.trace('w', self.ciclo_filter_debounce)
         año_combo = ctk.CTkComboBox(
             año_frame,
             values=["Todos", "2023", "2024", "2025", "2026"],
@@ -920,7 +987,7 @@ class DashboardPage:
         
         self.ciclo_numero_var = ctk.StringVar()
         self.ciclo_numero_var.set("Todos")
-        self.ciclo_numero_var.trace('w', self.filter_ciclos)
+        self.ciclo_numero_var.trace('w', self.ciclo_filter_debounce)
         ciclo_combo = ctk.CTkComboBox(
             ciclo_frame,
             values=["Todos", "I", "II", "III", "IV", "V"],
@@ -942,7 +1009,7 @@ class DashboardPage:
         fecha_inicio_label.pack(anchor="w")
         
         self.ciclo_fecha_inicio_var = ctk.StringVar()
-        self.ciclo_fecha_inicio_var.trace('w', self.filter_ciclos)
+        self.ciclo_fecha_inicio_var.trace('w', self.ciclo_filter_debounce)
         fecha_inicio_entry = ctk.CTkEntry(
             fecha_inicio_frame,
             placeholder_text="DD-MM-AAAA",
@@ -960,7 +1027,7 @@ class DashboardPage:
         fecha_cierre_label.pack(anchor="w")
         
         self.ciclo_fecha_cierre_var = ctk.StringVar()
-        self.ciclo_fecha_cierre_var.trace('w', self.filter_ciclos)
+        self.ciclo_fecha_cierre_var.trace('w', self.ciclo_filter_debounce)
         fecha_cierre_entry = ctk.CTkEntry(
             fecha_cierre_frame,
             placeholder_text="DD-MM-AAAA",
@@ -1090,6 +1157,7 @@ class DashboardPage:
         self.ciclo_numero_var.set("Todos")
         self.ciclo_fecha_inicio_var.set("")
         self.ciclo_fecha_cierre_var.set("")
+        self.ciclo_filter_debounce.cancel()
         self.filter_ciclos()
     
     def on_ciclo_select(self, event):
@@ -1166,54 +1234,59 @@ class DashboardPage:
             messagebox.showerror("Error", f"Error al exportar: {e}")
     
     def load_ciclos(self):
-        """Cargar ciclos desde la base de datos"""
+        """Cargar la página actual de ciclos desde la base de datos"""
         try:
-            # Obtener todos los ciclos
-            ciclos = self.cicle_repo.get_all_rows()
-            
-            # Aplicar filtros
-            ciclos_filtrados = self.apply_ciclo_filters(ciclos)
+            # Filtros y paginación se resuelven en SQL (LIMIT/OFFSET + COUNT)
+            page = self.cicle_repo.get_page(
+                self.current_cicle_page,
+                self.cicles_per_page,
+                where=self.build_ciclo_filters()
+            )
+            self.current_cicle_page = page["page"]
+            self.ciclo_total_pages = page["pages"]
             
             # Actualizar tabla
-            self.update_ciclo_table(ciclos_filtrados)
+            self.update_ciclo_table(page["rows"])
             
             # Actualizar paginación
-            total_pages = (len(ciclos_filtrados) + self.cicles_per_page - 1) // self.cicles_per_page
-            self.ciclo_pagination_label.configure(text=f"{self.current_cicle_page}/{max(1, total_pages)} Páginas")
+            self.ciclo_pagination_label.configure(text=f"{page['page']}/{page['pages']} Páginas")
             
         except Exception as e:
             messagebox.showerror("Error", f"Error al cargar ciclos: {e}")
     
-    def apply_ciclo_filters(self, ciclos):
-        """Aplicar filtros a la lista de ciclos"""
-        filtered = ciclos.copy()
+    def build_ciclo_filters(self):
+        """Construir el filtro de ciclos para la consulta"""
+        where = {}
         
         # Filtrar por encargado
-        encargado = self.ciclo_encargado_var.get().strip().lower()
+        encargado = self.ciclo_encargado_var.get().strip()
         if encargado:
-            filtered = [c for c in filtered if encargado in c.get("manager", "").lower()]
+            where["manager"] = {"contains": encargado}
         
-        # Filtrar por año
+        # Filtrar por año y fecha inicio
         año = self.ciclo_año_var.get()
+        fecha_inicio = self.ciclo_fecha_inicio_var.get().strip()
+        date_start = {}
         if año != "Todos":
-            filtered = [c for c in filtered if str(c.get("date_start", "")).startswith(año)]
+            # Rango de fechas ISO: DATE tiene afinidad numérica y un prefijo "2024" se compararía como número
+            date_start["gte"] = f"{año}-01-01"
+            date_start["lt"] = f"{int(año) + 1}-01-01"
+        if fecha_inicio:
+            date_start["contains"] = fecha_inicio
+        if date_start:
+            where["date_start"] = date_start
         
         # Filtrar por ciclo
         ciclo = self.ciclo_numero_var.get()
         if ciclo != "Todos":
-            filtered = [c for c in filtered if c.get("cicle", "") == ciclo]
-        
-        # Filtrar por fecha inicio
-        fecha_inicio = self.ciclo_fecha_inicio_var.get().strip()
-        if fecha_inicio:
-            filtered = [c for c in filtered if fecha_inicio in str(c.get("date_start", ""))]
+            where["cicle"] = ciclo
         
         # Filtrar por fecha cierre
         fecha_cierre = self.ciclo_fecha_cierre_var.get().strip()
         if fecha_cierre:
-            filtered = [c for c in filtered if fecha_cierre in str(c.get("date_end", ""))]
+            where["date_end"] = {"contains": fecha_cierre}
         
-        return filtered
+        return where
     
     def update_ciclo_table(self, ciclos):
         """Actualizar la tabla de ciclos"""
@@ -1221,12 +1294,8 @@ class DashboardPage:
         for item in self.ciclo_tree.get_children():
             self.ciclo_tree.delete(item)
         
-        # Calcular rango de páginas
-        start_idx = (self.current_cicle_page - 1) * self.cicles_per_page
-        end_idx = start_idx + self.cicles_per_page
-        
         # Agregar ciclos de la página actual
-        for ciclo in ciclos[start_idx:end_idx]:
+        for ciclo in ciclos:
             año = str(ciclo.get("date_start", ""))[:4] if ciclo.get("date_start") else ""
             fecha_inicio = str(ciclo.get("date_start", "")) if ciclo.get("date_start") else ""
             fecha_fin = str(ciclo.get("date_end", "")) if ciclo.get("date_end") else ""
@@ -1241,7 +1310,7 @@ class DashboardPage:
                 acciones = "Ver | Editar | Activar"
                 tags = ("inactivo",)
             
-            item_id = self.ciclo_tree.insert("", "end", values=(
+            item_id = self.ciclo_tree.insert("", "end", iid=ciclo["id"], values=(
                 estado,
                 año,
                 ciclo.get("cicle", ""),
@@ -1256,7 +1325,7 @@ class DashboardPage:
                 self.ciclo_tree.set(item_id, "#", len(self.ciclo_tree.get_children()))
     
     def filter_ciclos(self, *args):
-        """Filtrar ciclos en tiempo real"""
+        """Filtrar ciclos en la base de datos (llamado con retraso por ciclo_filter_debounce)"""
         self.current_cicle_page = 1
         self.load_ciclos()
     
@@ -1268,16 +1337,9 @@ class DashboardPage:
     
     def next_ciclo_page(self):
         """Ir a la página siguiente de ciclos"""
-        try:
-            ciclos = self.cicle_repo.get_all_rows()
-            ciclos_filtrados = self.apply_ciclo_filters(ciclos)
-            total_pages = (len(ciclos_filtrados) + self.cicles_per_page - 1) // self.cicles_per_page
-            
-            if self.current_cicle_page < total_pages:
-                self.current_cicle_page += 1
-                self.load_ciclos()
-        except Exception as e:
-            messagebox.showerror("Error", f"Error en paginación: {e}")
+        if self.current_cicle_page < self.ciclo_total_pages:
+            self.current_cicle_page += 1
+            self.load_ciclos()
     
     def show_add_ciclo_dialog(self):
         """Mostrar diálogo para agregar nuevo ciclo"""
@@ -1427,8 +1489,7 @@ class DashboardPage:
         """Activar un ciclo específico"""
         try:
             # Obtener el ciclo por ID
-            ciclos = self.cicle_repo.get_all_rows()
-            ciclo = next((c for c in ciclos if c.get("id") == ciclo_id), None)
+            ciclo = self.cicle_repo.get_row_by_id(ciclo_id)
             
             if ciclo:
                 self.active_cicle = ciclo
@@ -1449,6 +1510,27 @@ class DashboardPage:
         except Exception as e:
             messagebox.showerror("Error", f"Error al activar ciclo: {e}")
     
+    @staticmethod
+    def tree_row_id(tree, item=None):
+        """
+        Obtener el id de una fila de un Treeview.
+        Las filas de datos se insertan con iid = clave primaria; las filas
+        informativas (p. ej. "No hay estudiantes inscritos") no tienen id.
+        
+        Args:
+            tree: Treeview de la fila
+            item (str, optional): iid de la fila; por defecto, la seleccionada
+            
+        Returns:
+            int: Id de la fila, o None si no hay fila de datos
+        """
+        if item is None:
+            selection = tree.selection()
+            item = selection[0] if selection else None
+        if item and str(item).isdigit():
+            return int(item)
+        return None
+    
     def update_ciclo_title(self):
         """Actualizar el título con el ciclo activo"""
         # El título ahora es fijo como "CICLOS"
@@ -1466,9 +1548,10 @@ class DashboardPage:
             self.ciclo_tree.selection_set(item)
             values = self.ciclo_tree.item(item, "values")
             
-            # Obtener ID del ciclo (asumiendo que está en los datos)
-            # Por simplicidad, usaremos el índice como ID temporal
-            ciclo_index = self.ciclo_tree.index(item)
+            # Las filas se insertan con iid = id del ciclo
+            ciclo_id = self.tree_row_id(self.ciclo_tree, item)
+            if ciclo_id is None:
+                return
             
             # Crear menú contextual
             context_menu = tk.Menu(self.parent, tearoff=0)
@@ -1488,7 +1571,7 @@ class DashboardPage:
             # Eliminar
             context_menu.add_command(
                 label="Eliminar Ciclo",
-                command=lambda: self.delete_ciclo(ciclo_index + 1)  # ID temporal
+                command=lambda: self.delete_ciclo(ciclo_id)
             )
             
             # Separador
@@ -1503,7 +1586,7 @@ class DashboardPage:
             else:
                 context_menu.add_command(
                     label="Activar Ciclo",
-                    command=lambda: self.activate_ciclo(ciclo_index + 1)  # ID temporal
+                    command=lambda: self.activate_ciclo(ciclo_id)
                 )
             
             # Mostrar menú
@@ -1530,12 +1613,7 @@ class DashboardPage:
         """Eliminar ciclo con confirmación"""
         try:
             # Obtener datos del ciclo
-            ciclos = self.cicle_repo.get_all_rows()
-            ciclo_data = None
-            
-            # Buscar el ciclo por índice (temporal)
-            if ciclo_id <= len(ciclos):
-                ciclo_data = ciclos[ciclo_id - 1]
+            ciclo_data = self.cicle_repo.get_row_by_id(ciclo_id)
             
             if not ciclo_data:
                 messagebox.showerror("Error", "No se pudo encontrar el ciclo.")
@@ -1579,19 +1657,11 @@ class DashboardPage:
     def on_ciclo_double_click(self, event):
         """Manejar doble clic en fila de ciclo para ver aulas"""
         try:
-            # Obtener elemento seleccionado
-            item = self.ciclo_tree.selection()[0] if self.ciclo_tree.selection() else None
-            if not item:
+            # Obtener el ciclo seleccionado por su id
+            ciclo_id = self.tree_row_id(self.ciclo_tree)
+            if ciclo_id is None:
                 return
-            
-            # Obtener datos del ciclo
-            values = self.ciclo_tree.item(item, "values")
-            ciclo_name = values[2]  # Columna "Ciclo"
-            año = values[1]  # Columna "Año"
-            
-            # Obtener el ciclo completo de la base de datos
-            ciclos = self.cicle_repo.get_all_rows()
-            ciclo_data = next((c for c in ciclos if c.get("cicle") == ciclo_name), None)
+            ciclo_data = self.cicle_repo.get_row_by_id(ciclo_id)
             
             if ciclo_data:
                 # Mostrar vista de aulas del ciclo
@@ -1722,11 +1792,8 @@ class DashboardPage:
     def load_aulas_del_ciclo(self, tree, ciclo_id):
         """Cargar aulas de un ciclo específico"""
         try:
-            # Obtener todas las aulas
-            aulas = self.classroom_repo.get_all_rows()
-            
-            # Filtrar aulas del ciclo
-            aulas_ciclo = [aula for aula in aulas if aula.get("id_cicle") == ciclo_id]
+            # Obtener las aulas del ciclo
+            aulas_ciclo = self.classroom_repo.get_all_rows(where={"id_cicle": ciclo_id})
             
             # Obtener datos de cursos y docentes para mostrar nombres
             cursos = self.course_repo.get_all_rows()
@@ -1746,7 +1813,7 @@ class DashboardPage:
                 curso_nombre = cursos_dict.get(aula.get("id_course"), "Curso no encontrado")
                 docente_nombre = docentes_dict.get(aula.get("id_teacher"), "Docente no encontrado")
                 
-                tree.insert("", "end", values=(
+                tree.insert("", "end", iid=aula["id"], values=(
                     curso_nombre,
                     aula.get("name", ""),
                     docente_nombre,
@@ -1761,23 +1828,24 @@ class DashboardPage:
     def on_aula_double_click(self, event, tree, ciclo_data):
         """Manejar doble clic en aula para ver matriculados"""
         try:
-            # Obtener elemento seleccionado
-            item = tree.selection()[0] if tree.selection() else None
-            if not item:
+            # Obtener el aula seleccionada por su id
+            aula_id = self.tree_row_id(tree)
+            if aula_id is None:
+                return
+            aula = self.classroom_repo.get_row_by_id(aula_id)
+            if not aula:
+                messagebox.showerror("Error", "No se pudo encontrar los datos del aula.")
                 return
-            
-            # Obtener datos del aula
-            values = tree.item(item, "values")
-            aula_name = values[1]  # Columna "Aula"
             
             # Mostrar matriculados del aula
-            self.show_matriculados_del_aula(aula_name, ciclo_data)
+            self.show_matriculados_del_aula(aula, ciclo_data)
             
         except Exception as e:
             messagebox.showerror("Error", f"Error al mostrar matriculados: {e}")
     
-    def show_matriculados_del_aula(self, aula_name, ciclo_data):
-        """Mostrar matriculados de un aula específica"""
+    def show_matriculados_del_aula(self, aula, ciclo_data):
+        """Mostrar matriculados de un aula específica (aula: fila de classroom)"""
+        aula_name = aula.get("name", "")
         # Crear ventana modal para matriculados
         dialog = ctk.CTkToplevel(self.parent)
         dialog.title(f"Matriculados - {aula_name}")
@@ -1822,7 +1890,7 @@ class DashboardPage:
             text="Agregar Matrícula",
             width=180,
             height=40,
-            command=lambda: self.show_add_matricula_dialog(aula_name, ciclo_data),
+            command=lambda: self.show_add_matricula_dialog(aula, ciclo_data),
             fg_color=theme.ACCENT,
             hover_color=theme.ACCENT_DARK,
             font=theme.font(theme.SIZE_BODY, "bold")
@@ -1863,11 +1931,11 @@ class DashboardPage:
         scrollbar.pack(side="right", fill="y")
         
         # Agregar eventos para editar y eliminar matrículas
-        matriculados_tree.bind("<Double-1>", lambda e: self.show_edit_matricula_dialog(e, matriculados_tree, aula_name, ciclo_data))
-        matriculados_tree.bind("<Button-3>", lambda e: self.show_matricula_context_menu(e, matriculados_tree, aula_name, ciclo_data))
+        matriculados_tree.bind("<Double-1>", lambda e: self.show_edit_matricula_dialog(e, matriculados_tree, aula, ciclo_data))
+        matriculados_tree.bind("<Button-3>", lambda e: self.show_matricula_context_menu(e, matriculados_tree, aula, ciclo_data))
         
         # Cargar matriculados del aula
-        self.load_matriculados_del_aula(matriculados_tree, aula_name)
+        self.load_matriculados_del_aula(matriculados_tree, aula["id"])
         
         # Botón cerrar
         close_btn = ctk.CTkButton(
@@ -1882,37 +1950,23 @@ class DashboardPage:
         )
         close_btn.pack(pady=(0, 20))
     
-    def load_matriculados_del_aula(self, tree, aula_name):
+    def load_matriculados_del_aula(self, tree, aula_id):
         """Cargar matriculados de un aula específica desde la base de datos"""
         try:
-            # Importar repositorios necesarios
-            from control.inscription_repository import InscriptionRepository
-            from control.student_repository import StudentRepository
-            from control.classroom_repository import ClassroomRepository
-            from control.payment_repository import PaymentRepository
-            
-            # Crear repositorios
-            inscription_repo = InscriptionRepository()
-            student_repo = StudentRepository()
-            classroom_repo = ClassroomRepository()
-            payment_repo = PaymentRepository()
-            
-            # Obtener ID del aula por nombre
-            classroom = classroom_repo.get_row_value({"name": aula_name})
+            # Obtener el aula por su id
+            classroom = self.classroom_repo.get_row_by_id(aula_id)
             if not classroom:
-                messagebox.showerror("Error", f"No se encontró el aula: {aula_name}")
+                messagebox.showerror("Error", "No se encontró el aula seleccionada.")
                 return
             
-            classroom_id = classroom["id"]
-            
-            # Obtener todas las inscripciones del aula
-            inscriptions = inscription_repo.get_all_rows({"id_classroom": classroom_id})
+            # Inscripciones con estudiante, equipo y cantidad de pagos en una sola consulta
+            roster = self.inscription_repo.get_classroom_roster(aula_id)
             
             # Limpiar tabla
             for item in tree.get_children():
                 tree.delete(item)
             
-            if not inscriptions:
+            if not roster:
                 # Mostrar mensaje si no hay inscripciones
                 tree.insert("", "end", values=(
                     "No hay estudiantes inscritos",
@@ -1920,68 +1974,36 @@ class DashboardPage:
                 ))
                 return
             
-            # Procesar cada inscripción
-            for inscription in inscriptions:
-                try:
-                    # Obtener datos del estudiante
-                    student = student_repo.get_row_value({"id": inscription["id_student"]})
-                    if not student:
-                        continue  # Saltar si no se encuentra el estudiante
-                    
-                    # Obtener datos del curso (usando el aula como curso)
-                    course_name = classroom.get("name", "Sin nombre")
-                    
-                    # Obtener datos de la red (usando el equipo del estudiante)
-                    from control.team_repository import TeamRepository
-                    team_repo = TeamRepository()
-                    team = team_repo.get_row_value({"id": student.get("id_team")})
-                    team_name = team.get("name", "Sin equipo") if team else "Sin equipo"
-                    
-                    # Formatear fecha de inscripción
-                    fecha_matricula = inscription.get("date_inscription", "")
-                    if fecha_matricula:
-                        try:
-                            from datetime import datetime
-                            fecha_obj = datetime.strptime(fecha_matricula, "%Y-%m-%d")
-                            fecha_formateada = fecha_obj.strftime("%d-%m-%Y")
-                        except:
-                            fecha_formateada = fecha_matricula
-                    else:
-                        fecha_formateada = "Sin fecha"
-                    
-                    # Obtener tipo de material
-                    tipo_material = inscription.get("type_material", "Sin especificar")
-                    
-                    # Estado de la inscripción
-                    estado = "Activo" if inscription.get("status", False) else "Inactivo"
-                    
-                    # Estado del material
-                    material_estado = "Entregado" if inscription.get("status_material", False) else "Pendiente"
-                    
-                    # Contar pagos de la inscripción
-                    payments = payment_repo.get_all_rows({"id_inscription": inscription["id"]})
-                    num_pagos = len(payments) if payments else 0
-                    pagos_text = f"{num_pagos}" if num_pagos > 0 else "0"
-                    
-                    # Nombre completo del estudiante
-                    nombre_completo = f"{student.get('name', '')} {student.get('lastname', '')}".strip()
-                    
-                    # Insertar en la tabla
-                    tree.insert("", "end", values=(
-                        nombre_completo,
-                        course_name,
-                        team_name,
-                        fecha_formateada,
-                        tipo_material,
-                        estado,
-                        material_estado,
-                        pagos_text,
-                        "Editar | Eliminar"
-                    ))
-                    
-                except Exception as e:
-                    print(f"Error procesando inscripción {inscription.get('id', 'N/A')}: {e}")
-                    continue
+            # Obtener datos del curso (usando el aula como curso)
+            course_name = classroom.get("name", "Sin nombre")
+            
+            from datetime import datetime
+            for inscription in roster:
+                # Formatear fecha de inscripción
+                fecha_matricula = inscription.get("date_inscription", "")
+                if fecha_matricula:
+                    try:
+                        fecha_formateada = datetime.strptime(fecha_matricula, "%Y-%m-%d").strftime("%d-%m-%Y")
+                    except (TypeError, ValueError):
+                        fecha_formateada = fecha_matricula
+                else:
+                    fecha_formateada = "Sin fecha"
+                
+                # Nombre completo del estudiante
+                nombre_completo = f"{inscription.get('student_name') or ''} {inscription.get('student_lastname') or ''}".strip()
+                
+                # Insertar en la tabla (iid = id de la inscripción)
+                tree.insert("", "end", iid=inscription["id"], values=(
+                    nombre_completo,
+                    course_name,
+                    inscription.get("team_name") or "Sin equipo",
+                    fecha_formateada,
+                    inscription.get("type_material", "Sin especificar"),
+                    "Activo" if inscription.get("status", False) else "Inactivo",
+                    "Entregado" if inscription.get("status_material", False) else "Pendiente",
+                    str(inscription.get("payment_count", 0)),
+                    "Editar | Eliminar"
+                ))
                 
         except Exception as e:
             messagebox.showerror("Error", f"Error al cargar matriculados: {e}")
@@ -1989,7 +2011,22 @@ class DashboardPage:
             import traceback
             traceback.print_exc()
     
-    def show_matricula_context_menu(self, event, tree, aula_name, ciclo_data):
+    def get_matricula(self, inscription_id):
+        """
+        Obtener una inscripción y el nombre de su estudiante por id.
+        Muestra el error y devuelve (None, None) si alguno no existe.
+        """
+        inscription = self.inscription_repo.get_row_by_id(inscription_id)
+        if not inscription:
+            messagebox.showerror("Error", "No se encontró la matrícula.")
+            return None, None
+        student = self.student_repo.get_row_by_id(inscription["id_student"])
+        if not student:
+            messagebox.showerror("Error", "No se pudo encontrar los datos del estudiante.")
+            return None, None
+        return inscription, f"{student.get('name') or ''} {student.get('lastname') or ''}".strip()
+    
+    def show_matricula_context_menu(self, event, tree, aula, ciclo_data):
         """Mostrar menú contextual para matrícula"""
         try:
             # Obtener elemento seleccionado
@@ -1999,10 +2036,10 @@ class DashboardPage:
             
             # Seleccionar el elemento
             tree.selection_set(item)
-            values = tree.item(item, "values")
             
-            # Verificar que no sea la fila de "No hay estudiantes inscritos"
-            if values[0] == "No hay estudiantes inscritos":
+            # La fila de "No hay estudiantes inscritos" no tiene id
+            inscription_id = self.tree_row_id(tree, item)
+            if inscription_id is None:
                 return
             
             # Crear menú contextual
@@ -2011,19 +2048,19 @@ class DashboardPage:
             # Editar matrícula
             context_menu.add_command(
                 label="Editar Matrícula",
-                command=lambda: self.show_edit_matricula_dialog(event, tree, aula_name, ciclo_data)
+                command=lambda: self.show_edit_matricula_dialog(event, tree, aula, ciclo_data)
             )
             
             # Eliminar matrícula
             context_menu.add_command(
                 label="Eliminar Matrícula",
-                command=lambda: self.delete_matricula_from_context(values, tree, aula_name, ciclo_data)
+                command=lambda: self.delete_matricula_from_context(inscription_id, tree, aula, ciclo_data)
             )
             
             # Ver pagos
             context_menu.add_command(
                 label="Ver Pagos",
-                command=lambda: self.show_pagos_matricula(values, tree, aula_name, ciclo_data)
+                command=lambda: self.show_pagos_matricula(inscription_id, tree, aula, ciclo_data)
             )
             
             # Mostrar menú
@@ -2032,59 +2069,22 @@ class DashboardPage:
         except Exception as e:
             messagebox.showerror("Error", f"Error en menú contextual: {e}")
     
-    def show_edit_matricula_dialog(self, event, tree, aula_name, ciclo_data):
+    def show_edit_matricula_dialog(self, event, tree, aula, ciclo_data):
         """Mostrar diálogo para editar matrícula"""
         try:
-            # Obtener elemento seleccionado
-            item = tree.selection()[0] if tree.selection() else None
-            if not item:
+            # Obtener la matrícula seleccionada (iid = id de la inscripción)
+            inscription_id = self.tree_row_id(tree)
+            if inscription_id is None:
                 messagebox.showwarning("Advertencia", "Por favor seleccione una matrícula para editar")
                 return
             
-            # Obtener datos de la matrícula
-            values = tree.item(item, "values")
-            estudiante_name = values[0]  # Columna "Estudiante"
-            
-            # Obtener la matrícula completa de la base de datos
             from control.inscription_repository import InscriptionRepository
-            from control.student_repository import StudentRepository
-            from control.classroom_repository import ClassroomRepository
             
             inscription_repo = InscriptionRepository()
-            student_repo = StudentRepository()
-            classroom_repo = ClassroomRepository()
-            
-            # Buscar el estudiante por nombre
-            students = student_repo.get_all_rows()
-            student_data = None
-            for student in students:
-                full_name = f"{student.get('name', '')} {student.get('lastname', '')}".strip()
-                if full_name == estudiante_name:
-                    student_data = student
-                    break
-            
-            if not student_data:
-                messagebox.showerror("Error", "No se pudo encontrar los datos del estudiante.")
+            inscription_data, estudiante_name = self.get_matricula(inscription_id)
+            if not inscription_data:
                 return
             
-            # Buscar la inscripción del estudiante en esta aula
-            classroom = classroom_repo.get_row_value({"name": aula_name})
-            if not classroom:
-                messagebox.showerror("Error", "No se pudo encontrar el aula.")
-                return
-            
-            inscriptions = inscription_repo.get_all_rows({
-                "id_student": student_data["id"],
-                "id_classroom": classroom["id"]
-            })
-            
-            if not inscriptions:
-                messagebox.showerror("Error", "No se encontró la matrícula.")
-                return
-            
-            # Usar la primera inscripción encontrada
-            inscription_data = inscriptions[0]
-            
             # Crear diálogo de edición
             dialog = ctk.CTkToplevel(self.parent)
             dialog.title(f"Editar Matrícula - {estudiante_name}")
@@ -2194,7 +2194,7 @@ class DashboardPage:
                         messagebox.showinfo("Éxito", f"Matrícula de {estudiante_name} actualizada correctamente")
                         dialog.destroy()
                         # Recargar la tabla de matriculados
-                        self.load_matriculados_del_aula(tree, aula_name)
+                        self.load_matriculados_del_aula(tree, aula["id"])
                     else:
                         messagebox.showerror("Error", "No se pudo actualizar la matrícula")
                         
@@ -2239,51 +2239,16 @@ class DashboardPage:
             import traceback
             traceback.print_exc()
     
-    def delete_matricula_from_context(self, values, tree, aula_name, ciclo_data):
+    def delete_matricula_from_context(self, inscription_id, tree, aula, ciclo_data):
         """Eliminar matrícula desde el menú contextual"""
         try:
-            estudiante_name = values[0]  # Columna "Estudiante"
-            
-            # Obtener datos de la matrícula
             from control.inscription_repository import InscriptionRepository
-            from control.student_repository import StudentRepository
-            from control.classroom_repository import ClassroomRepository
             
             inscription_repo = InscriptionRepository()
-            student_repo = StudentRepository()
-            classroom_repo = ClassroomRepository()
-            
-            # Buscar el estudiante por nombre
-            students = student_repo.get_all_rows()
-            student_data = None
-            for student in students:
-                full_name = f"{student.get('name', '')} {student.get('lastname', '')}".strip()
-                if full_name == estudiante_name:
-                    student_data = student
-                    break
-            
-            if not student_data:
-                messagebox.showerror("Error", "No se pudo encontrar los datos del estudiante.")
-                return
-            
-            # Buscar la inscripción del estudiante en esta aula
-            classroom = classroom_repo.get_row_value({"name": aula_name})
-            if not classroom:
-                messagebox.showerror("Error", "No se pudo encontrar el aula.")
-                return
-            
-            inscriptions = inscription_repo.get_all_rows({
-                "id_student": student_data["id"],
-                "id_classroom": classroom["id"]
-            })
-            
-            if not inscriptions:
-                messagebox.showerror("Error", "No se encontró la matrícula.")
+            inscription_data, estudiante_name = self.get_matricula(inscription_id)
+            if not inscription_data:
                 return
             
-            # Usar la primera inscripción encontrada
-            inscription_data = inscriptions[0]
-            
             # Mostrar confirmación
             result = messagebox.askyesno(
                 "Confirmar Eliminación",
@@ -2301,7 +2266,7 @@ class DashboardPage:
                 if success:
                     messagebox.showinfo("Éxito", f"Matrícula de '{estudiante_name}' eliminada correctamente")
                     # Recargar matriculados
-                    self.load_matriculados_del_aula(tree, aula_name)
+                    self.load_matriculados_del_aula(tree, aula["id"])
                 else:
                     messagebox.showerror("Error", "No se pudo eliminar la matrícula")
                     
@@ -2310,55 +2275,19 @@ class DashboardPage:
             import traceback
             traceback.print_exc()
     
-    def show_pagos_matricula(self, values, tree, aula_name, ciclo_data):
+    def show_pagos_matricula(self, inscription_id, tree, aula, ciclo_data):
         """Mostrar los pagos de una matrícula específica"""
         try:
-            estudiante_name = values[0]  # Columna "Estudiante"
-            
-            # Obtener datos de la matrícula
-            from control.inscription_repository import InscriptionRepository
-            from control.student_repository import StudentRepository
-            from control.classroom_repository import ClassroomRepository
             from control.payment_repository import PaymentRepository
             
-            inscription_repo = InscriptionRepository()
-            student_repo = StudentRepository()
-            classroom_repo = ClassroomRepository()
             payment_repo = PaymentRepository()
-            
-            # Buscar el estudiante por nombre
-            students = student_repo.get_all_rows()
-            student_data = None
-            for student in students:
-                full_name = f"{student.get('name', '')} {student.get('lastname', '')}".strip()
-                if full_name == estudiante_name:
-                    student_data = student
-                    break
-            
-            if not student_data:
-                messagebox.showerror("Error", "No se pudo encontrar los datos del estudiante.")
-                return
-            
-            # Buscar la inscripción del estudiante en esta aula
-            classroom = classroom_repo.get_row_value({"name": aula_name})
-            if not classroom:
-                messagebox.showerror("Error", "No se pudo encontrar el aula.")
-                return
-            
-            inscriptions = inscription_repo.get_all_rows({
-                "id_student": student_data["id"],
-                "id_classroom": classroom["id"]
-            })
-            
-            if not inscriptions:
-                messagebox.showerror("Error", "No se encontró la matrícula.")
+            aula_name = aula.get("name", "")
+            inscription_data, estudiante_name = self.get_matricula(inscription_id)
+            if not inscription_data:
                 return
             
-            # Usar la primera inscripción encontrada
-            inscription_data = inscriptions[0]
-            
             # Obtener pagos de la inscripción
-            payments = payment_repo.get_all_rows({"id_inscription": inscription_data["id"]})
+            payments = payment_repo.get_all_rows(where={"id_inscription": inscription_data["id"]})
             
             # Crear ventana de pagos
             dialog = ctk.CTkToplevel(self.parent)
@@ -2487,9 +2416,11 @@ class DashboardPage:
             import traceback
             traceback.print_exc()
     
-    def show_add_matricula_dialog(self, aula_name, ciclo_data):
-        """Mostrar diálogo para agregar nueva matrícula"""
+    def show_add_matricula_dialog(self, aula, ciclo_data):
+        """Mostrar diálogo para agregar nueva matrícula (aula: fila de classroom)"""
         try:
+            aula_name = aula.get("name", "")
+            
             # Crear diálogo
             dialog = ctk.CTkToplevel(self.parent)
             dialog.title(f"Agregar Matrícula - {aula_name}")
@@ -2532,8 +2463,9 @@ class DashboardPage:
             
             # Obtener datos necesarios
             students = student_repo.get_all_rows()
+            students_by_name = {f"{s['name']} {s['lastname']}": s for s in students}
             teams = team_repo.get_all_rows()
-            classroom = classroom_repo.get_row_value({"name": aula_name})
+            classroom = classroom_repo.get_row_by_id(aula["id"])
             
             if not classroom:
                 messagebox.showerror("Error", f"No se encontró el aula: {aula_name}")
@@ -2557,7 +2489,7 @@ class DashboardPage:
             student_combo = ctk.CTkComboBox(
                 main_frame,
                 variable=selected_student,
-                values=[f"{s['name']} {s['lastname']}" for s in students],
+                values=list(students_by_name),
                 width=500,
                 height=35
             )
@@ -2652,7 +2584,7 @@ class DashboardPage:
                     
                     # Obtener ID del estudiante seleccionado
                     student_name = selected_student.get()
-                    student_data = next((s for s in students if f"{s['name']} {s['lastname']}" == student_name), None)
+                    student_data = students_by_name.get(student_name) or student_repo.get_by_full_name(student_name)
                     if not student_data:
                         messagebox.showerror("Error", "No se encontró el estudiante seleccionado")
                         return
@@ -2973,8 +2905,7 @@ Puedes agregar más matrículas usando este formulario."""
         """Mostrar diálogo de matrícula desde la vista de aulas"""
         try:
             # Verificar si hay aulas en el ciclo
-            aulas = self.classroom_repo.get_all_rows()
-            aulas_ciclo = [aula for aula in aulas if aula.get("id_cicle") == ciclo_data.get('id')]
+            aulas_ciclo = self.classroom_repo.get_all_rows(where={"id_cicle": ciclo_data.get('id')})
             
             if not aulas_ciclo:
                 messagebox.showwarning(
@@ -3035,18 +2966,12 @@ Puedes agregar más matrículas usando este formulario."""
             aula_label = ctk.CTkLabel(selection_frame, text="Seleccionar Aula:", font=theme.font(theme.SIZE_BODY))
             aula_label.pack(pady=(0, 10), anchor="w")
             
-            # Crear lista de aulas
-            aulas_list = []
-            for aula in aulas_ciclo:
-                # Obtener nombre del curso
-                cursos = self.course_repo.get_all_rows()
-                curso_nombre = "Curso no encontrado"
-                for curso in cursos:
-                    if curso.get("id") == aula.get("id_course"):
-                        curso_nombre = curso.get("name", "")
-                        break
-                
-                aulas_list.append(f"{aula.get('name', '')} - {curso_nombre}")
+            # Crear lista de aulas (misma posición que en aulas_ciclo)
+            cursos_dict = {c.get("id"): c.get("name", "") for c in self.course_repo.get_all_rows()}
+            aulas_list = [
+                f"{aula.get('name', '')} - {cursos_dict.get(aula.get('id_course'), 'Curso no encontrado')}"
+                for aula in aulas_ciclo
+            ]
             
             # ComboBox para seleccionar aula
             aula_combo = ctk.CTkComboBox(
@@ -3068,13 +2993,12 @@ Puedes agregar más matrículas usando este formulario."""
                     return
                 
                 # Obtener el aula seleccionada
-                aula_nombre = aula_seleccionada.split(" - ")[0]
-                aula_data = next((a for a in aulas_ciclo if a.get("name") == aula_nombre), None)
+                aula_data = aulas_ciclo[aulas_list.index(aula_seleccionada)] if aula_seleccionada in aulas_list else None
                 
                 if aula_data:
                     dialog.destroy()
                     # Mostrar diálogo de matrícula para el aula seleccionada
-                    self.show_add_matricula_dialog(aula_nombre, ciclo_data)
+                    self.show_add_matricula_dialog(aula_data, ciclo_data)
                 else:
                     messagebox.showerror("Error", "No se pudo encontrar el aula seleccionada")
             
@@ -3109,17 +3033,18 @@ Puedes agregar más matrículas usando este formulario."""
         except Exception as e:
             messagebox.showerror("Error", f"Error al abrir selección de aula: {e}")
     
-    def show_aula_context_menu(self, event, tree, ciclo_data):
-        """Mostrar menú contextual para aula"""
+    def show_aula_context_menu(self, event, tree=None, ciclo_data=None):
+        """Mostrar menú contextual para aula (tabla de un ciclo o de Academia)"""
         try:
+            tree = tree or self.aulas_tree
             # Obtener elemento seleccionado
             item = tree.identify_row(event.y)
-            if not item:
+            aula_id = self.tree_row_id(tree, item)
+            if aula_id is None:
                 return
             
             # Seleccionar el elemento
             tree.selection_set(item)
-            values = tree.item(item, "values")
             
             # Crear menú contextual
             context_menu = tk.Menu(self.parent, tearoff=0)
@@ -3133,7 +3058,7 @@ Puedes agregar más matrículas usando este formulario."""
             # Eliminar aula
             context_menu.add_command(
                 label="Eliminar Aula",
-                command=lambda: self.delete_aula_from_context(values, tree, ciclo_data)
+                command=lambda: self.delete_aula_from_context(aula_id, tree, ciclo_data)
             )
             
             # Mostrar menú
@@ -3142,22 +3067,16 @@ Puedes agregar más matrículas usando este formulario."""
         except Exception as e:
             messagebox.showerror("Error", f"Error en menú contextual: {e}")
     
-    def show_edit_aula_dialog(self, event, tree, ciclo_data):
-        """Mostrar diálogo para editar aula"""
+    def show_edit_aula_dialog(self, event, tree=None, ciclo_data=None):
+        """Mostrar diálogo para editar aula (tabla de un ciclo o de Academia)"""
         try:
-            # Obtener elemento seleccionado
-            item = tree.selection()[0] if tree.selection() else None
-            if not item:
+            tree = tree or self.aulas_tree
+            # Obtener el aula seleccionada por su id
+            aula_id = self.tree_row_id(tree)
+            if aula_id is None:
                 messagebox.showwarning("Advertencia", "Por favor seleccione un aula para editar")
                 return
-            
-            # Obtener datos del aula
-            values = tree.item(item, "values")
-            aula_name = values[1]  # Columna "Aula"
-            
-            # Obtener el aula completo de la base de datos
-            aulas = self.classroom_repo.get_all_rows()
-            aula_data = next((a for a in aulas if a.get("name") == aula_name), None)
+            aula_data = self.classroom_repo.get_row_by_id(aula_id)
             
             if not aula_data:
                 messagebox.showerror("Error", "No se pudo encontrar los datos del aula.")
@@ -3322,7 +3241,7 @@ Puedes agregar más matrículas usando este formulario."""
                         messagebox.showinfo("Éxito", "Aula actualizada correctamente")
                         dialog.destroy()
                         # Recargar aulas
-                        self.load_aulas_del_ciclo(tree, ciclo_data.get('id'))
+                        self.reload_aulas(tree, ciclo_data)
                     else:
                         messagebox.showerror("Error", "No se pudo actualizar el aula")
                         
@@ -3363,18 +3282,16 @@ Puedes agregar más matrículas usando este formulario."""
         except Exception as e:
             messagebox.showerror("Error", f"Error al abrir diálogo de edición: {e}")
     
-    def delete_aula_from_context(self, values, tree, ciclo_data):
+    def delete_aula_from_context(self, aula_id, tree, ciclo_data=None):
         """Eliminar aula desde el menú contextual"""
         try:
-            aula_name = values[1]  # Columna "Aula"
-            
             # Obtener el aula completo de la base de datos
-            aulas = self.classroom_repo.get_all_rows()
-            aula_data = next((a for a in aulas if a.get("name") == aula_name), None)
+            aula_data = self.classroom_repo.get_row_by_id(aula_id)
             
             if not aula_data:
                 messagebox.showerror("Error", "No se pudo encontrar los datos del aula.")
                 return
+            aula_name = aula_data.get("name", "")
             
             # Mostrar confirmación
             result = messagebox.askyesno(
@@ -3393,29 +3310,29 @@ Puedes agregar más matrículas usando este formulario."""
                 if success:
                     messagebox.showinfo("Éxito", f"Aula '{aula_name}' eliminada correctamente")
                     # Recargar aulas
-                    self.load_aulas_del_ciclo(tree, ciclo_data.get('id'))
+                    self.reload_aulas(tree, ciclo_data)
                 else:
                     messagebox.showerror("Error", "No se pudo eliminar el aula")
                     
         except Exception as e:
             messagebox.showerror("Error", f"Error al eliminar aula: {e}")
     
+    def reload_aulas(self, tree, ciclo_data=None):
+        """Recargar la tabla de aulas de un ciclo o, sin ciclo, la de Academia"""
+        if ciclo_data:
+            self.load_aulas_del_ciclo(tree, ciclo_data.get('id'))
+        else:
+            self.load_aulas()
+    
     def show_edit_ciclo_dialog(self, event):
         """Mostrar diálogo para editar ciclo"""
         try:
-            # Obtener elemento seleccionado
-            item = self.ciclo_tree.selection()[0] if self.ciclo_tree.selection() else None
-            if not item:
+            # Obtener el ciclo seleccionado por su id
+            ciclo_id = self.tree_row_id(self.ciclo_tree)
+            if ciclo_id is None:
                 messagebox.showwarning("Advertencia", "Por favor seleccione un ciclo para editar")
                 return
-            
-            # Obtener datos del ciclo
-            values = self.ciclo_tree.item(item, "values")
-            ciclo_name = values[2]  # Columna "Ciclo"
-            
-            # Obtener el ciclo completo de la base de datos
-            ciclos = self.cicle_repo.get_all_rows()
-            ciclo_data = next((c for c in ciclos if c.get("cicle") == ciclo_name), None)
+            ciclo_data = self.cicle_repo.get_row_by_id(ciclo_id)
             
             if not ciclo_data:
                 messagebox.showerror("Error", "No se pudo encontrar los datos del ciclo.")
@@ -3775,18 +3692,20 @@ Puedes agregar más matrículas usando este formulario."""
                 self.aulas_pagination_label.configure(text="0/0 Páginas")
                 return
             
-            # Obtener todas las aulas
-            aulas = self.classroom_repo.get_all_rows()
-            
-            # Filtrar aulas del ciclo activo
-            aulas_ciclo = [aula for aula in aulas if aula.get("id_cicle") == self.active_cicle.get("id")]
+            # Página actual de aulas del ciclo activo (LIMIT/OFFSET + COUNT)
+            page = self.classroom_repo.get_page(
+                self.current_classroom_page,
+                self.classrooms_per_page,
+                where={"id_cicle": self.active_cicle.get("id")}
+            )
+            self.current_classroom_page = page["page"]
+            self.classroom_total_pages = page["pages"]
             
             # Actualizar tabla
-            self.update_aulas_table(aulas_ciclo)
+            self.update_aulas_table(page["rows"])
             
             # Actualizar paginación
-            total_pages = (len(aulas_ciclo) + self.classrooms_per_page - 1) // self.classrooms_per_page
-            self.aulas_pagination_label.configure(text=f"{self.current_classroom_page}/{max(1, total_pages)} Páginas")
+            self.aulas_pagination_label.configure(text=f"{page['page']}/{page['pages']} Páginas")
             
         except Exception as e:
             messagebox.showerror("Error", f"Error al cargar aulas: {e}")
@@ -3797,13 +3716,9 @@ Puedes agregar más matrículas usando este formulario."""
         for item in self.aulas_tree.get_children():
             self.aulas_tree.delete(item)
         
-        # Calcular rango de páginas
-        start_idx = (self.current_classroom_page - 1) * self.classrooms_per_page
-        end_idx = start_idx + self.classrooms_per_page
-        
         # Agregar aulas de la página actual
-        for aula in aulas[start_idx:end_idx]:
-            self.aulas_tree.insert("", "end", values=(
+        for aula in aulas:
+            self.aulas_tree.insert("", "end", iid=aula["id"], values=(
                 aula.get("course_name", ""),
                 aula.get("name", ""),
                 aula.get("teacher_name", ""),
@@ -3867,15 +3782,9 @@ Puedes agregar más matrículas usando este formulario."""
     
     def next_aulas_page(self):
         """Ir a la página siguiente de aulas"""
-        try:
-            aulas = self.classroom_repo.get_all_rows()
-            total_pages = (len(aulas) + self.classrooms_per_page - 1) // self.classrooms_per_page
-            
-            if self.current_classroom_page < total_pages:
-                self.current_classroom_page += 1
-                self.load_aulas()
-        except Exception as e:
-            messagebox.showerror("Error", f"Error en paginación: {e}")
+        if self.current_classroom_page < self.classroom_total_pages:
+            self.current_classroom_page += 1
+            self.load_aulas()
     
     
     
@@ -4669,6 +4578,11 @@ Puedes agregar más matrículas usando este formulario."""
             height=35
         )
         self.team_max_age_filter.pack(pady=(5, 0))
+        self.bind_filter_debounce(
+            self.teams_filter_debounce,
+            entries=(self.team_name_filter, self.team_min_age_filter, self.team_max_age_filter),
+            combos=(self.team_gender_filter,)
+        )
         
         # Botones de filtro
         filter_buttons_frame = ctk.CTkFrame(filters_row, fg_color="transparent")
@@ -4800,6 +4714,10 @@ Puedes agregar más matrículas usando este formulario."""
             height=35
         )
         self.course_level_filter.pack(pady=(5, 0))
+        self.bind_filter_debounce(
+            self.courses_filter_debounce,
+            entries=(self.course_name_filter, self.course_level_filter)
+        )
         
         # Botones de filtro
         filter_buttons_frame = ctk.CTkFrame(filters_row, fg_color="transparent")
@@ -4951,6 +4869,11 @@ Puedes agregar más matrículas usando este formulario."""
         )
         self.student_team_filter.set("Todos")
         self.student_team_filter.pack(pady=(5, 0))
+        self.bind_filter_debounce(
+            self.students_filter_debounce,
+            entries=(self.student_name_filter, self.student_phone_filter),
+            combos=(self.student_team_filter,)
+        )
         
         # Botones de filtro
         filter_buttons_frame = ctk.CTkFrame(filters_row, fg_color="transparent")
@@ -5105,6 +5028,11 @@ Puedes agregar más matrículas usando este formulario."""
         )
         self.teacher_team_filter.set("Todos")
         self.teacher_team_filter.pack(pady=(5, 0))
+        self.bind_filter_debounce(
+            self.teachers_filter_debounce,
+            entries=(self.teacher_name_filter, self.teacher_phone_filter),
+            combos=(self.teacher_team_filter,)
+        )
         
         # Botones de filtro
         filter_buttons_frame = ctk.CTkFrame(filters_row, fg_color="transparent")
@@ -5163,10 +5091,30 @@ Puedes agregar más matrículas usando este formulario."""
         # Crear la página de gestión de usuarios con el mismo diseño que las otras páginas
         self.setup_users_page()
         
+    def cleanup(self):
+        """Descartar los gráficos pendientes, los filtros programados y las suscripciones a change_bus"""
+        if self.closed:
+            return
+        self.closed = True
+        self.chart_executor.shutdown(wait=False, cancel_futures=True)
+        self.unsubscribe_changes()
+        if self.change_poll_id is not None:
+            try:
+                self.parent.after_cancel(self.change_poll_id)
+            except Exception:
+                pass
+            self.change_poll_id = None
+        for name in ("ciclo", "users", "teams", "courses", "students", "teachers"):
+            getattr(self, f"{name}_filter_debounce").cancel()
+        for name in ("users", "teams", "courses", "students", "teachers"):
+            getattr(self, f"{name}_filter_engine").close()
+    
     def logout(self):
         """Cerrar sesión"""
         result = messagebox.askyesno("Cerrar Sesión", "¿Está seguro de cerrar sesión?")
         if result:
+            self.cleanup()
+            
             # Cerrar la ventana actual
             self.parent.destroy()
             
@@ -5234,7 +5182,7 @@ Puedes agregar más matrículas usando este formulario."""
         user_label.pack(side="left", padx=(0, 10))
         
         self.user_search_var = ctk.StringVar()
-        self.user_search_var.trace('w', self.filter_users)
+        self.user_search_var.trace('w', self.users_filter_debounce)
         user_entry = ctk.CTkEntry(
             filters_frame,
             placeholder_text="Buscar usuario...",
@@ -5249,7 +5197,7 @@ Puedes agregar más matrículas usando este formulario."""
         
         self.role_filter_var = ctk.StringVar()
         self.role_filter_var.set("Todos")
-        self.role_filter_var.trace('w', self.filter_users)
+        self.role_filter_var.trace('w', self.users_filter_debounce)
         role_combo = ctk.CTkComboBox(
             filters_frame,
             values=["Todos", "Administrador", "Usuario"],
@@ -5457,65 +5405,53 @@ Puedes agregar más matrículas usando este formulario."""
     
     def load_users(self):
         """Cargar usuarios desde la base de datos"""
-        try:
-            # Inicializar repositorio de usuarios
-            self.user_repo = UserRepository()
-            
-            # Obtener todos los usuarios
-            self.all_users = self.user_repo.get_all_users()
-            self.filtered_users = self.all_users.copy()
-            self.current_page = 1
-            self.users_per_page = 10
-            
-            # Actualizar tabla
-            self.update_users_table()
-            
-        except Exception as e:
-            messagebox.showerror("Error", f"Error al cargar usuarios: {e}")
+        self.users_match_ids = None
+        self.current_page = 1
+        self.users_per_page = 10
+        self.users_total_pages = 1
+        
+        # Actualizar tabla
+        self.update_users_table()
     
-    def filter_users(self, *args):
-        """Filtrar usuarios según los criterios de búsqueda"""
-        try:
-            search_text = self.user_search_var.get().lower()
-            role_filter = self.role_filter_var.get()
-            
-            self.filtered_users = []
-            
-            for user in self.all_users:
-                # Filtro por texto de búsqueda
-                if search_text and search_text not in user.get("user", "").lower():
-                    continue
-                
-                # Filtro por rol
-                if role_filter != "Todos" and user.get("role", "") != role_filter:
-                    continue
-                
-                self.filtered_users.append(user)
-            
+    def filter_users(self, *args, reset_page=True):
+        """Filtrar usuarios: nombre por el índice de búsqueda y rol en memoria"""
+        search_text = self.user_search_var.get().strip()
+        role_filter = self.role_filter_var.get()
+        
+        # Filtro por rol
+        exact = {}
+        if role_filter != "Todos":
+            exact["role"] = role_filter
+        
+        if search_text or exact:
+            self.users_match_ids = self.users_filter_engine.match({"user": search_text}, exact)
+        else:
+            self.users_match_ids = None
+        if reset_page:
             self.current_page = 1
-            self.update_users_table()
-            
-        except Exception as e:
-            messagebox.showerror("Error", f"Error al filtrar usuarios: {e}")
+        self.update_users_table()
     
     def update_users_table(self):
-        """Actualizar la tabla de usuarios"""
+        """Actualizar la tabla de usuarios con la página actual consultada en la base de datos"""
         try:
+            page = self.get_filtered_page(
+                self.user_repo,
+                self.users_match_ids,
+                self.current_page,
+                self.users_per_page
+            )
+            self.current_page = page["page"]
+            self.users_total_pages = page["pages"]
+            
             # Limpiar tabla
             for item in self.users_tree.get_children():
                 self.users_tree.delete(item)
             
-            # Calcular paginación
-            total_pages = max(1, (len(self.filtered_users) + self.users_per_page - 1) // self.users_per_page)
-            start_idx = (self.current_page - 1) * self.users_per_page
-            end_idx = min(start_idx + self.users_per_page, len(self.filtered_users))
-            
             # Actualizar etiqueta de paginación
-            self.pagination_label.configure(text=f"{self.current_page}/{total_pages} Páginas")
+            self.pagination_label.configure(text=f"{page['page']}/{page['pages']} Páginas")
             
             # Agregar usuarios a la tabla
-            for i in range(start_idx, end_idx):
-                user = self.filtered_users[i]
+            for user in page["rows"]:
                 username = user.get("user", "")
                 role = user.get("role", "")
                 
@@ -5533,8 +5469,7 @@ Puedes agregar más matrículas usando este formulario."""
     
     def next_users_page(self):
         """Ir a la página siguiente de usuarios"""
-        total_pages = max(1, (len(self.filtered_users) + self.users_per_page - 1) // self.users_per_page)
-        if self.current_page < total_pages:
+        if self.current_page < self.users_total_pages:
             self.current_page += 1
             self.update_users_table()
     
@@ -5862,8 +5797,6 @@ Puedes agregar más matrículas usando este formulario."""
                 messagebox.showinfo("Éxito", "Usuario actualizado correctamente.")
                 dialog.destroy()
                 
-                # Recargar usuarios
-                self.load_users()
                 
             except Exception as e:
                 messagebox.showerror("Error", f"Error al actualizar usuario: {e}")
@@ -6048,8 +5981,6 @@ Puedes agregar más matrículas usando este formulario."""
                 messagebox.showinfo("Éxito", "Usuario creado correctamente.\nLa contraseña ha sido encriptada de forma segura.")
                 dialog.destroy()
                 
-                # Recargar usuarios
-                self.load_users()
                 
             except Exception as e:
                 print(f"Error al crear usuario: {e}")
@@ -6111,8 +6042,6 @@ Puedes agregar más matrículas usando este formulario."""
                 
                 if rows_affected > 0:
                     messagebox.showinfo("Éxito", f"Usuario '{username}' eliminado correctamente.")
-                    # Recargar usuarios
-                    self.load_users()
                 else:
                     messagebox.showerror("Error", "No se pudo eliminar el usuario.")
                     
@@ -6164,6 +6093,14 @@ Puedes agregar más matrículas usando este formulario."""
             height=450
         )
         self.teams_rows_frame.pack(fill="both", expand=True)
+        self.teams_row_pool = RowPool(
+            self.teams_rows_frame,
+            [50, 200, 100, 100, 100, 80],
+            [
+                ("Editar", 58, theme.WARNING, theme.WARNING_DARK, self.edit_team),
+                ("Eliminar", 62, theme.DANGER, theme.DANGER_DARK, self.delete_team),
+            ]
+        )
         
         # Frame para paginación
         pagination_frame = ctk.CTkFrame(self.teams_table_container, fg_color="transparent")
@@ -6208,127 +6145,50 @@ Puedes agregar más matrículas usando este formulario."""
         self.teams_current_page = 1
         self.teams_items_per_page = 10
         self.teams_total_items = 0
-        self.filtered_teams = []
         
     def load_teams_from_database(self):
         """Cargar equipos desde la base de datos"""
+        self.teams_match_ids = None
+        self.update_teams_table()
+        
+    def update_teams_table(self):
+        """Actualizar tabla de equipos con la página actual consultada en la base de datos"""
         try:
-            from control.bd.db_connection import Connection
-            from control.team_repository import TeamRepository
-            
-            conn = Connection.connect()
-            if conn:
-                team_repo = TeamRepository(conn)
-                team_repo.create_table()  # Asegurar que la tabla existe
-                
-                # Obtener todos los equipos
-                teams = team_repo.get_all_teams()
-                
-                # Convertir a formato para la tabla
-                self.test_teams = []
-                for team in teams:
-                    self.test_teams.append({
-                        "id": team.id,
-                        "name": team.name,
-                        "gender": team.gender,
-                        "age_start": team.age_start,
-                        "age_end": team.age_end,
-                        "members": 0  # Por ahora, se puede implementar después
-                    })
-                
-                conn.close()
-                
-                # Actualizar tabla
-                self.update_teams_table()
-                
-                print(f"Cargados {len(self.test_teams)} equipos desde la base de datos")
-            else:
-                messagebox.showerror("Error", "No se pudo conectar a la base de datos")
+            # Solo se leen las filas de la página actual y el total (COUNT)
+            page = self.get_filtered_page(
+                self.team_repo,
+                self.teams_match_ids,
+                self.teams_current_page,
+                self.teams_items_per_page
+            )
         except Exception as e:
             print(f"Error al cargar equipos: {str(e)}")
             messagebox.showerror("Error", f"Error al cargar equipos: {str(e)}")
+            return
         
-    def update_teams_table(self):
-        """Actualizar tabla de equipos"""
-        # Limpiar filas existentes
-        for widget in self.teams_rows_frame.winfo_children():
-            widget.destroy()
-        
-        # Calcular paginación
-        start_idx = (self.teams_current_page - 1) * self.teams_items_per_page
-        end_idx = start_idx + self.teams_items_per_page
-        
-        # Obtener equipos para la página actual
-        teams_to_show = self.test_teams[start_idx:end_idx]
-        
-        # Agregar equipos a la tabla
-        for team in teams_to_show:
-            self.create_team_row(team)
+        # Reutilizar las filas ya creadas; solo cambian textos y comandos
+        self.teams_row_pool.render(page["rows"], self.team_row_values)
         
         # Actualizar información de paginación
-        self.teams_total_items = len(self.test_teams)
-        total_pages = (self.teams_total_items + self.teams_items_per_page - 1) // self.teams_items_per_page
-        self.teams_pagination_info.configure(text=f"Mostrando {len(teams_to_show)} de {self.teams_total_items} equipos")
+        self.teams_current_page = page["page"]
+        self.teams_total_items = page["total"]
+        self.teams_pagination_info.configure(text=f"Mostrando {len(page['rows'])} de {self.teams_total_items} equipos")
         
         # Actualizar botones de paginación
-        self.teams_prev_page_btn.configure(state="normal" if self.teams_current_page > 1 else "disabled")
-        self.teams_next_page_btn.configure(state="normal" if self.teams_current_page < total_pages else "disabled")
+        self.teams_prev_page_btn.configure(state="normal" if page["page"] > 1 else "disabled")
+        self.teams_next_page_btn.configure(state="normal" if page["page"] < page["pages"] else "disabled")
         
-    def create_team_row(self, team):
-        """Crear fila de equipo en la tabla"""
-        row_frame = ctk.CTkFrame(self.teams_rows_frame, fg_color=theme.SURFACE, height=40)
-        row_frame.pack(fill="x", pady=2)
-        row_frame.pack_propagate(False)
-        
-        # Datos del equipo
-        team_data = [
+    def team_row_values(self, team):
+        """Textos de las columnas de una fila de equipo"""
+        return [
             str(team["id"]),
             team["name"],
             team["gender"],
             str(team["age_start"]),
             str(team["age_end"]),
-            str(team["members"])
+            str(team.get("members", 0))  # Por ahora, se puede implementar después
         ]
         
-        # Mostrar datos
-        for i, data in enumerate(team_data):
-            data_label = ctk.CTkLabel(
-                row_frame,
-                text=data,
-                font=theme.font(theme.SIZE_SMALL),
-                text_color=theme.TEXT,
-                width=50 if i == 0 else 200 if i == 1 else 100 if i == 2 else 100 if i == 3 else 100 if i == 4 else 80
-            )
-            data_label.place(x=sum([50, 200, 100, 100, 100, 80][:i]) + i*5, y=10)
-            
-            # Botones de acción
-        actions_frame = ctk.CTkFrame(row_frame, fg_color="transparent")
-        actions_frame.place(x=sum([50, 200, 100, 100, 100, 80]) + 6*5, y=5)
-        
-        edit_btn = ctk.CTkButton(
-            actions_frame,
-            text="Editar",
-            width=58,
-            height=26,
-            font=theme.font(theme.SIZE_CAPTION),
-            command=lambda t=team: self.edit_team(t),
-            fg_color=theme.WARNING,
-            hover_color=theme.WARNING_DARK
-        )
-        edit_btn.pack(side="left", padx=(0, 4))
-        
-        delete_btn = ctk.CTkButton(
-            actions_frame,
-            text="Eliminar",
-            width=62,
-            height=26,
-            font=theme.font(theme.SIZE_CAPTION),
-            command=lambda t=team: self.delete_team(t),
-            fg_color=theme.DANGER,
-            hover_color=theme.DANGER_DARK
-        )
-        delete_btn.pack(side="left")
-        
     def edit_team(self, team):
         """Editar equipo"""
         self.show_edit_team_dialog(team)
@@ -6338,24 +6198,12 @@ Puedes agregar más matrículas usando este formulario."""
         result = messagebox.askyesno("Confirmar", f"¿Eliminar equipo {team['name']}?")
         if result:
             try:
-                from control.bd.db_connection import Connection
-                from control.team_repository import TeamRepository
+                success = self.team_repo.delete_team(team['id'])
                 
-                conn = Connection.connect()
-                if conn:
-                    team_repo = TeamRepository(conn)
-                    success = team_repo.delete_team(team['id'])
-                    
-                    if success:
-                        conn.commit()
-                        messagebox.showinfo("Éxito", f"Equipo '{team['name']}' eliminado correctamente")
-                        self.load_teams_from_database()  # Recargar datos
-                    else:
-                        messagebox.showerror("Error", "No se pudo eliminar el equipo")
-                    
-                    conn.close()
+                if success:
+                    messagebox.showinfo("Éxito", f"Equipo '{team['name']}' eliminado correctamente")
                 else:
-                    messagebox.showerror("Error", "No se pudo conectar a la base de datos")
+                    messagebox.showerror("Error", "No se pudo eliminar el equipo")
             except Exception as e:
                 print(f"Error al eliminar equipo: {str(e)}")
                 messagebox.showerror("Error", f"Error al eliminar equipo: {str(e)}")
@@ -6528,47 +6376,35 @@ Puedes agregar más matrículas usando este formulario."""
                 return
             
             try:
-                from control.bd.db_connection import Connection
-                from control.team_repository import TeamRepository
                 from model.team import Team
                 
-                conn = Connection.connect()
-                if conn:
-                    team_repo = TeamRepository(conn)
-                    
-                    if team:  # Editar
-                        # Crear objeto Team con el ID existente
-                        team_obj = Team(
-                            id=team['id'],
-                            name=name,
-                            age_start=age_start,
-                            age_end=age_end,
-                            gender=gender
-                        )
-                        success = team_repo.update_team(team_obj)
-                        if success:
-                            conn.commit()
-                            messagebox.showinfo("Éxito", f"Equipo '{name}' actualizado correctamente")
-                        else:
-                            messagebox.showerror("Error", "No se pudo actualizar el equipo")
-                            return
-                    else:  # Agregar
-                        # Crear objeto Team sin ID
-                        team_obj = Team(
-                            name=name,
-                            age_start=age_start,
-                            age_end=age_end,
-                            gender=gender
-                        )
-                        created_team = team_repo.create_team(team_obj)
-                        conn.commit()
-                        messagebox.showinfo("Éxito", f"Equipo '{name}' agregado correctamente")
-                    
-                    conn.close()
-                    dialog.destroy()
-                    self.load_teams_from_database()  # Recargar datos
-                else:
-                    messagebox.showerror("Error", "No se pudo conectar a la base de datos")
+                if team:  # Editar
+                    # Crear objeto Team con el ID existente
+                    team_obj = Team(
+                        id=team['id'],
+                        name=name,
+                        age_start=age_start,
+                        age_end=age_end,
+                        gender=gender
+                    )
+                    success = self.team_repo.update_team(team_obj)
+                    if success:
+                        messagebox.showinfo("Éxito", f"Equipo '{name}' actualizado correctamente")
+                    else:
+                        messagebox.showerror("Error", "No se pudo actualizar el equipo")
+                        return
+                else:  # Agregar
+                    # Crear objeto Team sin ID
+                    team_obj = Team(
+                        name=name,
+                        age_start=age_start,
+                        age_end=age_end,
+                        gender=gender
+                    )
+                    created_team = self.team_repo.create_team(team_obj)
+                    messagebox.showinfo("Éxito", f"Equipo '{name}' agregado correctamente")
+                
+                dialog.destroy()
             except Exception as e:
                 print(f"Error al guardar equipo: {str(e)}")
                 messagebox.showerror("Error", f"Error al guardar equipo: {str(e)}")
@@ -6603,70 +6439,33 @@ Puedes agregar más matrículas usando este formulario."""
         )
         cancel_btn.pack(side="right")
         
-    def filter_teams(self):
-        """Filtrar equipos"""
-        try:
-            from control.bd.db_connection import Connection
-            from control.team_repository import TeamRepository
-            
-            conn = Connection.connect()
-            if conn:
-                team_repo = TeamRepository(conn)
-                
-                # Obtener filtros
-                name_filter = self.team_name_filter.get().strip()
-                gender_filter = self.team_gender_filter.get()
-                min_age = self.team_min_age_filter.get().strip()
-                max_age = self.team_max_age_filter.get().strip()
-                
-                # Aplicar filtros
-                teams = team_repo.get_all_teams()
-                filtered_teams = []
-                
-                for team in teams:
-                    # Filtro por nombre
-                    if name_filter and name_filter.lower() not in team.name.lower():
-                        continue
-                    
-                    # Filtro por género
-                    if gender_filter != "Todos" and team.gender != gender_filter:
-                        continue
-                    
-                    # Filtro por edad mínima
-                    if min_age and min_age.isdigit():
-                        if team.age_start < int(min_age):
-                            continue
-                    
-                    # Filtro por edad máxima
-                    if max_age and max_age.isdigit():
-                        if team.age_end > int(max_age):
-                            continue
-                    
-                    filtered_teams.append(team)
-                
-                # Convertir a formato para la tabla
-                self.test_teams = []
-                for team in filtered_teams:
-                    self.test_teams.append({
-                        "id": team.id,
-                        "name": team.name,
-                        "gender": team.gender,
-                        "age_start": team.age_start,
-                        "age_end": team.age_end,
-                        "members": 0
-                    })
-                
-                conn.close()
-                
-                # Actualizar tabla
-                self.update_teams_table()
-                
-                print(f"Filtrados {len(self.test_teams)} equipos")
-            else:
-                messagebox.showerror("Error", "No se pudo conectar a la base de datos")
-        except Exception as e:
-            print(f"Error al filtrar equipos: {str(e)}")
-            messagebox.showerror("Error", f"Error al filtrar equipos: {str(e)}")
+    def filter_teams(self, reset_page=True):
+        """Filtrar equipos en memoria (ver IncrementalFilter)"""
+        # Obtener filtros
+        name_filter = self.team_name_filter.get().strip()
+        gender_filter = self.team_gender_filter.get()
+        min_age = self.team_min_age_filter.get().strip()
+        max_age = self.team_max_age_filter.get().strip()
+        
+        exact = {}
+        # Filtro por género
+        if gender_filter != "Todos":
+            exact["gender"] = gender_filter
+        
+        # Filtro por edad mínima y máxima
+        ranges = {}
+        if min_age and min_age.isdigit():
+            ranges["age_start"] = (int(min_age), None)
+        if max_age and max_age.isdigit():
+            ranges["age_end"] = (None, int(max_age))
+        
+        if name_filter or exact or ranges:
+            self.teams_match_ids = self.teams_filter_engine.match({"name": name_filter}, exact, ranges)
+        else:
+            self.teams_match_ids = None
+        if reset_page:
+            self.teams_current_page = 1
+        self.update_teams_table()
         
     def clear_team_filters(self):
         """Limpiar filtros de equipos"""
@@ -6676,6 +6475,7 @@ Puedes agregar más matrículas usando este formulario."""
         self.team_max_age_filter.delete(0, "end")
         
         # Recargar todos los datos
+        self.teams_filter_debounce.cancel()
         self.load_teams_from_database()
         
     def teams_prev_page(self):
@@ -6724,6 +6524,14 @@ Puedes agregar más matrículas usando este formulario."""
             height=450
         )
         self.courses_rows_frame.pack(fill="both", expand=True)
+        self.courses_row_pool = RowPool(
+            self.courses_rows_frame,
+            [50, 300, 100],
+            [
+                ("Editar", 58, theme.WARNING, theme.WARNING_DARK, self.edit_course),
+                ("Eliminar", 62, theme.DANGER, theme.DANGER_DARK, self.delete_course),
+            ]
+        )
         
         # Frame para paginación
         pagination_frame = ctk.CTkFrame(self.courses_table_container, fg_color="transparent")
@@ -6771,118 +6579,44 @@ Puedes agregar más matrículas usando este formulario."""
         
     def load_courses_from_database(self):
         """Cargar cursos desde la base de datos"""
+        self.courses_match_ids = None
+        self.update_courses_table()
+        
+    def update_courses_table(self):
+        """Actualizar tabla de cursos con la página actual consultada en la base de datos"""
         try:
-            from control.bd.db_connection import Connection
-            from control.course_repository import CourseRepository
-            
-            conn = Connection.connect()
-            if conn:
-                course_repo = CourseRepository(conn)
-                course_repo.create_table()  # Asegurar que la tabla existe
-                
-                # Obtener todos los cursos
-                courses = course_repo.get_all_rows()
-                
-                # Convertir a formato para la tabla
-                self.test_courses = []
-                for course in courses:
-                    self.test_courses.append({
-                        "id": course["id"],
-                        "name": course["name"],
-                        "level": course["level"],
-                        "students": 0  # Por ahora, se puede implementar después
-                    })
-                
-                conn.close()
-                
-                # Actualizar tabla
-                self.update_courses_table()
-                
-                print(f"Cargados {len(self.test_courses)} cursos desde la base de datos")
-            else:
-                messagebox.showerror("Error", "No se pudo conectar a la base de datos")
+            # Solo se leen las filas de la página actual y el total (COUNT)
+            page = self.get_filtered_page(
+                self.course_repo,
+                self.courses_match_ids,
+                self.courses_current_page,
+                self.courses_items_per_page
+            )
         except Exception as e:
             print(f"Error al cargar cursos: {str(e)}")
             messagebox.showerror("Error", f"Error al cargar cursos: {str(e)}")
+            return
         
-    def update_courses_table(self):
-        """Actualizar tabla de cursos"""
-        # Limpiar filas existentes
-        for widget in self.courses_rows_frame.winfo_children():
-            widget.destroy()
-        
-        # Calcular paginación
-        start_idx = (self.courses_current_page - 1) * self.courses_items_per_page
-        end_idx = start_idx + self.courses_items_per_page
-        
-        # Obtener cursos para la página actual
-        courses_to_show = self.test_courses[start_idx:end_idx]
-        
-        # Agregar cursos a la tabla
-        for course in courses_to_show:
-            self.create_course_row(course)
+        # Reutilizar las filas ya creadas; solo cambian textos y comandos
+        self.courses_row_pool.render(page["rows"], self.course_row_values)
         
         # Actualizar información de paginación
-        self.courses_total_items = len(self.test_courses)
-        total_pages = (self.courses_total_items + self.courses_items_per_page - 1) // self.courses_items_per_page
-        self.courses_pagination_info.configure(text=f"Mostrando {len(courses_to_show)} de {self.courses_total_items} cursos")
+        self.courses_current_page = page["page"]
+        self.courses_total_items = page["total"]
+        self.courses_pagination_info.configure(text=f"Mostrando {len(page['rows'])} de {self.courses_total_items} cursos")
         
         # Actualizar botones de paginación
-        self.courses_prev_page_btn.configure(state="normal" if self.courses_current_page > 1 else "disabled")
-        self.courses_next_page_btn.configure(state="normal" if self.courses_current_page < total_pages else "disabled")
+        self.courses_prev_page_btn.configure(state="normal" if page["page"] > 1 else "disabled")
+        self.courses_next_page_btn.configure(state="normal" if page["page"] < page["pages"] else "disabled")
         
-    def create_course_row(self, course):
-        """Crear fila de curso en la tabla"""
-        row_frame = ctk.CTkFrame(self.courses_rows_frame, fg_color=theme.SURFACE, height=40)
-        row_frame.pack(fill="x", pady=2)
-        row_frame.pack_propagate(False)
-        
-        # Datos del curso
-        course_data = [
+    def course_row_values(self, course):
+        """Textos de las columnas de una fila de curso"""
+        return [
             str(course["id"]),
             course["name"],
             str(course["level"])
         ]
         
-        # Mostrar datos
-        for i, data in enumerate(course_data):
-            data_label = ctk.CTkLabel(
-                row_frame,
-                text=data,
-                font=theme.font(theme.SIZE_SMALL),
-                text_color=theme.TEXT,
-                width=50 if i == 0 else 300 if i == 1 else 100
-            )
-            data_label.place(x=sum([50, 300, 100][:i]) + i*5, y=10)
-        
-        # Botones de acción
-        actions_frame = ctk.CTkFrame(row_frame, fg_color="transparent")
-        actions_frame.place(x=sum([50, 300, 100]) + 3*5, y=5)
-        
-        edit_btn = ctk.CTkButton(
-            actions_frame,
-            text="Editar",
-            width=58,
-            height=26,
-            font=theme.font(theme.SIZE_CAPTION),
-            command=lambda c=course: self.edit_course(c),
-            fg_color=theme.WARNING,
-            hover_color=theme.WARNING_DARK
-        )
-        edit_btn.pack(side="left", padx=(0, 4))
-        
-        delete_btn = ctk.CTkButton(
-            actions_frame,
-            text="Eliminar",
-            width=62,
-            height=26,
-            font=theme.font(theme.SIZE_CAPTION),
-            command=lambda c=course: self.delete_course(c),
-            fg_color=theme.DANGER,
-            hover_color=theme.DANGER_DARK
-        )
-        delete_btn.pack(side="left")
-        
     def edit_course(self, course):
         """Editar curso"""
         self.show_edit_course_dialog(course)
@@ -6892,24 +6626,12 @@ Puedes agregar más matrículas usando este formulario."""
         result = messagebox.askyesno("Confirmar", f"¿Eliminar curso {course['name']}?")
         if result:
             try:
-                from control.bd.db_connection import Connection
-                from control.course_repository import CourseRepository
+                success = self.course_repo.delete_row({"id": course['id']})
                 
-                conn = Connection.connect()
-                if conn:
-                    course_repo = CourseRepository(conn)
-                    success = course_repo.delete_row({"id": course['id']})
-                    
-                    if success:
-                        conn.commit()
-                        messagebox.showinfo("Éxito", f"Curso '{course['name']}' eliminado correctamente")
-                        self.load_courses_from_database()  # Recargar datos
-                    else:
-                        messagebox.showerror("Error", "No se pudo eliminar el curso")
-                    
-                    conn.close()
+                if success:
+                    messagebox.showinfo("Éxito", f"Curso '{course['name']}' eliminado correctamente")
                 else:
-                    messagebox.showerror("Error", "No se pudo conectar a la base de datos")
+                    messagebox.showerror("Error", "No se pudo eliminar el curso")
             except Exception as e:
                 print(f"Error al eliminar curso: {str(e)}")
                 messagebox.showerror("Error", f"Error al eliminar curso: {str(e)}")
@@ -7028,40 +6750,27 @@ Puedes agregar más matrículas usando este formulario."""
                 return
             
             try:
-                from control.bd.db_connection import Connection
-                from control.course_repository import CourseRepository
+                if course:  # Editar
+                    try:
+                        self.course_repo.update_row(
+                            new_data={"name": name, "level": level},
+                            conditions={"id": course['id']}
+                        )
+                        messagebox.showinfo("Éxito", f"Curso '{name}' actualizado correctamente")
+                    except Exception as update_error:
+                        print(f"Error al actualizar curso: {str(update_error)}")
+                        messagebox.showerror("Error", f"No se pudo actualizar el curso: {str(update_error)}")
+                        return
+                else:  # Agregar
+                    try:
+                        self.course_repo.insert_row({"name": name, "level": level})
+                        messagebox.showinfo("Éxito", f"Curso '{name}' agregado correctamente")
+                    except Exception as insert_error:
+                        print(f"Error al insertar curso: {str(insert_error)}")
+                        messagebox.showerror("Error", f"No se pudo agregar el curso: {str(insert_error)}")
+                        return
                 
-                conn = Connection.connect()
-                if conn:
-                    course_repo = CourseRepository(conn)
-                    
-                    if course:  # Editar
-                        try:
-                            course_repo.update_row(
-                                new_data={"name": name, "level": level},
-                                conditions={"id": course['id']}
-                            )
-                            conn.commit()
-                            messagebox.showinfo("Éxito", f"Curso '{name}' actualizado correctamente")
-                        except Exception as update_error:
-                            print(f"Error al actualizar curso: {str(update_error)}")
-                            messagebox.showerror("Error", f"No se pudo actualizar el curso: {str(update_error)}")
-                            return
-                    else:  # Agregar
-                        try:
-                            course_repo.insert_row({"name": name, "level": level})
-                            conn.commit()
-                            messagebox.showinfo("Éxito", f"Curso '{name}' agregado correctamente")
-                        except Exception as insert_error:
-                            print(f"Error al insertar curso: {str(insert_error)}")
-                            messagebox.showerror("Error", f"No se pudo agregar el curso: {str(insert_error)}")
-                            return
-                    
-                    conn.close()
-                    dialog.destroy()
-                    self.load_courses_from_database()  # Recargar datos
-                else:
-                    messagebox.showerror("Error", "No se pudo conectar a la base de datos")
+                dialog.destroy()
             except Exception as e:
                 print(f"Error al guardar curso: {str(e)}")
                 messagebox.showerror("Error", f"Error al guardar curso: {str(e)}")
@@ -7096,57 +6805,24 @@ Puedes agregar más matrículas usando este formulario."""
         )
         cancel_btn.pack(side="right")
         
-    def filter_courses(self):
-        """Filtrar cursos"""
-        try:
-            from control.bd.db_connection import Connection
-            from control.course_repository import CourseRepository
-            
-            conn = Connection.connect()
-            if conn:
-                course_repo = CourseRepository(conn)
-                
-                # Obtener filtros
-                name_filter = self.course_name_filter.get().strip()
-                level_filter = self.course_level_filter.get().strip()
-                
-                # Aplicar filtros
-                courses = course_repo.get_all_rows()
-                filtered_courses = []
-                
-                for course in courses:
-                    # Filtro por nombre
-                    if name_filter and name_filter.lower() not in course["name"].lower():
-                        continue
-                    
-                    # Filtro por nivel
-                    if level_filter and level_filter.isdigit():
-                        if course["level"] != int(level_filter):
-                            continue
-                    
-                    filtered_courses.append(course)
-                
-                # Convertir a formato para la tabla
-                self.test_courses = []
-                for course in filtered_courses:
-                    self.test_courses.append({
-                        "id": course["id"],
-                        "name": course["name"],
-                        "level": course["level"],
-                        "students": 0
-                    })
-                
-                conn.close()
-                
-                # Actualizar tabla
-                self.update_courses_table()
-                
-                print(f"Filtrados {len(self.test_courses)} cursos")
-            else:
-                messagebox.showerror("Error", "No se pudo conectar a la base de datos")
-        except Exception as e:
-            print(f"Error al filtrar cursos: {str(e)}")
-            messagebox.showerror("Error", f"Error al filtrar cursos: {str(e)}")
+    def filter_courses(self, reset_page=True):
+        """Filtrar cursos en memoria (ver IncrementalFilter)"""
+        # Obtener filtros
+        name_filter = self.course_name_filter.get().strip()
+        level_filter = self.course_level_filter.get().strip()
+        
+        exact = {}
+        # Filtro por nivel
+        if level_filter and level_filter.isdigit():
+            exact["level"] = int(level_filter)
+        
+        if name_filter or exact:
+            self.courses_match_ids = self.courses_filter_engine.match({"name": name_filter}, exact)
+        else:
+            self.courses_match_ids = None
+        if reset_page:
+            self.courses_current_page = 1
+        self.update_courses_table()
         
     def clear_course_filters(self):
         """Limpiar filtros de cursos"""
@@ -7154,6 +6830,7 @@ Puedes agregar más matrículas usando este formulario."""
         self.course_level_filter.delete(0, "end")
         
         # Recargar todos los datos
+        self.courses_filter_debounce.cancel()
         self.load_courses_from_database()
         
     def courses_prev_page(self):
@@ -7202,6 +6879,14 @@ Puedes agregar más matrículas usando este formulario."""
             height=450
         )
         self.students_rows_frame.pack(fill="both", expand=True)
+        self.students_row_pool = RowPool(
+            self.students_rows_frame,
+            PERSON_TABLE_WIDTHS,
+            [
+                ("Editar", 58, theme.WARNING, theme.WARNING_DARK, self.edit_student),
+                ("Eliminar", 62, theme.DANGER, theme.DANGER_DARK, self.delete_student),
+            ]
+        )
         
         # Frame para paginación
         pagination_frame = ctk.CTkFrame(self.students_table_container, fg_color="transparent")
@@ -7249,77 +6934,39 @@ Puedes agregar más matrículas usando este formulario."""
         
     def load_students_from_database(self):
         """Cargar estudiantes desde la base de datos"""
+        self.students_match_ids = None
+        self.update_students_table()
+        
+    def update_students_table(self):
+        """Actualizar tabla de estudiantes con la página actual consultada en la base de datos"""
         try:
-            from control.bd.db_connection import Connection
-            from control.student_repository import StudentRepository
-            
-            conn = Connection.connect()
-            if conn:
-                student_repo = StudentRepository(conn)
-                student_repo.create_table()  # Asegurar que la tabla existe
-                
-                # Obtener todos los estudiantes
-                students = student_repo.get_all_rows()
-                
-                # Convertir a formato para la tabla
-                self.test_students = []
-                for student in students:
-                    self.test_students.append({
-                        "id": student["id"],
-                        "name": student["name"],
-                        "lastname": student["lastname"],
-                        "phone": student["phone"],
-                        "date_baptism": student["date_baptism"],
-                        "date_of_birth": student["date_of_birth"],
-                        "id_team": student["id_team"]
-                    })
-                
-                conn.close()
-                
-                # Actualizar tabla
-                self.update_students_table()
-                
-                print(f"Cargados {len(self.test_students)} estudiantes desde la base de datos")
-            else:
-                messagebox.showerror("Error", "No se pudo conectar a la base de datos")
+            # Solo se leen las filas de la página actual y el total (COUNT)
+            page = self.get_filtered_page(
+                self.student_repo,
+                self.students_match_ids,
+                self.students_current_page,
+                self.students_items_per_page
+            )
         except Exception as e:
             print(f"Error al cargar estudiantes: {str(e)}")
             messagebox.showerror("Error", f"Error al cargar estudiantes: {str(e)}")
+            return
         
-    def update_students_table(self):
-        """Actualizar tabla de estudiantes"""
-        # Limpiar filas existentes
-        for widget in self.students_rows_frame.winfo_children():
-            widget.destroy()
-        
-        # Calcular paginación
-        start_idx = (self.students_current_page - 1) * self.students_items_per_page
-        end_idx = start_idx + self.students_items_per_page
-        
-        # Obtener estudiantes para la página actual
-        students_to_show = self.test_students[start_idx:end_idx]
-        
-        # Agregar estudiantes a la tabla
-        for student in students_to_show:
-            self.create_student_row(student)
+        # Reutilizar las filas ya creadas; solo cambian textos y comandos
+        self.students_row_pool.render(page["rows"], self.student_row_values)
         
         # Actualizar información de paginación
-        self.students_total_items = len(self.test_students)
-        total_pages = (self.students_total_items + self.students_items_per_page - 1) // self.students_items_per_page
-        self.students_pagination_info.configure(text=f"Mostrando {len(students_to_show)} de {self.students_total_items} estudiantes")
+        self.students_current_page = page["page"]
+        self.students_total_items = page["total"]
+        self.students_pagination_info.configure(text=f"Mostrando {len(page['rows'])} de {self.students_total_items} estudiantes")
         
         # Actualizar botones de paginación
-        self.students_prev_page_btn.configure(state="normal" if self.students_current_page > 1 else "disabled")
-        self.students_next_page_btn.configure(state="normal" if self.students_current_page < total_pages else "disabled")
-        
-    def create_student_row(self, student):
-        """Crear fila de estudiante en la tabla"""
-        row_frame = ctk.CTkFrame(self.students_rows_frame, fg_color=theme.SURFACE, height=40)
-        row_frame.pack(fill="x", pady=2)
-        row_frame.pack_propagate(False)
+        self.students_prev_page_btn.configure(state="normal" if page["page"] > 1 else "disabled")
+        self.students_next_page_btn.configure(state="normal" if page["page"] < page["pages"] else "disabled")
         
-        # Datos del estudiante
-        student_data = [
+    def student_row_values(self, student):
+        """Textos de las columnas de una fila de estudiante"""
+        return [
             str(student["id"]),
             student["name"],
             student["lastname"],
@@ -7329,45 +6976,6 @@ Puedes agregar más matrículas usando este formulario."""
             str(student["id_team"])
         ]
         
-        # Mostrar datos
-        for i, data in enumerate(student_data):
-            data_label = ctk.CTkLabel(
-                row_frame,
-                text=data,
-                font=theme.font(theme.SIZE_SMALL),
-                text_color=theme.TEXT,
-                width=PERSON_TABLE_WIDTHS[i]
-            )
-            data_label.place(x=sum(PERSON_TABLE_WIDTHS[:i]) + i*5, y=10)
-        
-        # Botones de acción
-        actions_frame = ctk.CTkFrame(row_frame, fg_color="transparent")
-        actions_frame.place(x=sum(PERSON_TABLE_WIDTHS) + len(PERSON_TABLE_WIDTHS)*5, y=5)
-        
-        edit_btn = ctk.CTkButton(
-            actions_frame,
-            text="Editar",
-            width=58,
-            height=26,
-            font=theme.font(theme.SIZE_CAPTION),
-            command=lambda s=student: self.edit_student(s),
-            fg_color=theme.WARNING,
-            hover_color=theme.WARNING_DARK
-        )
-        edit_btn.pack(side="left", padx=(0, 4))
-        
-        delete_btn = ctk.CTkButton(
-            actions_frame,
-            text="Eliminar",
-            width=62,
-            height=26,
-            font=theme.font(theme.SIZE_CAPTION),
-            command=lambda s=student: self.delete_student(s),
-            fg_color=theme.DANGER,
-            hover_color=theme.DANGER_DARK
-        )
-        delete_btn.pack(side="left")
-        
     def edit_student(self, student):
         """Editar estudiante"""
         self.show_edit_student_dialog(student)
@@ -7377,24 +6985,12 @@ Puedes agregar más matrículas usando este formulario."""
         result = messagebox.askyesno("Confirmar", f"¿Eliminar estudiante {student['name']}?")
         if result:
             try:
-                from control.bd.db_connection import Connection
-                from control.student_repository import StudentRepository
+                success = self.student_repo.delete_row({"id": student['id']})
                 
-                conn = Connection.connect()
-                if conn:
-                    student_repo = StudentRepository(conn)
-                    success = student_repo.delete_row({"id": student['id']})
-                    
-                    if success:
-                        conn.commit()
-                        messagebox.showinfo("Éxito", f"Estudiante '{student['name']}' eliminado correctamente")
-                        self.load_students_from_database()  # Recargar datos
-                    else:
-                        messagebox.showerror("Error", "No se pudo eliminar el estudiante")
-                    
-                    conn.close()
+                if success:
+                    messagebox.showinfo("Éxito", f"Estudiante '{student['name']}' eliminado correctamente")
                 else:
-                    messagebox.showerror("Error", "No se pudo conectar a la base de datos")
+                    messagebox.showerror("Error", "No se pudo eliminar el estudiante")
             except Exception as e:
                 print(f"Error al eliminar estudiante: {str(e)}")
                 messagebox.showerror("Error", f"Error al eliminar estudiante: {str(e)}")
@@ -7552,15 +7148,8 @@ Puedes agregar más matrículas usando este formulario."""
         # Cargar equipos disponibles
         team_options = []
         try:
-            from control.bd.db_connection import Connection
-            from control.team_repository import TeamRepository
-            
-            conn = Connection.connect()
-            if conn:
-                team_repo = TeamRepository(conn)
-                teams = team_repo.get_all_rows()
-                team_options = [f"{team['id']} - {team['name']}" for team in teams]
-                conn.close()
+            teams = self.team_repo.get_all_rows()
+            team_options = [f"{team['id']} - {team['name']}" for team in teams]
         except Exception as e:
             print(f"Error al cargar equipos: {str(e)}")
             team_options = ["No hay equipos disponibles"]
@@ -7627,54 +7216,41 @@ Puedes agregar más matrículas usando este formulario."""
                 return
             
             try:
-                from control.bd.db_connection import Connection
-                from control.student_repository import StudentRepository
-                
-                conn = Connection.connect()
-                if conn:
-                    student_repo = StudentRepository(conn)
-                    
-                    if student:  # Editar
-                        try:
-                            student_repo.update_row(
-                                new_data={
-                                    "name": name,
-                                    "lastname": lastname,
-                                    "phone": phone,
-                                    "date_baptism": date_baptism if date_baptism else None,
-                                    "date_of_birth": date_of_birth if date_of_birth else None,
-                                    "id_team": id_team
-                                },
-                                conditions={"id": student['id']}
-                            )
-                            conn.commit()
-                            messagebox.showinfo("Éxito", f"Estudiante '{name}' actualizado correctamente")
-                        except Exception as update_error:
-                            print(f"Error al actualizar estudiante: {str(update_error)}")
-                            messagebox.showerror("Error", f"No se pudo actualizar el estudiante: {str(update_error)}")
-                            return
-                    else:  # Agregar
-                        try:
-                            student_repo.insert_row({
+                if student:  # Editar
+                    try:
+                        self.student_repo.update_row(
+                            new_data={
                                 "name": name,
                                 "lastname": lastname,
                                 "phone": phone,
                                 "date_baptism": date_baptism if date_baptism else None,
                                 "date_of_birth": date_of_birth if date_of_birth else None,
                                 "id_team": id_team
-                            })
-                            conn.commit()
-                            messagebox.showinfo("Éxito", f"Estudiante '{name}' agregado correctamente")
-                        except Exception as insert_error:
-                            print(f"Error al insertar estudiante: {str(insert_error)}")
-                            messagebox.showerror("Error", f"No se pudo agregar el estudiante: {str(insert_error)}")
-                            return
-                    
-                    conn.close()
-                    dialog.destroy()
-                    self.load_students_from_database()  # Recargar datos
-                else:
-                    messagebox.showerror("Error", "No se pudo conectar a la base de datos")
+                            },
+                            conditions={"id": student['id']}
+                        )
+                        messagebox.showinfo("Éxito", f"Estudiante '{name}' actualizado correctamente")
+                    except Exception as update_error:
+                        print(f"Error al actualizar estudiante: {str(update_error)}")
+                        messagebox.showerror("Error", f"No se pudo actualizar el estudiante: {str(update_error)}")
+                        return
+                else:  # Agregar
+                    try:
+                        self.student_repo.insert_row({
+                            "name": name,
+                            "lastname": lastname,
+                            "phone": phone,
+                            "date_baptism": date_baptism if date_baptism else None,
+                            "date_of_birth": date_of_birth if date_of_birth else None,
+                            "id_team": id_team
+                        })
+                        messagebox.showinfo("Éxito", f"Estudiante '{name}' agregado correctamente")
+                    except Exception as insert_error:
+                        print(f"Error al insertar estudiante: {str(insert_error)}")
+                        messagebox.showerror("Error", f"No se pudo agregar el estudiante: {str(insert_error)}")
+                        return
+                
+                dialog.destroy()
             except Exception as e:
                 print(f"Error al guardar estudiante: {str(e)}")
                 messagebox.showerror("Error", f"Error al guardar estudiante: {str(e)}")
@@ -7709,70 +7285,30 @@ Puedes agregar más matrículas usando este formulario."""
         )
         cancel_btn.pack(side="right")
         
-    def filter_students(self):
-        """Filtrar estudiantes usando BaseRepository search"""
-        try:
-            from control.bd.db_connection import Connection
-            from control.student_repository import StudentRepository
-            
-            conn = Connection.connect()
-            if conn:
-                student_repo = StudentRepository(conn)
-                
-                # Obtener filtros
-                name_filter = self.student_name_filter.get().strip()
-                phone_filter = self.student_phone_filter.get().strip()
-                team_filter = self.student_team_filter.get()
-                
-                # Construir diccionario de búsqueda para BaseRepository
-                search_criteria = {}
-                
-                if name_filter:
-                    # Buscar en nombre y apellido
-                    search_criteria["name"] = name_filter
-                    search_criteria["lastname"] = name_filter
-                
-                if phone_filter:
-                    search_criteria["phone"] = phone_filter
-                
-                # Usar la funcionalidad de búsqueda del BaseRepository
-                if search_criteria:
-                    students = student_repo.get_all_rows(search_criteria)
-                else:
-                    students = student_repo.get_all_rows()
-                
-                # Filtro adicional por equipo si está seleccionado
-                if team_filter and team_filter != "Todos":
-                    try:
-                        team_id = int(team_filter.split(" - ")[0])
-                        students = [s for s in students if s["id_team"] == team_id]
-                    except (ValueError, IndexError):
-                        pass  # Si no se puede parsear el equipo, mostrar todos
-                
-                # Convertir a formato para la tabla
-                self.test_students = []
-                for student in students:
-                    self.test_students.append({
-                        "id": student["id"],
-                        "name": student["name"],
-                        "lastname": student["lastname"],
-                        "phone": student["phone"],
-                        "date_baptism": student["date_baptism"],
-                        "date_of_birth": student["date_of_birth"],
-                        "id_team": student["id_team"]
-                    })
-                
-                conn.close()
-                
-                # Actualizar tabla
-                self.update_students_table()
-                
-                print(f"Filtrados {len(self.test_students)} estudiantes")
-            else:
-                messagebox.showerror("Error", "No se pudo conectar a la base de datos")
-        except Exception as e:
-            print(f"Error al filtrar estudiantes: {str(e)}")
-            messagebox.showerror("Error", f"Error al filtrar estudiantes: {str(e)}")
+    def filter_students(self, reset_page=True):
+        """Filtrar estudiantes: nombre por el índice de búsqueda, el resto en memoria (ver IncrementalFilter)"""
+        # Obtener filtros
+        name_filter = self.student_name_filter.get().strip()
+        phone_filter = self.student_phone_filter.get().strip()
+        team_filter = self.student_team_filter.get()
+        
+        # Nombre o apellido y teléfono (búsqueda parcial) y equipo exacto
+        exact = {}
+        if team_filter and team_filter != "Todos":
+            try:
+                exact["id_team"] = int(team_filter.split(" - ")[0])
+            except (ValueError, IndexError):
+                pass  # Si no se puede parsear el equipo, mostrar todos
+        
+        if name_filter or phone_filter or exact:
+            self.students_match_ids = self.students_filter_engine.match(
+                {"name": name_filter, "phone": phone_filter}, exact
+            )
+        else:
+            self.students_match_ids = None
+        if reset_page:
+            self.students_current_page = 1
+        self.update_students_table()
         
     def clear_student_filters(self):
         """Limpiar filtros de estudiantes"""
@@ -7781,6 +7317,7 @@ Puedes agregar más matrículas usando este formulario."""
         self.student_team_filter.set("Todos")
         
         # Recargar todos los datos
+        self.students_filter_debounce.cancel()
         self.load_students_from_database()
         
     def students_prev_page(self):
@@ -7829,6 +7366,14 @@ Puedes agregar más matrículas usando este formulario."""
             height=450
         )
         self.teachers_rows_frame.pack(fill="both", expand=True)
+        self.teachers_row_pool = RowPool(
+            self.teachers_rows_frame,
+            PERSON_TABLE_WIDTHS,
+            [
+                ("Editar", 58, theme.WARNING, theme.WARNING_DARK, self.edit_teacher),
+                ("Eliminar", 62, theme.DANGER, theme.DANGER_DARK, self.delete_teacher),
+            ]
+        )
         
         # Frame para paginación
         pagination_frame = ctk.CTkFrame(self.teachers_table_container, fg_color="transparent")
@@ -7876,77 +7421,39 @@ Puedes agregar más matrículas usando este formulario."""
         
     def load_teachers_from_database(self):
         """Cargar docentes desde la base de datos"""
+        self.teachers_match_ids = None
+        self.update_teachers_table()
+        
+    def update_teachers_table(self):
+        """Actualizar tabla de docentes con la página actual consultada en la base de datos"""
         try:
-            from control.bd.db_connection import Connection
-            from control.teacher_repository import TeacherRepository
-            
-            conn = Connection.connect()
-            if conn:
-                teacher_repo = TeacherRepository(conn)
-                teacher_repo.create_table()  # Asegurar que la tabla existe
-                
-                # Obtener todos los docentes
-                teachers = teacher_repo.get_all_rows()
-                
-                # Convertir a formato para la tabla
-                self.test_teachers = []
-                for teacher in teachers:
-                    self.test_teachers.append({
-                        "id": teacher["id"],
-                        "name": teacher["name"],
-                        "lastname": teacher["lastname"],
-                        "phone": teacher["phone"],
-                        "date_baptism": teacher["date_baptism"],
-                        "date_of_birth": teacher["date_of_birth"],
-                        "id_team": teacher["id_team"]
-                    })
-                
-                conn.close()
-                
-                # Actualizar tabla
-                self.update_teachers_table()
-                
-                print(f"Cargados {len(self.test_teachers)} docentes desde la base de datos")
-            else:
-                messagebox.showerror("Error", "No se pudo conectar a la base de datos")
+            # Solo se leen las filas de la página actual y el total (COUNT)
+            page = self.get_filtered_page(
+                self.teacher_repo,
+                self.teachers_match_ids,
+                self.teachers_current_page,
+                self.teachers_items_per_page
+            )
         except Exception as e:
             print(f"Error al cargar docentes: {str(e)}")
             messagebox.showerror("Error", f"Error al cargar docentes: {str(e)}")
+            return
         
-    def update_teachers_table(self):
-        """Actualizar tabla de docentes"""
-        # Limpiar filas existentes
-        for widget in self.teachers_rows_frame.winfo_children():
-            widget.destroy()
-        
-        # Calcular paginación
-        start_idx = (self.teachers_current_page - 1) * self.teachers_items_per_page
-        end_idx = start_idx + self.teachers_items_per_page
-        
-        # Obtener docentes para la página actual
-        teachers_to_show = self.test_teachers[start_idx:end_idx]
-        
-        # Agregar docentes a la tabla
-        for teacher in teachers_to_show:
-            self.create_teacher_row(teacher)
+        # Reutilizar las filas ya creadas; solo cambian textos y comandos
+        self.teachers_row_pool.render(page["rows"], self.teacher_row_values)
         
         # Actualizar información de paginación
-        self.teachers_total_items = len(self.test_teachers)
-        total_pages = (self.teachers_total_items + self.teachers_items_per_page - 1) // self.teachers_items_per_page
-        self.teachers_pagination_info.configure(text=f"Mostrando {len(teachers_to_show)} de {self.teachers_total_items} docentes")
+        self.teachers_current_page = page["page"]
+        self.teachers_total_items = page["total"]
+        self.teachers_pagination_info.configure(text=f"Mostrando {len(page['rows'])} de {self.teachers_total_items} docentes")
         
         # Actualizar botones de paginación
-        self.teachers_prev_page_btn.configure(state="normal" if self.teachers_current_page > 1 else "disabled")
-        self.teachers_next_page_btn.configure(state="normal" if self.teachers_current_page < total_pages else "disabled")
-        
-    def create_teacher_row(self, teacher):
-        """Crear fila de docente en la tabla"""
-        row_frame = ctk.CTkFrame(self.teachers_rows_frame, fg_color=theme.SURFACE, height=40)
-        row_frame.pack(fill="x", pady=2)
-        row_frame.pack_propagate(False)
+        self.teachers_prev_page_btn.configure(state="normal" if page["page"] > 1 else "disabled")
+        self.teachers_next_page_btn.configure(state="normal" if page["page"] < page["pages"] else "disabled")
         
-        # Datos del docente
-        teacher_data = [
+    def teacher_row_values(self, teacher):
+        """Textos de las columnas de una fila de docente"""
+        return [
             str(teacher["id"]),
             teacher["name"],
             teacher["lastname"],
@@ -7956,46 +7463,6 @@ Puedes agregar más matrículas usando este formulario."""
             str(teacher["id_team"])
         ]
         
-        # Mostrar datos
-        header_widths = list(PERSON_TABLE_WIDTHS)
-        for i, data in enumerate(teacher_data):
-            data_label = ctk.CTkLabel(
-                row_frame,
-                text=data,
-                font=theme.font(theme.SIZE_SMALL),
-                text_color=theme.TEXT,
-                width=header_widths[i]
-            )
-            data_label.place(x=sum(header_widths[:i]) + i*5, y=10)
-        
-        # Botones de acción
-        actions_frame = ctk.CTkFrame(row_frame, fg_color="transparent")
-        actions_frame.place(x=sum(PERSON_TABLE_WIDTHS) + len(PERSON_TABLE_WIDTHS)*5, y=5)
-        
-        edit_btn = ctk.CTkButton(
-            actions_frame,
-            text="Editar",
-            width=58,
-            height=26,
-            font=theme.font(theme.SIZE_CAPTION),
-            command=lambda t=teacher: self.edit_teacher(t),
-            fg_color=theme.WARNING,
-            hover_color=theme.WARNING_DARK
-        )
-        edit_btn.pack(side="left", padx=(0, 4))
-        
-        delete_btn = ctk.CTkButton(
-            actions_frame,
-            text="Eliminar",
-            width=62,
-            height=26,
-            font=theme.font(theme.SIZE_CAPTION),
-            command=lambda t=teacher: self.delete_teacher(t),
-            fg_color=theme.DANGER,
-            hover_color=theme.DANGER_DARK
-        )
-        delete_btn.pack(side="left")
-        
     def edit_teacher(self, teacher):
         """Editar docente"""
         self.show_edit_teacher_dialog(teacher)
@@ -8005,24 +7472,12 @@ Puedes agregar más matrículas usando este formulario."""
         result = messagebox.askyesno("Confirmar", f"¿Eliminar docente {teacher['name']}?")
         if result:
             try:
-                from control.bd.db_connection import Connection
-                from control.teacher_repository import TeacherRepository
+                success = self.teacher_repo.delete_row({"id": teacher['id']})
                 
-                conn = Connection.connect()
-                if conn:
-                    teacher_repo = TeacherRepository(conn)
-                    success = teacher_repo.delete_row({"id": teacher['id']})
-                    
-                    if success:
-                        conn.commit()
-                        messagebox.showinfo("Éxito", f"Docente '{teacher['name']}' eliminado correctamente")
-                        self.load_teachers_from_database()  # Recargar datos
-                    else:
-                        messagebox.showerror("Error", "No se pudo eliminar el docente")
-                    
-                    conn.close()
+                if success:
+                    messagebox.showinfo("Éxito", f"Docente '{teacher['name']}' eliminado correctamente")
                 else:
-                    messagebox.showerror("Error", "No se pudo conectar a la base de datos")
+                    messagebox.showerror("Error", "No se pudo eliminar el docente")
             except Exception as e:
                 print(f"Error al eliminar docente: {str(e)}")
                 messagebox.showerror("Error", f"Error al eliminar docente: {str(e)}")
@@ -8180,15 +7635,8 @@ Puedes agregar más matrículas usando este formulario."""
         # Cargar equipos disponibles
         team_options = []
         try:
-            from control.bd.db_connection import Connection
-            from control.team_repository import TeamRepository
-            
-            conn = Connection.connect()
-            if conn:
-                team_repo = TeamRepository(conn)
-                teams = team_repo.get_all_rows()
-                team_options = [f"{team['id']} - {team['name']}" for team in teams]
-                conn.close()
+            teams = self.team_repo.get_all_rows()
+            team_options = [f"{team['id']} - {team['name']}" for team in teams]
         except Exception as e:
             print(f"Error al cargar equipos: {str(e)}")
             team_options = ["No hay equipos disponibles"]
@@ -8255,54 +7703,41 @@ Puedes agregar más matrículas usando este formulario."""
                 return
             
             try:
-                from control.bd.db_connection import Connection
-                from control.teacher_repository import TeacherRepository
-                
-                conn = Connection.connect()
-                if conn:
-                    teacher_repo = TeacherRepository(conn)
-                    
-                    if teacher:  # Editar
-                        try:
-                            teacher_repo.update_row(
-                                new_data={
-                                    "name": name,
-                                    "lastname": lastname,
-                                    "phone": phone,
-                                    "date_baptism": date_baptism if date_baptism else None,
-                                    "date_of_birth": date_of_birth if date_of_birth else None,
-                                    "id_team": id_team
-                                },
-                                conditions={"id": teacher['id']}
-                            )
-                            conn.commit()
-                            messagebox.showinfo("Éxito", f"Docente '{name}' actualizado correctamente")
-                        except Exception as update_error:
-                            print(f"Error al actualizar docente: {str(update_error)}")
-                            messagebox.showerror("Error", f"No se pudo actualizar el docente: {str(update_error)}")
-                            return
-                    else:  # Agregar
-                        try:
-                            teacher_repo.insert_row({
+                if teacher:  # Editar
+                    try:
+                        self.teacher_repo.update_row(
+                            new_data={
                                 "name": name,
                                 "lastname": lastname,
                                 "phone": phone,
                                 "date_baptism": date_baptism if date_baptism else None,
                                 "date_of_birth": date_of_birth if date_of_birth else None,
                                 "id_team": id_team
-                            })
-                            conn.commit()
-                            messagebox.showinfo("Éxito", f"Docente '{name}' agregado correctamente")
-                        except Exception as insert_error:
-                            print(f"Error al insertar docente: {str(insert_error)}")
-                            messagebox.showerror("Error", f"No se pudo agregar el docente: {str(insert_error)}")
-                            return
-                    
-                    conn.close()
-                    dialog.destroy()
-                    self.load_teachers_from_database()  # Recargar datos
-                else:
-                    messagebox.showerror("Error", "No se pudo conectar a la base de datos")
+                            },
+                            conditions={"id": teacher['id']}
+                        )
+                        messagebox.showinfo("Éxito", f"Docente '{name}' actualizado correctamente")
+                    except Exception as update_error:
+                        print(f"Error al actualizar docente: {str(update_error)}")
+                        messagebox.showerror("Error", f"No se pudo actualizar el docente: {str(update_error)}")
+                        return
+                else:  # Agregar
+                    try:
+                        self.teacher_repo.insert_row({
+                            "name": name,
+                            "lastname": lastname,
+                            "phone": phone,
+                            "date_baptism": date_baptism if date_baptism else None,
+                            "date_of_birth": date_of_birth if date_of_birth else None,
+                            "id_team": id_team
+                        })
+                        messagebox.showinfo("Éxito", f"Docente '{name}' agregado correctamente")
+                    except Exception as insert_error:
+                        print(f"Error al insertar docente: {str(insert_error)}")
+                        messagebox.showerror("Error", f"No se pudo agregar el docente: {str(insert_error)}")
+                        return
+                
+                dialog.destroy()
             except Exception as e:
                 print(f"Error al guardar docente: {str(e)}")
                 messagebox.showerror("Error", f"Error al guardar docente: {str(e)}")
@@ -8337,70 +7772,30 @@ Puedes agregar más matrículas usando este formulario."""
         )
         cancel_btn.pack(side="right")
         
-    def filter_teachers(self):
-        """Filtrar docentes usando BaseRepository search"""
-        try:
-            from control.bd.db_connection import Connection
-            from control.teacher_repository import TeacherRepository
-            
-            conn = Connection.connect()
-            if conn:
-                teacher_repo = TeacherRepository(conn)
-                
-                # Obtener filtros
-                name_filter = self.teacher_name_filter.get().strip()
-                phone_filter = self.teacher_phone_filter.get().strip()
-                team_filter = self.teacher_team_filter.get()
-                
-                # Construir diccionario de búsqueda para BaseRepository
-                search_criteria = {}
-                
-                if name_filter:
-                    # Buscar en nombre y apellido
-                    search_criteria["name"] = name_filter
-                    search_criteria["lastname"] = name_filter
-                
-                if phone_filter:
-                    search_criteria["phone"] = phone_filter
-                
-                # Usar la funcionalidad de búsqueda del BaseRepository
-                if search_criteria:
-                    teachers = teacher_repo.get_all_rows(search_criteria)
-                else:
-                    teachers = teacher_repo.get_all_rows()
-                
-                # Filtro adicional por equipo si está seleccionado
-                if team_filter and team_filter != "Todos":
-                    try:
-                        team_id = int(team_filter.split(" - ")[0])
-                        teachers = [t for t in teachers if t["id_team"] == team_id]
-                    except (ValueError, IndexError):
-                        pass  # Si no se puede parsear el equipo, mostrar todos
-                
-                # Convertir a formato para la tabla
-                self.test_teachers = []
-                for teacher in teachers:
-                    self.test_teachers.append({
-                        "id": teacher["id"],
-                        "name": teacher["name"],
-                        "lastname": teacher["lastname"],
-                        "phone": teacher["phone"],
-                        "date_baptism": teacher["date_baptism"],
-                        "date_of_birth": teacher["date_of_birth"],
-                        "id_team": teacher["id_team"]
-                    })
-                
-                conn.close()
-                
-                # Actualizar tabla
-                self.update_teachers_table()
-                
-                print(f"Filtrados {len(self.test_teachers)} docentes")
-            else:
-                messagebox.showerror("Error", "No se pudo conectar a la base de datos")
-        except Exception as e:
-            print(f"Error al filtrar docentes: {str(e)}")
-            messagebox.showerror("Error", f"Error al filtrar docentes: {str(e)}")
+    def filter_teachers(self, reset_page=True):
+        """Filtrar docentes: nombre por el índice de búsqueda, el resto en memoria (ver IncrementalFilter)"""
+        # Obtener filtros
+        name_filter = self.teacher_name_filter.get().strip()
+        phone_filter = self.teacher_phone_filter.get().strip()
+        team_filter = self.teacher_team_filter.get()
+        
+        # Nombre o apellido y teléfono (búsqueda parcial) y equipo exacto
+        exact = {}
+        if team_filter and team_filter != "Todos":
+            try:
+                exact["id_team"] = int(team_filter.split(" - ")[0])
+            except (ValueError, IndexError):
+                pass  # Si no se puede parsear el equipo, mostrar todos
+        
+        if name_filter or phone_filter or exact:
+            self.teachers_match_ids = self.teachers_filter_engine.match(
+                {"name": name_filter, "phone": phone_filter}, exact
+            )
+        else:
+            self.teachers_match_ids = None
+        if reset_page:
+            self.teachers_current_page = 1
+        self.update_teachers_table()
         
     def clear_teacher_filters(self):
         """Limpiar filtros de docentes"""
@@ -8409,37 +7804,24 @@ Puedes agregar más matrículas usando este formulario."""
         self.teacher_team_filter.set("Todos")
         
         # Recargar todos los datos
+        self.teachers_filter_debounce.cancel()
         self.load_teachers_from_database()
         
     def load_teams_for_student_filter(self):
         """Cargar equipos en el filtro de estudiantes"""
         try:
-            from control.bd.db_connection import Connection
-            from control.team_repository import TeamRepository
-            
-            conn = Connection.connect()
-            if conn:
-                team_repo = TeamRepository(conn)
-                teams = team_repo.get_all_rows()
-                team_options = ["Todos"] + [f"{team['id']} - {team['name']}" for team in teams]
-                self.student_team_filter.configure(values=team_options)
-                conn.close()
+            teams = self.team_repo.get_all_rows()
+            team_options = ["Todos"] + [f"{team['id']} - {team['name']}" for team in teams]
+            self.student_team_filter.configure(values=team_options)
         except Exception as e:
             print(f"Error al cargar equipos para filtro de estudiantes: {str(e)}")
     
     def load_teams_for_teacher_filter(self):
         """Cargar equipos en el filtro de docentes"""
         try:
-            from control.bd.db_connection import Connection
-            from control.team_repository import TeamRepository
-            
-            conn = Connection.connect()
-            if conn:
-                team_repo = TeamRepository(conn)
-                teams = team_repo.get_all_rows()
-                team_options = ["Todos"] + [f"{team['id']} - {team['name']}" for team in teams]
-                self.teacher_team_filter.configure(values=team_options)
-                conn.close()
+            teams = self.team_repo.get_all_rows()
+            team_options = ["Todos"] + [f"{team['id']} - {team['name']}" for team in teams]
+            self.teacher_team_filter.configure(values=team_options)
         except Exception as e:
             print(f"Error al cargar equipos para filtro de docentes: {str(e)}")
         
@@ -2,8 +2,9 @@ import customtkinter as ctk
 import tkinter as tk
 from tkinter import messagebox
 
-from control.session.user_repository import UserRepository
+from control.session.auth_service import authenticate_async, LoginLockedError
 from view import theme
+from view.components.background import after_future
 
 class ForgotPasswordDialog:
     def __init__(self, parent):
@@ -93,6 +94,14 @@ class ForgotPasswordDialog:
         )
         self.access_button.pack(expand=True)
         
+        # Indicador de verificación (visible solo mientras se autentica)
+        self.access_progress = ctk.CTkProgressBar(
+            self.main_frame,
+            width=320,
+            mode="indeterminate",
+            progress_color=theme.PRIMARY
+        )
+        
         # Centrar la ventana en la pantalla
         self.dialog.update_idletasks()
         x = (self.dialog.winfo_screenwidth() // 2) - (450 // 2)
@@ -108,11 +117,17 @@ class ForgotPasswordDialog:
             messagebox.showerror("Error", "Por favor complete todos los campos.")
             return
 
-        try:
-            user_repo = UserRepository()
+        # Autenticacion real contra la base de datos (Argon2), en un hilo de trabajo
+        self.set_busy(True)
+        future = authenticate_async(username, password)
+        after_future(self.dialog, future, self.on_verify_result)
 
-            # Autenticacion real contra la base de datos (Argon2)
-            if not user_repo.login(username, password):
+    def on_verify_result(self, future):
+        """Mostrar el resultado de la verificación (hilo de Tk)"""
+        self.set_busy(False)
+        try:
+            user_data = future.result()
+            if not user_data:
                 messagebox.showerror(
                     "Error",
                     "Credenciales incorrectas.\n"
@@ -120,8 +135,7 @@ class ForgotPasswordDialog:
                 )
                 return
 
-            user_data = user_repo.get_user_by_username(username)
-            if not user_data or user_data.get("role") != "Administrador":
+            if user_data.get("role") != "Administrador":
                 messagebox.showerror(
                     "Acceso denegado",
                     "Solo un usuario administrador puede recuperar el acceso.\n"
@@ -133,5 +147,23 @@ class ForgotPasswordDialog:
             self.user_data = user_data
             self.result = True
             self.dialog.destroy()
+        except LoginLockedError as e:
+            messagebox.showwarning(
+                "Demasiados intentos",
+                f"Demasiados intentos fallidos. Intente nuevamente en {e.seconds} segundos."
+            )
         except Exception as e:
             messagebox.showerror("Error", f"Error de conexión: {str(e)}")
+
+    def set_busy(self, busy):
+        """Bloquear el formulario y mostrar el indicador mientras se verifica"""
+        state = "disabled" if busy else "normal"
+        self.admin_user_entry.configure(state=state)
+        self.admin_password_entry.configure(state=state)
+        self.access_button.configure(state=state, text="Verificando..." if busy else "Acceder")
+        if busy:
+            self.access_progress.pack(after=self.buttons_frame, pady=(0, 10))
+            self.access_progress.start()
+        else:
+            self.access_progress.stop()
+            self.access_progress.pack_forget()
@@ -7,9 +7,10 @@ import os
 # Agregar el directorio padre al path para importar módulos
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
-from control.session.user_repository import UserRepository
+from control.session.auth_service import authenticate_async, LoginLockedError
 from control.bd.db_connection import Connection
 from view import theme
+from view.components.background import after_future
 
 class LoginPage:
     def __init__(self, parent):
@@ -154,6 +155,14 @@ class LoginPage:
         )
         self.login_button.pack(pady=(0, theme.SPACE_MD))
         
+        # Indicador de verificación (visible solo mientras se autentica)
+        self.login_progress = ctk.CTkProgressBar(
+            self.login_frame,
+            width=280,
+            mode="indeterminate",
+            progress_color=theme.PRIMARY
+        )
+        
         # Enlace de olvidar contraseña
         self.forgot_password_label = ctk.CTkLabel(
             self.login_frame,
@@ -174,26 +183,49 @@ class LoginPage:
             messagebox.showerror("Error", "Por favor complete todos los campos")
             return
         
-        # Autenticar usuario con la base de datos usando Argon2
+        # Autenticar con Argon2 en un hilo de trabajo; la ventana sigue respondiendo
+        self.set_busy(True)
+        future = authenticate_async(username, password)
+        after_future(self.parent, future, self.on_login_result)
+    
+    def on_login_result(self, future):
+        """Mostrar el resultado de la autenticación (hilo de Tk)"""
+        self.set_busy(False)
         try:
-            user_repo = UserRepository()
-            if user_repo.login(username, password):
-                # Obtener información completa del usuario
-                user_data = user_repo.get_user_by_username(username)
-                if user_data:
-                    messagebox.showinfo("Éxito", f"Bienvenido {username}!")
-                    
-                    # Cerrar la ventana de login
-                    self.parent.destroy()
-                    
-                    # Crear nueva ventana para el dashboard con información del usuario
-                    self.create_dashboard_window(user_data)
-                else:
-                    messagebox.showerror("Error", "No se pudo obtener información del usuario")
-            else:
-                messagebox.showerror("Error", "Credenciales incorrectas. Intente nuevamente.")
+            user_data = future.result()
+        except LoginLockedError as e:
+            messagebox.showwarning(
+                "Demasiados intentos",
+                f"Demasiados intentos fallidos. Intente nuevamente en {e.seconds} segundos."
+            )
+            return
         except Exception as e:
             messagebox.showerror("Error", f"Error de conexión: {str(e)}")
+            return
+        
+        if user_data:
+            messagebox.showinfo("Éxito", f"Bienvenido {user_data.get('user')}!")
+            
+            # Cerrar la ventana de login
+            self.parent.destroy()
+            
+            # Crear nueva ventana para el dashboard con información del usuario
+            self.create_dashboard_window(user_data)
+        else:
+            messagebox.showerror("Error", "Credenciales incorrectas. Intente nuevamente.")
+    
+    def set_busy(self, busy):
+        """Bloquear el formulario y mostrar el indicador mientras se verifica"""
+        state = "disabled" if busy else "normal"
+        self.username_entry.configure(state=state)
+        self.password_entry.configure(state=state)
+        self.login_button.configure(state=state, text="Verificando..." if busy else "Iniciar Sesión")
+        if busy:
+            self.login_progress.pack(after=self.login_button, pady=(0, theme.SPACE_MD))
+            self.login_progress.start()
+        else:
+            self.login_progress.stop()
+            self.login_progress.pack_forget()
         
     def show_forgot_password_dialog(self, event):
         """Mostrar diálogo de olvidar contraseña"""